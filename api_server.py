@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
@@ -6,8 +7,16 @@ from datetime import datetime
 from dotenv import load_dotenv
 
 from src.agents.betting_agent import BettingAgent
+from src.agents.async_betting_agent import AsyncBettingAgent
+from src.cache.async_redis_client import AsyncRedisCache
+from src.cache.local_cache import LocalTTLCache
+from src.cache.redis_client import RedisCache
+from src.cache.sqlite_fallback import SQLiteFallbackCache
 from src.services.llm_service import LLMService
 from src.models.bet_history import BetHistory
+from src.utils.http_client import HttpClient
+from src.utils.async_http_client import AsyncHttpClient
+from src.utils.quota_scheduler import QuotaScheduler
 
 load_dotenv()
 
@@ -77,10 +86,10 @@ def _needs_context(message: str) -> bool:
     return any(k in m for k in opportunity_keywords)
 
 
-def _build_context(bankroll: float) -> Dict:
+async def _build_context(bankroll: float) -> Dict:
     """Constrói contexto inteligente para o LLM"""
-    agent = BettingAgent(bankroll)
-    opportunities = agent.analyze_today_opportunities()
+    agent = AsyncBettingAgent(bankroll)
+    opportunities = await agent.analyze_today_opportunities()
     phase_info = agent.bankroll_manager.get_phase_info()
     
     # Organiza oportunidades por jogo
@@ -117,11 +126,11 @@ def read_root():
 
 
 @app.post("/opportunities")
-def get_opportunities(request: OpportunitiesRequest):
-    """Retorna oportunidades do dia"""
+async def get_opportunities(request: OpportunitiesRequest):
+    """Retorna oportunidades do dia (análise async, não ocupa thread do servidor)"""
     try:
-        agent = BettingAgent(request.bankroll)
-        opportunities = agent.analyze_today_opportunities()
+        agent = AsyncBettingAgent(request.bankroll)
+        opportunities = await agent.analyze_today_opportunities()
         multiples = agent.detect_multiples(opportunities)
 
         return {
@@ -178,8 +187,29 @@ def get_phase():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/metrics")
+def get_metrics():
+    """Retorna métricas de transporte, cota por provedor, cache local, conexões Redis e uso por namespace"""
+    return {
+        "http": HttpClient.get_stats(),
+        "quota": QuotaScheduler.get_state(),
+        "local_cache": LocalTTLCache.shared().get_stats(),
+        "redis": RedisCache.connection_stats(),
+        "redis_async": AsyncRedisCache.connection_stats(),
+        "cache_namespaces": RedisCache.namespace_stats(),
+        "cache_fallback": SQLiteFallbackCache.shared().get_stats() if SQLiteFallbackCache.shared() else None,
+    }
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    HttpClient.close_all()
+    await AsyncHttpClient.close_all()
+    await AsyncRedisCache.close_all()
+
+
 @app.post("/chat")
-def chat(request: ChatRequest):
+async def chat(request: ChatRequest):
     """Endpoint de chat inteligente"""
     print(f"\n💬 Chat recebeu: {request.message}")
     
@@ -189,7 +219,7 @@ def chat(request: ChatRequest):
     context = None
     if needs_ctx:
         print(f"   🔍 Detectado pedido de oportunidades - construindo contexto...")
-        context = _build_context(bankroll=100.0)
+        context = await _build_context(bankroll=100.0)
         print(f"   📊 Contexto: {context['total_opportunities']} oportunidades em {context['total_games']} jogos")
         
         # Formata contexto para o LLM
@@ -204,7 +234,9 @@ def chat(request: ChatRequest):
     
     # Chama LLM com contexto estruturado
     try:
-        response = llm_service.chat(
+        # Cliente do LLM é sync: roda em thread para não travar o event loop
+        response = await asyncio.to_thread(
+            llm_service.chat,
             user_message=request.message,
             context=llm_context
         )
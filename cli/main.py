@@ -201,17 +201,53 @@ def view_history():
     console.print(table)
 
 def clear_cache():
-    """Opção 7: Limpar cache"""
+    """Opção 7: Limpar cache (por namespace, por tag ou tudo)"""
     clear_screen()
     console.print("\n[bold cyan]🗑️  LIMPAR CACHE REDIS[/bold cyan]\n")
     
-    if Confirm.ask("⚠️  Confirma limpeza do cache?"):
-        from src.cache.redis_client import RedisCache
-        cache = RedisCache()
-        cache.clear_all()
-        console.print("\n[green]✅ Cache limpo com sucesso![/green]")
-    else:
-        console.print("\n[yellow]❌ Operação cancelada.[/yellow]")
+    from src.cache.redis_client import RedisCache
+    cache = RedisCache()
+    
+    # Contadores de hits/misses são por processo (ver /metrics da API); aqui só os prefixos
+    table = Table(title="Namespaces")
+    table.add_column("Namespace", style="cyan")
+    table.add_column("Prefixos")
+    for namespace, prefixes in cache.NAMESPACES.items():
+        preserved = " [dim](fora do 'tudo')[/dim]" if namespace in cache.PRESERVED_NAMESPACES else ""
+        table.add_row(namespace + preserved, ", ".join(prefixes))
+    console.print(table)
+    
+    scope = Prompt.ask(
+        "Limpar o quê?",
+        choices=["namespace", "tag", "tudo", "cancelar"],
+        default="namespace"
+    )
+    
+    if scope == "namespace":
+        namespace = Prompt.ask("Namespace", choices=list(cache.NAMESPACES), default="odds")
+        if Confirm.ask(f"⚠️  Confirma limpeza do namespace '{namespace}'?"):
+            removed = cache.clear_namespace(namespace)
+            console.print(f"\n[green]✅ {removed} chaves removidas de '{namespace}'[/green]")
+            return
+    elif scope == "tag":
+        tags = cache.list_tags()
+        if tags:
+            console.print("[dim]Tags: " + ", ".join(f"{tag} ({count})" for tag, count in sorted(tags.items())) + "[/dim]")
+        tag = Prompt.ask("Tag (ex.: league:39, team:42, sport:soccer_epl)")
+        if tag and Confirm.ask(f"⚠️  Confirma invalidação da tag '{tag}'?"):
+            removed = cache.invalidate_tag(tag)
+            console.print(f"\n[green]✅ {removed} chaves removidas da tag '{tag}'[/green]")
+            return
+    elif scope == "tudo":
+        preserved = ', '.join(cache.PRESERVED_NAMESPACES)
+        if Confirm.ask(f"⚠️  Confirma limpeza de TODO o cache do agente (exceto {preserved})?"):
+            if cache.clear_all():
+                console.print("\n[green]✅ Cache limpo com sucesso![/green]")
+            else:
+                console.print("\n[red]❌ Erro ao limpar cache[/red]")
+            return
+    
+    console.print("\n[yellow]❌ Operação cancelada.[/yellow]")
 
 def main():
     """Loop principal"""
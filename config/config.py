@@ -45,10 +45,88 @@ class Config:
     FOOTBALL_API_BASE_URL = os.getenv('FOOTBALL_API_BASE_URL')
     ODDS_API_KEY = os.getenv('ODDS_API_KEY')
     ODDS_API_BASE_URL = os.getenv('ODDS_API_BASE_URL')
+    ODDS_API_MAX_CONCURRENCY = int(os.getenv('ODDS_API_MAX_CONCURRENCY', 8))
+    
+    # Odds API em 2 etapas: lote barato por liga + mercados extras por evento
+    ODDS_API_REGIONS = os.getenv('ODDS_API_REGIONS', 'uk,eu')
+    ODDS_API_BULK_MARKETS = os.getenv('ODDS_API_BULK_MARKETS', 'h2h,totals')
+    ODDS_API_EVENT_REGIONS = os.getenv('ODDS_API_EVENT_REGIONS', 'eu')
+    ODDS_API_EVENT_MARKETS = os.getenv('ODDS_API_EVENT_MARKETS', 'btts,alternate_totals,spreads')
+    ODDS_API_MAX_EVENT_FETCHES = int(os.getenv('ODDS_API_MAX_EVENT_FETCHES', 10))
+    PRESCREEN_MIN_EV_RATIO = float(os.getenv('PRESCREEN_MIN_EV_RATIO', 0.5))
     
     # API-Football (api-sports.io)
     API_FOOTBALL_KEY = os.getenv('API_FOOTBALL_KEY')
     API_FOOTBALL_BASE_URL = os.getenv('API_FOOTBALL_BASE_URL')
+    API_FOOTBALL_MAX_CONCURRENCY = int(os.getenv('API_FOOTBALL_MAX_CONCURRENCY', 6))
+    
+    # Transporte HTTP (sessões keep-alive compartilhadas)
+    HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', 10))
+    HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', 5))
+    HTTP_READ_TIMEOUT = float(os.getenv('HTTP_READ_TIMEOUT', 30))
+    HTTP_ASYNC_MAX_CONNECTIONS = int(os.getenv('HTTP_ASYNC_MAX_CONNECTIONS', 50))  # Client async (todos os hosts)
+    
+    # Cota por provedor (scheduler central com token bucket)
+    QUOTA_MAX_WAIT = float(os.getenv('QUOTA_MAX_WAIT', 5))
+    PROVIDER_QUOTAS = {
+        'odds_api': {
+            'quota': float(os.getenv('ODDS_API_MONTHLY_CREDITS', 500)),
+            'period_seconds': 30 * 86400,
+            'burst_fraction': float(os.getenv('ODDS_API_BURST_FRACTION', 0.25)),
+        },
+        'api_football': {
+            'quota': float(os.getenv('API_FOOTBALL_DAILY_QUOTA', 100)),
+            'period_seconds': 86400,
+            'burst_fraction': float(os.getenv('API_FOOTBALL_BURST_FRACTION', 1.0)),
+        },
+        'rapidapi_tennis': {
+            'quota': float(os.getenv('RAPIDAPI_TENNIS_MONTHLY_QUOTA', 60)),
+            'period_seconds': 30 * 86400,
+            'burst_fraction': float(os.getenv('RAPIDAPI_TENNIS_BURST_FRACTION', 0.1)),
+        },
+    }
+    
+    # Single-flight (coalescência de cache misses entre threads/workers)
+    SINGLE_FLIGHT_LOCK_TTL_MS = int(os.getenv('SINGLE_FLIGHT_LOCK_TTL_MS', 45000))
+    SINGLE_FLIGHT_WAIT_TIMEOUT = float(os.getenv('SINGLE_FLIGHT_WAIT_TIMEOUT', 45))
+    
+    # Stale-while-revalidate: após o soft TTL serve o valor antigo e atualiza em segundo plano
+    SWR_STALE_TTL = int(os.getenv('SWR_STALE_TTL', 3600))  # Janela extra entre soft e hard TTL
+    SWR_REFRESH_WORKERS = int(os.getenv('SWR_REFRESH_WORKERS', 4))  # Threads de refresh (cliente sync)
+    
+    # Redis (pool de conexões único por processo)
+    REDIS_MAX_CONNECTIONS = int(os.getenv('REDIS_MAX_CONNECTIONS', 50))
+    REDIS_POOL_TIMEOUT = float(os.getenv('REDIS_POOL_TIMEOUT', 5))  # Espera por conexão livre no pool
+    REDIS_SOCKET_TIMEOUT = float(os.getenv('REDIS_SOCKET_TIMEOUT', 2))
+    REDIS_RETRY_INTERVAL = float(os.getenv('REDIS_RETRY_INTERVAL', 30))  # Re-ping quando o Redis está fora
+    
+    # Cache local do processo (na frente do Redis)
+    LOCAL_CACHE_MAX_ENTRIES = int(os.getenv('LOCAL_CACHE_MAX_ENTRIES', 5000))
+    LOCAL_CACHE_TTL = float(os.getenv('LOCAL_CACHE_TTL', 300))  # Teto do TTL local (segundos)
+    LOCAL_CACHE_INVALIDATION = os.getenv('LOCAL_CACHE_INVALIDATION', 'false').lower() == 'true'  # Pub/sub entre workers
+    
+    # Fallback persistente (SQLite WAL) quando o Redis está fora; reenviado ao Redis quando ele volta
+    CACHE_FALLBACK_ENABLED = os.getenv('CACHE_FALLBACK_ENABLED', 'true').lower() == 'true'
+    CACHE_FALLBACK_PATH = os.getenv('CACHE_FALLBACK_PATH', 'cache/fallback.db')
+    
+    # Serialização dos valores em cache (Redis e cache diário)
+    CACHE_CODEC = os.getenv('CACHE_CODEC', 'orjson').lower()  # orjson | msgpack | json
+    CACHE_COMPRESS_MIN_BYTES = int(os.getenv('CACHE_COMPRESS_MIN_BYTES', 1024))  # zlib a partir deste tamanho
+    CACHE_COMPRESSION_LEVEL = int(os.getenv('CACHE_COMPRESSION_LEVEL', 3))
+    CACHE_TAG_TTL = int(os.getenv('CACHE_TAG_TTL', 7 * 86400))  # Conjuntos tag:* (invalidação em grupo)
+    
+    # Cache negativo: respostas vazias e erros do provedor, distintos de um miss
+    NEGATIVE_CACHE_EMPTY_TTL = int(os.getenv('NEGATIVE_CACHE_EMPTY_TTL', 1800))  # Sem dados (liga sem jogos, time sem stats)
+    NEGATIVE_CACHE_ERROR_TTL = int(os.getenv('NEGATIVE_CACHE_ERROR_TTL', 120))  # Chamada que falhou (classe do erro)
+    
+    # Aliases de times aprendidos (Postgres team_aliases + espelho no Redis)
+    TEAM_ALIAS_ENABLED = os.getenv('TEAM_ALIAS_ENABLED', 'true').lower() == 'true'
+    TEAM_ALIAS_MIN_SCORE = float(os.getenv('TEAM_ALIAS_MIN_SCORE', 0.85))  # Score mínimo (com horário batendo) para gravar
+    
+    # Snapshots diários da análise (candidatos sem stake, vários por dia)
+    DAILY_SNAPSHOT_MAX_AGE = int(os.getenv('DAILY_SNAPSHOT_MAX_AGE', 3 * 3600))  # Mais velho que isso: nova análise
+    DAILY_SNAPSHOTS_KEEP = int(os.getenv('DAILY_SNAPSHOTS_KEEP', 8))  # Snapshots guardados por dia
+    DAILY_CACHE_LOCK_TIMEOUT = float(os.getenv('DAILY_CACHE_LOCK_TIMEOUT', 120))  # Espera por outro processo gerando o snapshot
     
     # Database
     DB_CONFIG = {
@@ -41,11 +41,26 @@ CREATE TABLE IF NOT EXISTS daily_stats (
     roi DECIMAL(6,2) DEFAULT 0
 );
 
+-- Aliases de times aprendidos entre provedores (nome no provedor -> time da API-Football)
+CREATE TABLE IF NOT EXISTS team_aliases (
+    id SERIAL PRIMARY KEY,
+    provider VARCHAR(30) NOT NULL,           -- 'odds_api', ...
+    alias VARCHAR(200) NOT NULL,             -- Nome normalizado (TeamMatcher.canonical_name)
+    team_id INTEGER NOT NULL,                -- ID do time na API-Football
+    team_name VARCHAR(200),
+    source VARCHAR(10) NOT NULL DEFAULT 'auto',  -- 'auto' (matching confiável) ou 'manual' (override)
+    score DECIMAL(4,3),
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    UNIQUE (provider, alias)
+);
+
 -- Índices para performance
 CREATE INDEX IF NOT EXISTS idx_bets_status ON bets(status);
 CREATE INDEX IF NOT EXISTS idx_bets_phase ON bets(phase);
 CREATE INDEX IF NOT EXISTS idx_bets_timestamp ON bets(timestamp);
 CREATE INDEX IF NOT EXISTS idx_daily_stats_date ON daily_stats(date);
+CREATE INDEX IF NOT EXISTS idx_team_aliases_team_id ON team_aliases(team_id);
 
 -- Insere registro inicial de banca
 INSERT INTO bankroll_history (bankroll, phase, event_type, description)
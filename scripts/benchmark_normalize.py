@@ -0,0 +1,72 @@
+import argparse
+import random
+import sys
+import os
+import timeit
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services.team_matcher import TeamMatcher
+
+# Nomes reais dos dois provedores (com acentos, abreviações e pontuação)
+SAMPLE_NAMES = [
+    "Manchester United", "Man Utd", "Manchester City", "Man City", "Tottenham Hotspur", "Spurs",
+    "Wolverhampton Wanderers", "Nott'm Forest", "Nottingham Forest", "Brighton & Hove Albion",
+    "AFC Bournemouth", "Leeds United", "Sunderland AFC", "Athletic Bilbao", "Athletic Club",
+    "Atlético Madrid", "Real Sociedad", "Bayern München", "Bayern Munich", "1. FC Köln",
+    "Borussia Mönchengladbach", "St. Pauli", "AC Milan", "Inter Milan", "Sporting CP",
+    "Sporting Lisbon", "São Paulo", "Sao Paulo FC", "Atlético-MG", "Grêmio", "Bodø/Glimt",
+    "FC København", "Man Cityzens",
+]
+
+def legacy_normalize(name: str) -> str:
+    """Versão anterior do TeamMatcher.normalize_name (referência de custo)"""
+    name = name.lower().strip()
+    for word in ['fc', 'cf', 'sc', 'afc', 'bfc', 'united', 'city']:
+        name = name.replace(f' {word}', '').replace(f'{word} ', '')
+    name = name.replace('.', '').replace('-', ' ')
+    return ' '.join(name.split())
+
+def per_call_us(fn, names, repeat):
+    """Menor tempo por chamada (µs) entre `repeat` passadas pela lista"""
+    best = min(timeit.repeat(lambda: [fn(name) for name in names], number=1, repeat=repeat))
+    return best / len(names) * 1e6
+
+def main(args):
+    print("\n" + "="*60)
+    print("⏱️  BENCHMARK: TeamMatcher.normalize_name")
+    print("="*60)
+
+    # Variações únicas (simula um dia de odds + fixtures sem repetição)
+    random.seed(42)
+    unique = [f"{name} {random.randint(0, 10**6)}" for name in SAMPLE_NAMES for _ in range(args.variants)]
+    # Slate típico: os mesmos nomes repetidos a cada evento/fixture
+    repeated = [random.choice(SAMPLE_NAMES) for _ in range(len(unique))]
+
+    uncached = TeamMatcher.normalize_name.__wrapped__
+
+    print(f"\n📊 {len(unique)} chamadas por passada, melhor de {args.repeat}")
+    print(f"   legado (str.replace)      {per_call_us(legacy_normalize, repeated, args.repeat):6.2f} µs/chamada")
+    print(f"   pipeline sem memo         {per_call_us(uncached, repeated, args.repeat):6.2f} µs/chamada")
+
+    TeamMatcher.normalize_name.cache_clear()
+    cold = per_call_us(TeamMatcher.normalize_name, unique[:TeamMatcher.NORMALIZE_CACHE_SIZE], 1)
+    print(f"   memo, nomes inéditos      {cold:6.2f} µs/chamada")
+
+    TeamMatcher.normalize_name.cache_clear()
+    print(f"   memo, nomes repetidos     {per_call_us(TeamMatcher.normalize_name, repeated, args.repeat):6.2f} µs/chamada")
+    print(f"   {TeamMatcher.normalize_name.cache_info()}")
+
+    print("\n🔎 Exemplos:")
+    for name in ["São Paulo", "Man City", "Man Cityzens", "Nott'm Forest", "Bayern München", "Bodø/Glimt"]:
+        print(f"   {name:<18} legado={legacy_normalize(name)!r:<18} novo={TeamMatcher.canonical_name(name)!r}")
+
+    print("="*60 + "\n")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Custo por chamada da normalização de nomes de times")
+    parser.add_argument("--variants", type=int, default=200, help="Variações únicas por nome da amostra")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetições (vale a melhor)")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    main(parse_args())
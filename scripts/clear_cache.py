@@ -1,28 +1,74 @@
+import argparse
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.cache.redis_client import RedisCache
 
-def clear_cache():
+def show_stats(cache):
+    print("\n📊 Tags no cache:")
+    tags = cache.list_tags()
+    if not tags:
+        print("   (nenhuma)")
+    for tag, count in sorted(tags.items()):
+        print(f"   {tag}: {count} chaves")
+
+    print("\n📊 Namespaces (este processo):")
+    stats = RedisCache.namespace_stats()
+    for namespace, prefixes in cache.NAMESPACES.items():
+        counters = stats.get(namespace, {})
+        print(f"   {namespace:<12} prefixos={', '.join(prefixes)}  "
+              f"hits={counters.get('hits', 0)} misses={counters.get('misses', 0)}")
+
+def clear_cache(args):
     print("\n" + "="*60)
     print("🗑️  LIMPANDO CACHE REDIS")
     print("="*60)
-    
+
     cache = RedisCache()
-    
-    confirm = input("\n⚠️  Isso vai limpar TODOS os dados do cache. Confirma? (s/n): ")
-    
+
+    if args.stats:
+        show_stats(cache)
+        print("="*60 + "\n")
+        return
+
+    if args.namespace:
+        target = f"o namespace '{args.namespace}'"
+    elif args.tag:
+        target = f"as chaves da tag '{args.tag}'"
+    else:
+        target = f"TODOS os dados do cache do agente (exceto {', '.join(cache.PRESERVED_NAMESPACES)})"
+
+    confirm = 's' if args.yes else input(f"\n⚠️  Isso vai limpar {target}. Confirma? (s/n): ")
+
     if confirm.lower() == 's':
-        success = cache.clear_all()
-        if success:
-            print("✅ Cache limpo com sucesso!")
+        if args.namespace:
+            removed = cache.clear_namespace(args.namespace)
+            print(f"✅ {removed} chaves removidas de '{args.namespace}'")
+        elif args.tag:
+            removed = cache.invalidate_tag(args.tag)
+            print(f"✅ {removed} chaves removidas da tag '{args.tag}'")
         else:
-            print("❌ Erro ao limpar cache")
+            success = cache.clear_all()
+            if success:
+                print("✅ Cache limpo com sucesso!")
+            else:
+                print("❌ Erro ao limpar cache")
     else:
         print("❌ Operação cancelada")
-    
+
     print("="*60 + "\n")
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Limpa o cache Redis do agente (sem FLUSHDB)")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--namespace", choices=list(RedisCache.NAMESPACES), help="Limpa só um namespace")
+    group.add_argument("--tag", help="Invalida as chaves de uma tag (ex.: league:39, team:42)")
+    group.add_argument("--all", action="store_true",
+                       help=f"Limpa todos os namespaces, exceto {', '.join(RedisCache.PRESERVED_NAMESPACES)} (padrão)")
+    group.add_argument("--stats", action="store_true", help="Mostra tags e namespaces sem apagar nada")
+    parser.add_argument("-y", "--yes", action="store_true", help="Não pede confirmação")
+    return parser.parse_args()
+
 if __name__ == "__main__":
-    clear_cache()
\ No newline at end of file
+    clear_cache(parse_args())
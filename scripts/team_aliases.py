@@ -0,0 +1,58 @@
+import argparse
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services.team_alias_registry import TeamAliasRegistry
+
+def list_aliases(provider):
+    aliases = TeamAliasRegistry.list_aliases(provider)
+    print(f"\n🔖 Aliases de '{provider}': {len(aliases)}")
+    for alias, entry in aliases:
+        score = f"{entry['score']:.3f}" if entry.get('score') is not None else "-"
+        print(f"   {alias:<30} → {entry['team_id']:<8} {entry.get('team_name') or '':<30} "
+              f"[{entry['source']}] score={score}")
+
+def main(args):
+    print("\n" + "="*60)
+    print("🔖 ALIASES DE TIMES (The Odds API → API-Football)")
+    print("="*60)
+
+    if args.set:
+        name, team_id = args.set
+        saved = TeamAliasRegistry.set_override(args.provider, name, int(team_id), args.team_name)
+        alias = TeamAliasRegistry.alias_key(name)
+        if saved:
+            print(f"✅ Override manual: '{alias}' → {team_id}")
+        else:
+            print(f"⚠️  Override '{alias}' → {team_id} gravado só no Redis (Postgres indisponível)")
+    elif args.remove:
+        if TeamAliasRegistry.remove(args.provider, args.remove):
+            print(f"✅ Alias '{TeamAliasRegistry.alias_key(args.remove)}' removido")
+        else:
+            print(f"❌ Alias '{TeamAliasRegistry.alias_key(args.remove)}' não encontrado")
+    elif args.reload:
+        aliases = TeamAliasRegistry.reload(args.provider)
+        if aliases is None:
+            print("❌ Postgres indisponível: espelho no Redis não foi reconstruído")
+        else:
+            print(f"✅ Espelho no Redis reconstruído: {len(aliases)} aliases")
+    else:
+        list_aliases(args.provider)
+
+    print("="*60 + "\n")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Lista e corrige os aliases de times aprendidos pelo matching")
+    parser.add_argument("--provider", default="odds_api", help="Provedor dos nomes (padrão: odds_api)")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--list", action="store_true", help="Lista os aliases (padrão)")
+    group.add_argument("--set", nargs=2, metavar=("NOME", "TEAM_ID"),
+                       help="Override manual: nome no provedor → ID do time na API-Football")
+    group.add_argument("--remove", metavar="NOME", help="Remove o alias (auto ou manual)")
+    group.add_argument("--reload", action="store_true", help="Relê o Postgres e reconstrói o espelho no Redis")
+    parser.add_argument("--team-name", help="Nome do time na API-Football (com --set)")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    main(parse_args())
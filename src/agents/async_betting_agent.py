@@ -0,0 +1,169 @@
+import asyncio
+from typing import List, Dict
+from src.agents.betting_agent import BettingAgent
+from src.services.async_api_football_service import AsyncAPIFootballService
+from src.services.async_odds_api import AsyncOddsAPI
+from src.services.football_api import FootballAPI
+from src.services.league_stats_store import AsyncLeagueStatsStore
+from src.services.team_alias_registry import TeamAliasRegistry
+from src.utils.daily_cache import DailyCache
+
+
+class AsyncBettingAgent(BettingAgent):
+    """
+    BettingAgent para asyncio (FastAPI): mesmas etapas e mesmo modelo,
+    mas todo I/O dos provedores é async e roda sobreposto no event loop
+
+    - Odds, fixtures, classificações, stats e mercados extras via clientes async
+    - Matching, precificação e validação reaproveitam os métodos do BettingAgent
+    - Tênis (cliente sync) e cache diário em arquivo rodam em asyncio.to_thread
+    """
+
+    # Uma reconstrução por event loop; os outros chamadores esperam aqui (sem ocupar threads)
+    _rebuild_locks: Dict[int, asyncio.Lock] = {}
+
+    def _init_services(self):
+        # FootballAPI não é usado na análise; criado sob demanda para não conectar no Redis sync
+        self._football_api = None
+        self.api_football = AsyncAPIFootballService()
+        self.league_stats = AsyncLeagueStatsStore(self.api_football)
+        self.odds_api = AsyncOddsAPI()
+
+    @property
+    def football_api(self) -> FootballAPI:
+        if self._football_api is None:
+            self._football_api = FootballAPI()
+        return self._football_api
+
+    async def analyze_today_opportunities(self) -> List[Dict]:
+        """Analisa todas oportunidades do dia (versão async de BettingAgent.analyze_today_opportunities)"""
+        print("🔍 Buscando oportunidades de hoje...")
+
+        # 🎯 VERIFICA SNAPSHOT DO DIA PRIMEIRO (stakes calculados para a banca atual)
+        cached = self._load_daily_cache(await asyncio.to_thread(DailyCache.load_latest_snapshot))
+        if cached is not None:
+            return cached
+
+        # Chamadas do mesmo processo fazem fila no asyncio.Lock; só a primeira disputa o
+        # flock entre processos. Quem esperou reaproveita o snapshot que a anterior gerou
+        async with self._rebuild_lock():
+            snapshot = await asyncio.to_thread(DailyCache.load_latest_snapshot)
+            if snapshot:
+                return self._load_daily_cache(snapshot)
+
+            lock = await DailyCache.acquire_rebuild_lock_async()
+            try:
+                snapshot = await asyncio.to_thread(DailyCache.load_latest_snapshot)
+                if snapshot:
+                    return self._load_daily_cache(snapshot)
+                return await self._run_analysis()
+            finally:
+                DailyCache.release_lock(lock)
+
+    @classmethod
+    def _rebuild_lock(cls) -> asyncio.Lock:
+        """asyncio.Lock do event loop atual (um Lock só vale no loop em que foi usado)"""
+        loop_id = id(asyncio.get_running_loop())
+        lock = cls._rebuild_locks.get(loop_id)
+        if lock is None:
+            lock = cls._rebuild_locks[loop_id] = asyncio.Lock()
+        return lock
+
+    async def _run_analysis(self) -> List[Dict]:
+        """Análise completa nos provedores (chamada com o lock do cache diário)"""
+        # Tênis não depende do futebol: roda em paralelo com todo o resto
+        tennis_task = asyncio.create_task(asyncio.to_thread(self.analyze_tennis_opportunities))
+
+        try:
+            # 1. Busca odds da The Odds API (todas as ligas ao mesmo tempo)
+            self._print_odds_header()
+            all_matches_with_odds, leagues_found, unchanged = self._collect_odds(
+                await self.odds_api.gather_odds_for_sports(self.PRIORITY_LEAGUES)
+            )
+
+            if not all_matches_with_odds:
+                tennis_task.cancel()
+                return self._opportunities_without_odds()
+
+            # 2. Busca jogos da API-Football só das ligas com odds
+            print("📊 Buscando jogos da API-Football por liga...")
+            fixtures_by_sport = await self._fetch_league_fixtures(all_matches_with_odds)
+
+            # 3. Matching (CPU, mesmo código do agente sync); aliases lidos e gravados fora do event loop
+            await asyncio.to_thread(TeamAliasRegistry.load, self.ALIAS_PROVIDER)
+            slate, matched_count, learned = self._build_slate(all_matches_with_odds, fixtures_by_sport)
+            await asyncio.to_thread(TeamAliasRegistry.record_many, self.ALIAS_PROVIDER, learned)
+
+            # Jogos com odds iguais às do último snapshot: candidatos reaproveitados
+            pending, reused, odds_hashes = await asyncio.to_thread(self._split_reusable, slate, unchanged)
+
+            # 4. Stats dos times dos jogos restantes (classificações + misses ao mesmo tempo)
+            print(f"\n📈 Pré-carregando estatísticas dos times...")
+            prefetched = await self._prefetch_team_stats([match for match, _ in pending])
+            analyzed = self._analyze_slate(pending, prefetched)
+
+            # 5. Mercados extras dos jogos pré-aprovados (limiar independente da banca)
+            candidate_info = self._candidate_phase_info()
+            selected = self._select_extra_market_events(analyzed, prefetched, candidate_info)
+            extra_markets = await self.odds_api.get_event_odds_batch(selected) if selected else {}
+
+            # 6. Precifica mercados (candidatos sem stake)
+            candidates = reused + self._price_slate(analyzed, extra_markets, candidate_info)
+
+            print("\n🎾 Analisando oportunidades de Tênis...")
+            tennis_opps = await tennis_task
+        except BaseException:
+            tennis_task.cancel()
+            raise
+
+        # 🎯 SALVA SNAPSHOT DO DIA (só resultados que não dependem da banca)
+        await asyncio.to_thread(
+            DailyCache.save_snapshot,
+            candidates=candidates,
+            tennis=tennis_opps,
+            matches_count=len(slate),
+            leagues_count=leagues_found,
+            matched_count=matched_count,
+            odds_hashes=odds_hashes
+        )
+
+        # 7. Stakes, validação e limites de risco para a banca atual
+        phase_info = self.bankroll_manager.get_phase_info()
+        opportunities = self._report_and_validate(candidates, matched_count, len(slate), phase_info)
+
+        return self._finalize(opportunities, tennis_opps)
+
+    async def _fetch_league_fixtures(self, events: List[Dict]) -> Dict[str, List[Dict]]:
+        """Fixtures de cada liga com odds (e do dia inteiro, se houver liga sem mapeamento) ao mesmo tempo"""
+        mapped, unmapped, date_str = self._resolve_leagues(events)
+
+        async def no_fixtures() -> List[Dict]:
+            return []
+
+        by_league, all_fixtures = await asyncio.gather(
+            self.api_football.get_fixtures_for_leagues(mapped.values(), date_str),
+            self.api_football.get_fixtures_next_days(1) if unmapped else no_fixtures(),
+        )
+
+        return self._group_fixtures(mapped, unmapped, by_league, all_fixtures)
+
+    async def _prefetch_team_stats(self, matches: List[Dict]) -> Dict[str, Dict]:
+        """Mesma estratégia do agente sync: classificação por liga, depois times restantes"""
+        prefetched = {'stats': {}, 'form': {}}
+        teams = self._team_keys(matches)
+
+        if not teams:
+            return prefetched
+
+        leagues = {(league_id, season) for _, league_id, season in teams}
+        loaded = await self.league_stats.load_many(leagues)
+        print(f"   📊 Classificação carregada: {loaded}/{len(leagues)} ligas")
+
+        stats_misses, form_misses = self._fill_from_league_stats(teams, prefetched)
+
+        if stats_misses:
+            per_team = await self.api_football.prefetch_team_data(stats_misses, form_misses)
+            prefetched['stats'].update(per_team['stats'])
+            prefetched['form'].update(per_team['form'])
+
+        return prefetched
@@ -5,13 +5,18 @@ from src.models.risk_manager import RiskManager
 from src.models.advanced_stats import AdvancedStats
 from src.services.football_api import FootballAPI
 from src.services.api_football_service import APIFootballService
+from src.services.league_stats_store import LeagueStatsStore
+from src.services.league_mapping import get_api_football_league, season_for
 from src.utils.daily_cache import DailyCache
-from src.services.team_matcher import TeamMatcher
+from src.cache.conditional_refresh import ConditionalRefresh
+from src.services.team_matcher import FixtureIndex
+from src.services.team_alias_registry import TeamAliasRegistry
 from src.services.odds_api import OddsAPI
 from src.utils.validators import OpportunityValidator
 from src.utils.reporter import Reporter
 from src.utils.multiple_detector import MultipleDetector
-from typing import List, Dict
+from datetime import datetime
+from typing import List, Dict, Optional
 
 class BettingAgent:
     """Agente principal que orquestra análises e sugestões"""
@@ -27,104 +32,307 @@ class BettingAgent:
         'soccer_portugal_primeira_liga',   # Primeira Liga (Portugal)
         'soccer_germany_bundesliga2'       # Bundesliga 2 (Alemanha) ⭐ BOM VALUE
     ]
+    
+    # Provedor dos nomes de times no registro de aliases (The Odds API -> API-Football)
+    ALIAS_PROVIDER = 'odds_api'
+    
     def __init__(self, current_bankroll: float):
         """Inicializa o agente com a banca atual"""
         from src.models.bankroll_manager import BankrollManager
         
         self.bankroll_manager = BankrollManager(current_bankroll)
         self.probability_model = ProbabilityModel()
+        self.bet_history = BetHistory()
+        self.risk_manager = RiskManager(current_bankroll, self.bankroll_manager.phase)
+        self._init_services()
+    
+    def _init_services(self):
+        """Clientes dos provedores (AsyncBettingAgent troca pelas versões async)"""
         self.football_api = FootballAPI()
         self.api_football = APIFootballService()
+        self.league_stats = LeagueStatsStore(self.api_football)
         self.odds_api = OddsAPI()
-        self.bet_history = BetHistory()
-        self.risk_manager = RiskManager(current_bankroll, self.bankroll_manager.phase)
 
     def analyze_today_opportunities(self) -> List[Dict]:
         """Analisa todas oportunidades do dia usando The Odds API + API-Football"""
-        from config.config import Config
-        
         print("🔍 Buscando oportunidades de hoje...")
         
-        # 🎯 VERIFICA CACHE DIÁRIO PRIMEIRO
-        cached_data = DailyCache.load_today_data()
-        if cached_data:
-            print(f"   ✅ Já buscamos hoje! ({cached_data['matches_count']} jogos, {cached_data['leagues_count']} ligas)")
-            print(f"   ✅ {len(cached_data['opportunities'])} oportunidades em cache")
-            return cached_data['opportunities']
+        # 🎯 VERIFICA SNAPSHOT DO DIA PRIMEIRO (stakes calculados para a banca atual)
+        cached = self._load_daily_cache(DailyCache.load_latest_snapshot())
+        if cached is not None:
+            return cached
+        
+        # Só um processo refaz a análise; quem esperou reaproveita o snapshot que ele gerou
+        with DailyCache.rebuild_lock():
+            snapshot = DailyCache.load_latest_snapshot()
+            if snapshot:
+                return self._load_daily_cache(snapshot)
+            return self._run_analysis()
+    
+    def _run_analysis(self) -> List[Dict]:
+        """Análise completa nos provedores (chamada com o lock do cache diário)"""
+        # 1. Busca odds da The Odds API (ligas prioritárias, em paralelo)
+        self._print_odds_header()
+        all_matches_with_odds, leagues_found, unchanged = self._collect_odds(
+            self.odds_api.iter_odds_for_sports(self.PRIORITY_LEAGUES)
+        )
+        
+        if not all_matches_with_odds:
+            return self._opportunities_without_odds()
+        
+        # 2. Busca jogos da API-Football só das ligas com odds (1 requisição por liga)
+        print("📊 Buscando jogos da API-Football por liga...")
+        fixtures_by_sport = self._fetch_league_fixtures(all_matches_with_odds)
+        
+        # 3. Faz matching entre The Odds API e API-Football (dentro da mesma liga)
+        slate, matched_count, learned = self._build_slate(all_matches_with_odds, fixtures_by_sport)
+        TeamAliasRegistry.record_many(self.ALIAS_PROVIDER, learned)
+        
+        # Jogos com odds iguais às do último snapshot: candidatos reaproveitados
+        # (sem stats, pré-filtro, mercados extras nem precificação)
+        pending, reused, odds_hashes = self._split_reusable(slate, unchanged)
         
-        print("   🆕 Primeira busca do dia - consultando APIs...")
+        # 4. Pré-carrega stats dos times dos jogos restantes (cache + API em paralelo)
+        print(f"\n📈 Pré-carregando estatísticas dos times...")
+        prefetched = self._prefetch_team_stats([match for match, _ in pending])
+        analyzed = self._analyze_slate(pending, prefetched)
         
-        # 1. Busca jogos da API-Football (para ter IDs e stats)
-        print("📊 Buscando jogos da API-Football...")
-        api_football_matches = self.api_football.get_fixtures_next_days(1)  # Apenas hoje
-        print(f"   ✅ {len(api_football_matches)} jogos encontrados (API-Football)")
+        # 5. Etapa 2 da Odds API: mercados extras só para jogos pré-aprovados pelo modelo
+        #    (limiar independente da banca: o snapshot serve para qualquer fase)
+        candidate_info = self._candidate_phase_info()
+        selected = self._select_extra_market_events(analyzed, prefetched, candidate_info)
+        extra_markets = self.odds_api.get_event_odds_batch(selected) if selected else {}
         
-        # 2. Busca odds da The Odds API (ligas prioritárias)
+        # 6. Precifica mercados (candidatos sem stake)
+        candidates = reused + self._price_slate(analyzed, extra_markets, candidate_info)
+        
+        # Analisa Tênis
+        print("\n🎾 Analisando oportunidades de Tênis...")
+        tennis_opps = self.analyze_tennis_opportunities()
+        
+        # 🎯 SALVA SNAPSHOT DO DIA (só resultados que não dependem da banca)
+        DailyCache.save_snapshot(
+            candidates=candidates,
+            tennis=tennis_opps,
+            matches_count=len(slate),
+            leagues_count=leagues_found,
+            matched_count=matched_count,
+            odds_hashes=odds_hashes
+        )
+        
+        # 7. Stakes, validação e limites de risco para a banca atual
+        phase_info = self.bankroll_manager.get_phase_info()
+        opportunities = self._report_and_validate(candidates, matched_count, len(slate), phase_info)
+        
+        return self._finalize(opportunities, tennis_opps)
+    
+    # =========================
+    # 🔹 ETAPAS DA ANÁLISE (sem I/O, compartilhadas com AsyncBettingAgent)
+    # =========================
+    def _load_daily_cache(self, snapshot: Optional[Dict]) -> Optional[List[Dict]]:
+        """
+        Oportunidades a partir do snapshot do dia (None se não há snapshot recente)
+        Stakes, validação e limites de risco são aplicados agora, para a banca atual
+        """
+        if not snapshot:
+            print("   🆕 Sem snapshot recente - consultando APIs...")
+            return None
+        
+        print(f"   ✅ Snapshot de {snapshot['timestamp'][11:16]} "
+              f"({snapshot['matches_count']} jogos, {snapshot['leagues_count']} ligas)")
+        print(f"   ✅ {len(snapshot['candidates'])} candidatos em cache")
+        
+        opportunities = self._apply_bankroll(snapshot['candidates'], self.bankroll_manager.get_phase_info())
+        return self._finalize(opportunities, list(snapshot.get('tennis', [])))
+    
+    @staticmethod
+    def _candidate_phase_info() -> Dict:
+        """
+        Limiar da análise que vai para o snapshot: o menor EV mínimo entre as fases
+        Cada leitura filtra depois pelo EV mínimo da fase da banca
+        """
+        from config.config import Config
+        
+        return {'phase': None, 'min_ev': min(Config.MIN_EV.values())}
+    
+    def _apply_bankroll(self, candidates: List[Dict], phase_info: Dict) -> List[Dict]:
+        """Filtra candidatos pelo EV mínimo da fase, calcula stakes e valida (barato, sem I/O)"""
+        opportunities = []
+        stake_adjustment = self.risk_manager.get_stake_adjustment()
+        
+        for candidate in candidates:
+            if candidate['ev'] < phase_info['min_ev']:
+                continue
+            
+            stake = self.bankroll_manager.calculate_stake(candidate['probability'], candidate['odds'], candidate['ev'])
+            
+            # Aplica ajuste de risco
+            stake = stake * stake_adjustment
+            
+            opportunities.append({
+                **candidate,
+                'stake': round(stake, 2),
+                'potential_return': round(stake * candidate['odds'], 2),
+                'phase': phase_info['phase']
+            })
+        
+        return self._validate_opportunities(opportunities, phase_info)
+    
+    def _print_odds_header(self):
         print(f"💰 Buscando odds das {len(self.PRIORITY_LEAGUES)} ligas prioritárias...")
         print(f"   📋 Ligas: Championship, Premier, La Liga, Bundesliga, Brasileirão, Serie A, Portugal, Bundesliga 2")
-        
+    
+    def _collect_odds(self, results) -> tuple:
+        """
+        Junta os jogos com odds de cada liga
+        results: (sport, odds, erro) na ordem em que as ligas terminam
+        Retorna (jogos com odds, nº de ligas com jogos, match_ids sem mudança no refresh condicional)
+        """
         all_matches_with_odds = []
         leagues_found = 0
+        unchanged = set()
         
-        for sport in self.PRIORITY_LEAGUES:
-            try:
-                matches = self.odds_api.get_odds_for_match(sport)
-                if matches:
-                    all_matches_with_odds.extend(matches)
-                    leagues_found += 1
-            except Exception as e:
-                print(f"   ⚠️ Erro ao buscar {sport}: {e}")
+        for sport, matches, error in results:
+            if error:
+                print(f"   ⚠️ Erro ao buscar {sport}: {error}")
+                continue
+            if matches:
+                all_matches_with_odds.extend(matches)
+                leagues_found += 1
+            
+            # Refresh condicional informa quais jogos mudaram desde a última busca
+            changes = self.odds_api.get_odds_changes(sport)
+            if not changes:
                 continue
+            unchanged.update(changes['unchanged'])
+            if changes['modified']:
+                print(f"   🔄 {sport}: {len(changes['added'])} novos, {len(changes['changed'])} alterados, "
+                      f"{len(changes['removed'])} removidos")
         
         print(f"   ✅ {leagues_found} ligas carregadas")
         print(f"   ✅ {len(all_matches_with_odds)} jogos com odds disponíveis")
         
-        if not all_matches_with_odds:
-            if Config.ENVIRONMENT == 'production':
-                print("❌ ERRO: Nenhum jogo com odds encontrado e sistema está em PRODUÇÃO")
-                return []
-            else:
-                print("⚠️  Nenhum jogo encontrado. Usando dados simulados (DEVELOPMENT)...")
-                from src.utils.mock_data import get_mock_matches, get_mock_odds
-                matches = get_mock_matches()
-                odds_data = get_mock_odds()
-                # Processa dados simulados (fallback antigo)
-                opportunities = []
-                phase_info = self.bankroll_manager.get_phase_info()
-                for match in matches:
-                    match_odds = self._find_match_odds(match, odds_data)
-                    if not match_odds:
-                        continue
-                    home_stats, away_stats = self._get_real_team_stats(match)
-                    opps = self._analyze_match_markets(match, match_odds, phase_info, home_stats, away_stats)
-                    opportunities.extend(opps)
-                opportunities = self._validate_opportunities(opportunities, phase_info)
-                opportunities.sort(key=lambda x: x['ev'], reverse=True)
-                return opportunities
-        
-        # 3. Faz matching entre The Odds API e API-Football
-        print(f"\n🔗 Fazendo matching entre APIs...")
+        return all_matches_with_odds, leagues_found, unchanged
+    
+    @staticmethod
+    def _split_reusable(slate: List[tuple], unchanged: set) -> tuple:
+        """
+        Separa os jogos que não precisam de nova análise
+        Reaproveitável: match_id 'unchanged' no refresh condicional e com o mesmo hash de
+        odds guardado no snapshot anterior do dia (outro refresh pode ter rodado entre os dois)
+        Retorna (slate a analisar, candidatos reaproveitados, hashes das odds do slate inteiro)
+        """
+        odds_hashes = {
+            str(match_with_odds['match_id']): ConditionalRefresh.item_hash(match_with_odds)
+            for _, match_with_odds in slate
+            if match_with_odds.get('match_id') is not None
+        }
         
-        opportunities = []
+        previous = DailyCache.load_latest_snapshot(max_age=0, quiet=True) if unchanged else None
+        previous_hashes = (previous or {}).get('odds_hashes') or {}
+        reusable = {
+            match_id for match_id in unchanged
+            if match_id in odds_hashes and previous_hashes.get(match_id) == odds_hashes[match_id]
+        }
+        if not reusable:
+            return slate, [], odds_hashes
+        
+        reused = [candidate for candidate in previous['candidates'] if str(candidate.get('match_id')) in reusable]
+        pending = [(match, match_with_odds) for match, match_with_odds in slate
+                   if str(match_with_odds.get('match_id')) not in reusable]
+        
+        print(f"   ♻️  {len(reusable)} jogos sem mudança nas odds: "
+              f"{len(reused)} candidatos reaproveitados do snapshot de {previous['timestamp'][11:16]}")
+        return pending, reused, odds_hashes
+    
+    def _opportunities_without_odds(self) -> List[Dict]:
+        """Sem odds: vazio em produção, dados simulados em desenvolvimento"""
+        from config.config import Config
+        
+        if Config.ENVIRONMENT == 'production':
+            print("❌ ERRO: Nenhum jogo com odds encontrado e sistema está em PRODUÇÃO")
+            return []
+        
+        print("⚠️  Nenhum jogo encontrado. Usando dados simulados (DEVELOPMENT)...")
+        from src.utils.mock_data import get_mock_matches, get_mock_odds
+        matches = get_mock_matches()
+        odds_data = get_mock_odds()
+        # Processa dados simulados (fallback antigo)
+        candidates = []
         phase_info = self.bankroll_manager.get_phase_info()
+        for match in matches:
+            match_odds = self._find_match_odds(match, odds_data)
+            if not match_odds:
+                continue
+            home_stats, away_stats = self._get_real_team_stats(match)
+            opps = self._analyze_match_markets(match, match_odds, phase_info, home_stats, away_stats)
+            candidates.extend(opps)
+        opportunities = self._apply_bankroll(candidates, phase_info)
+        opportunities.sort(key=lambda x: x['ev'], reverse=True)
+        return opportunities
+    
+    def _match_fixtures(self, all_matches_with_odds: List[Dict],
+                        fixtures_by_sport: Dict[str, List[Dict]]) -> List[Optional[Dict]]:
+        """Fixture da API-Football (ou None) de cada jogo com odds, na mesma ordem"""
+        positions_by_sport: Dict[str, List[int]] = {}
+        for position, match_with_odds in enumerate(all_matches_with_odds):
+            positions_by_sport.setdefault(match_with_odds.get('sport_key'), []).append(position)
+        
+        matched_games: List[Optional[Dict]] = [None] * len(all_matches_with_odds)
+        for sport, positions in positions_by_sport.items():
+            fixtures = fixtures_by_sport.get(sport)
+            if not fixtures:
+                continue
+            
+            events = [all_matches_with_odds[position] for position in positions]
+            found = FixtureIndex(fixtures).match_many(
+                [(event['home_team'], event['away_team'], event.get('commence_time')) for event in events],
+                threshold=0.6,
+                ids=[(TeamAliasRegistry.resolve(self.ALIAS_PROVIDER, event['home_team']),
+                      TeamAliasRegistry.resolve(self.ALIAS_PROVIDER, event['away_team'])) for event in events]
+            )
+            for position, matched_game in zip(positions, found):
+                matched_games[position] = matched_game
+        
+        return matched_games
+    
+    def _build_slate(self, all_matches_with_odds: List[Dict], fixtures_by_sport: Dict[str, List[Dict]]) -> tuple:
+        """
+        Faz matching de cada jogo com odds com os fixtures da mesma liga (só CPU)
+        Retorna ([(match, match_with_odds)], nº de jogos com match, aliases candidatos)
+        Os aliases são gravados por quem chama (TeamAliasRegistry.record_many faz I/O)
+        """
+        print(f"\n🔗 Fazendo matching entre APIs...")
         
         matched_count = 0
         total_processed = 0
+        slate = []  # (match, match_with_odds)
+        
+        # Pareamento em lote por liga (apenas jogos da liga correspondente): um-para-um,
+        # melhor par e não o primeiro. Aliases aprendidos em execuções anteriores entram
+        # como IDs conhecidos (times conhecidos saem por ID, sem fuzzy)
+        matched_games = self._match_fixtures(all_matches_with_odds, fixtures_by_sport)
         
-        for match_with_odds in all_matches_with_odds:
+        alias_count = 0
+        learned = []  # (nome na The Odds API, team_id, nome na API-Football, score)
+        
+        for match_with_odds, matched_game in zip(all_matches_with_odds, matched_games):
             total_processed += 1
-            
-            # Tenta fazer match com API-Football
-            matched_game = TeamMatcher.match_teams(
-                match_with_odds['home_team'],
-                match_with_odds['away_team'],
-                api_football_matches,
-                odds_datetime=match_with_odds.get('commence_time'),
-                threshold=0.6
-            )
+            sport = match_with_odds.get('sport_key')
+            league = get_api_football_league(sport) if sport else None
+            season = league[1] if league else season_for()
             
             if matched_game:
                 matched_count += 1
+                if matched_game.get('match_source') == 'alias':
+                    alias_count += 1
+                
+                # Match confiável (horário batendo): candidatos a alias (score checado pelo registro)
+                if matched_game.get('kickoff_match'):
+                    learned.append((match_with_odds['home_team'], matched_game.get('home_team_id'),
+                                    matched_game.get('home_team'), matched_game['home_match_score']))
+                    learned.append((match_with_odds['away_team'], matched_game.get('away_team_id'),
+                                    matched_game.get('away_team'), matched_game['away_match_score']))
                 
                 # Usa dados do match (com IDs para buscar stats)
                 match = {
@@ -134,7 +342,8 @@ class BettingAgent:
                     'date': match_with_odds.get('commence_time', ''),
                     'home_team_id': matched_game.get('home_team_id'),
                     'away_team_id': matched_game.get('away_team_id'),
-                    'league_id': matched_game.get('league_id')
+                    'league_id': matched_game.get('league_id'),
+                    'season': season
                 }
                 
                 if total_processed <= 3:  # Debug dos primeiros 3
@@ -150,45 +359,76 @@ class BettingAgent:
                     'date': match_with_odds.get('commence_time', ''),
                     'home_team_id': None,
                     'away_team_id': None,
-                    'league_id': None
+                    'league_id': None,
+                    'season': season
                 }
                 
                 if total_processed <= 3:  # Debug dos primeiros 3
                     print(f"   ❌ Sem match: {match_with_odds['home_team']} vs {match_with_odds['away_team']}")
             
-            # Busca estatísticas reais (vai usar APIs se tiver IDs, senão fallback)
-            home_stats, away_stats = self._get_real_team_stats(match)
+            slate.append((match, match_with_odds))
+        
+        if alias_count:
+            print(f"   🔖 {alias_count} jogos resolvidos por aliases conhecidos")
+        
+        return slate, matched_count, learned
+    
+    def _analyze_slate(self, slate: List[tuple], prefetched: Dict) -> List[tuple]:
+        """Stats de cada jogo a partir do mapa pré-carregado (fallback se não tiver IDs)"""
+        analyzed = []
+        for match, match_with_odds in slate:
+            home_stats, away_stats = self._get_real_team_stats(match, prefetched)
+            analyzed.append((match, match_with_odds, home_stats, away_stats))
+        return analyzed
+    
+    def _price_slate(self, analyzed: List[tuple], extra_markets: Dict[str, Dict], phase_info: Dict) -> List[Dict]:
+        """
+        Junta mercados extras às odds do lote e analisa todos os mercados de cada jogo
+        Retorna candidatos (match, market, odds, probability, ev) ainda sem stake
+        """
+        opportunities = []
+        
+        for match, match_with_odds, home_stats, away_stats in analyzed:
+            event_markets = extra_markets.get(match_with_odds.get('match_id'))
+            if event_markets:
+                # Cópia: não altera o objeto que veio do cache
+                markets = dict(match_with_odds.get('markets', {}))
+                for key, price in event_markets.items():
+                    # Mantém a melhor odd entre lote e evento
+                    if key not in markets or price > markets[key]:
+                        markets[key] = price
+                match_with_odds = {**match_with_odds, 'markets': markets}
             
             # Analisa mercados (match_with_odds já tem as odds)
             opps = self._analyze_match_markets(match, match_with_odds, phase_info, home_stats, away_stats)
+            for opp in opps:
+                opp['match_id'] = match_with_odds.get('match_id')
             opportunities.extend(opps)
         
+        return opportunities
+    
+    def _report_and_validate(self, candidates: List[Dict], matched_count: int,
+                             total_processed: int, phase_info: Dict) -> List[Dict]:
         print(f"\n📊 RESULTADO DO MATCHING:")
         print(f"   ✅ {matched_count}/{total_processed} jogos com match ({matched_count/total_processed*100:.1f}%)")
-        print(f"   ✅ {len(opportunities)} oportunidades encontradas (antes da validação)")
+        print(f"   ✅ {len(candidates)} candidatos encontrados (antes da banca e validação)")
         
-        # Valida oportunidades
-        opportunities = self._validate_opportunities(opportunities, phase_info)
+        # Stakes para a banca atual e validação
+        opportunities = self._apply_bankroll(candidates, phase_info)
         
         print(f"   ✅ {len(opportunities)} oportunidades validadas")
         
-        
-        # Analisa Tênis
-        print("\n🎾 Analisando oportunidades de Tênis...")
-        tennis_opps = self.analyze_tennis_opportunities()
+        return opportunities
+    
+    @staticmethod
+    def _finalize(opportunities: List[Dict], tennis_opps: List[Dict]) -> List[Dict]:
+        """Adiciona tênis e ordena por EV"""
         if tennis_opps:
             opportunities.extend(tennis_opps)
             print(f"   ✅ {len(tennis_opps)} oportunidades de tênis adicionadas")
         
-        # Ordena por EV
-        opportunities.sort(key=lambda x: x['ev'], reverse=True)
-        
-        # 🎯 SALVA NO CACHE DIÁRIO
-        DailyCache.save_today_data(
-            opportunities=opportunities,
-            matches_count=total_processed,
-            leagues_count=leagues_found
-        )
+        # Ordena por EV (análises de tênis não têm EV: vão para o fim)
+        opportunities.sort(key=lambda x: x.get('ev', float('-inf')), reverse=True)
         
         return opportunities
     
@@ -285,9 +525,180 @@ class BettingAgent:
         
         return {}
     
-    def _get_real_team_stats(self, match: Dict) -> tuple:
+    def _fetch_league_fixtures(self, events: List[Dict]) -> Dict[str, List[Dict]]:
+        """
+        Busca fixtures da API-Football de cada liga com odds (em paralelo)
+        Ligas sem mapeamento usam a lista global do dia como fallback
+        Retorna {sport_key: fixtures}
+        """
+        mapped, unmapped, date_str = self._resolve_leagues(events)
+        by_league = self.api_football.get_fixtures_for_leagues(mapped.values(), date_str)
+        all_fixtures = self.api_football.get_fixtures_next_days(1) if unmapped else []
+        
+        return self._group_fixtures(mapped, unmapped, by_league, all_fixtures)
+    
+    @staticmethod
+    def _resolve_leagues(events: List[Dict]) -> tuple:
+        """
+        Liga/temporada da API-Football de cada sport key com odds
+        Retorna ({sport: (league_id, season)}, [sports sem mapeamento], data YYYY-MM-DD)
+        """
+        today = datetime.now()
+        
+        leagues = {}
+        for event in events:
+            sport = event.get('sport_key')
+            if sport not in leagues:
+                leagues[sport] = get_api_football_league(sport, today.date()) if sport else None
+        
+        mapped = {sport: key for sport, key in leagues.items() if key}
+        unmapped = [sport for sport, key in leagues.items() if not key]
+        
+        return mapped, unmapped, today.strftime('%Y-%m-%d')
+    
+    @staticmethod
+    def _group_fixtures(mapped: Dict[str, tuple], unmapped: List[str], by_league: Dict[tuple, List[Dict]],
+                        all_fixtures: List[Dict]) -> Dict[str, List[Dict]]:
+        """Monta {sport_key: fixtures}; ligas sem mapeamento recebem todos os jogos do dia"""
+        fixtures_by_sport = {sport: by_league.get(key, []) for sport, key in mapped.items()}
+        
+        if unmapped:
+            print(f"   ⚠️ Ligas sem mapeamento ({', '.join(str(s) for s in unmapped)}): usando todos os jogos do dia")
+            for sport in unmapped:
+                fixtures_by_sport[sport] = all_fixtures
+        
+        total = sum(len(fixtures) for sport, fixtures in fixtures_by_sport.items() if sport in mapped)
+        print(f"   ✅ {total} jogos encontrados em {len(mapped)} ligas (API-Football)")
+        
+        return fixtures_by_sport
+    
+    @staticmethod
+    def _match_season(match: Dict) -> int:
+        """Temporada da API-Football do jogo (mapeamento da liga ou calendário europeu)"""
+        return match.get('season') or season_for()
+    
+    def _prefetch_team_stats(self, matches: List[Dict]) -> Dict[str, Dict]:
+        """
+        Monta o mapa de stats/forma de todos os jogos com IDs
+        1. Classificação de cada liga (1 requisição por liga via LeagueStatsStore)
+        2. Times fora da classificação: stats e forma por time (prefetch em paralelo)
+        """
+        prefetched = {'stats': {}, 'form': {}}
+        teams = self._team_keys(matches)
+        
+        if not teams:
+            return prefetched
+        
+        leagues = {(league_id, season) for _, league_id, season in teams}
+        loaded = self.league_stats.load_many(leagues)
+        print(f"   📊 Classificação carregada: {loaded}/{len(leagues)} ligas")
+        
+        stats_misses, form_misses = self._fill_from_league_stats(teams, prefetched)
+        
+        if stats_misses:
+            per_team = self.api_football.prefetch_team_data(stats_misses, form_misses)
+            prefetched['stats'].update(per_team['stats'])
+            prefetched['form'].update(per_team['form'])
+        
+        return prefetched
+    
+    def _team_keys(self, matches: List[Dict]) -> List[tuple]:
+        """Chaves (team_id, league_id, season) dos times de jogos com IDs"""
+        teams = []
+        
+        for match in matches:
+            home_team_id = match.get('home_team_id')
+            away_team_id = match.get('away_team_id')
+            league_id = match.get('league_id')
+            
+            if not (home_team_id and away_team_id and league_id):
+                continue
+            
+            for team_id in (home_team_id, away_team_id):
+                teams.append((team_id, league_id, self._match_season(match)))
+        
+        return teams
+    
+    def _fill_from_league_stats(self, teams: List[tuple], prefetched: Dict) -> tuple:
+        """
+        Preenche o mapa com a classificação já carregada
+        Retorna (stats_misses, form_misses) para buscar por time
+        """
+        stats_misses = []
+        form_misses = []
+        for key in dict.fromkeys(teams):
+            team_id = key[0]
+            league_stats = self.league_stats.get(*key)
+            
+            if league_stats:
+                prefetched['stats'][key] = league_stats
+                prefetched['form'][team_id] = league_stats.get('form', [])
+            else:
+                stats_misses.append(key)
+                form_misses.append(team_id)
+        
+        return stats_misses, form_misses
+    
+    def _has_real_stats(self, match: Dict, prefetched: Dict) -> bool:
+        """Jogo tem stats reais (não simuladas) no mapa pré-carregado?"""
+        league_id = match.get('league_id')
+        season = self._match_season(match)
+        return all(
+            prefetched['stats'].get((match.get(side), league_id, season))
+            for side in ('home_team_id', 'away_team_id')
+        )
+    
+    def _prescreen_score(self, home_stats: Dict, away_stats: Dict, markets: Dict) -> float:
+        """
+        Pré-filtro do modelo: maior EV nas linhas de gols já disponíveis no lote
+        Jogos em que o modelo já discorda do mercado são os candidatos
+        a ter valor em mercados correlatos (btts, linhas alternativas)
+        """
+        score_matrix = self.probability_model.score_matrix(*self._expected_goals(home_stats, away_stats))
+        best_ev = float('-inf')
+        
+        for key, market_odds in markets.items():
+            if not key.startswith(('over_', 'under_')):
+                continue
+            prob = score_matrix.probability(key, market_odds)
+            if prob is None:
+                continue
+            best_ev = max(best_ev, self.probability_model.calculate_ev(prob, market_odds))
+        
+        return best_ev
+    
+    def _select_extra_market_events(self, analyzed: List[tuple], prefetched: Dict, phase_info: Dict) -> List[Dict]:
+        """
+        Seleciona pelo pré-filtro os jogos que terão mercados extras buscados por evento
+        Só jogos com stats reais; no máximo ODDS_API_MAX_EVENT_FETCHES por execução
+        """
+        from config.config import Config
+        
+        min_score = phase_info['min_ev'] * Config.PRESCREEN_MIN_EV_RATIO
+        candidates = []
+        
+        for match, match_with_odds, home_stats, away_stats in analyzed:
+            if not match_with_odds.get('match_id') or not self._has_real_stats(match, prefetched):
+                continue
+            
+            score = self._prescreen_score(home_stats, away_stats, match_with_odds.get('markets', {}))
+            if score >= min_score:
+                candidates.append((score, match_with_odds))
+        
+        if not candidates:
+            return []
+        
+        candidates.sort(key=lambda c: c[0], reverse=True)
+        selected = [event for _, event in candidates[:Config.ODDS_API_MAX_EVENT_FETCHES]]
+        
+        print(f"\n🎯 Pré-filtro: {len(candidates)} jogos aprovados, buscando mercados extras de {len(selected)}")
+        
+        return selected
+    
+    def _get_real_team_stats(self, match: Dict, prefetched: Optional[Dict] = None) -> tuple:
         """
         Busca estatísticas reais dos times via API-Football
+        Se prefetched for informado, lê apenas do mapa pré-carregado
         Retorna (home_stats, away_stats)
         """
         print(f"\n🔎 _get_real_team_stats CHAMADO para: {match.get('home_team')} vs {match.get('away_team')}")
@@ -301,20 +712,25 @@ class BettingAgent:
         away_stats_real = None
         
         if home_team_id and away_team_id and league_id:
-            # Temporada atual (2024 porque a temporada europeia 2024/25 usa 2024)
-            current_season = 2024
+            current_season = self._match_season(match)
             
             print(f"   🔍 Buscando stats reais: {match['home_team']} vs {match['away_team']}")
             
-            # Busca estatísticas do time mandante
-            home_api_stats = self.api_football.get_team_statistics(home_team_id, league_id, current_season)
-            # Busca forma recente do mandante
-            home_form = self.api_football.get_team_form(home_team_id, 5)
-            
-            # Busca estatísticas do time visitante
-            away_api_stats = self.api_football.get_team_statistics(away_team_id, league_id, current_season)
-            # Busca forma recente do visitante
-            away_form = self.api_football.get_team_form(away_team_id, 5)
+            if prefetched is not None:
+                home_api_stats = prefetched['stats'].get((home_team_id, league_id, current_season))
+                home_form = prefetched['form'].get(home_team_id, [])
+                away_api_stats = prefetched['stats'].get((away_team_id, league_id, current_season))
+                away_form = prefetched['form'].get(away_team_id, [])
+            else:
+                # Busca estatísticas do time mandante
+                home_api_stats = self.api_football.get_team_statistics(home_team_id, league_id, current_season)
+                # Busca forma recente do mandante
+                home_form = self.api_football.get_team_form(home_team_id, 5)
+                
+                # Busca estatísticas do time visitante
+                away_api_stats = self.api_football.get_team_statistics(away_team_id, league_id, current_season)
+                # Busca forma recente do visitante
+                away_form = self.api_football.get_team_form(away_team_id, 5)
             
             # Se conseguiu dados reais, usa eles
             if home_api_stats and away_api_stats:
@@ -403,9 +819,51 @@ class BettingAgent:
         
         return home_lambda, away_lambda
     
+    # Mercados de resultado (chave do OddsAPI -> nome na sugestão); totais e handicaps têm linha
+    RESULT_MARKETS = {
+        'btts_yes': 'BTTS (Ambas Marcam)',
+        'btts_no': 'BTTS Não',
+        'home_win': 'Vitória Mandante',
+        'draw': 'Empate',
+        'away_win': 'Vitória Visitante',
+        'double_chance_1x': 'Dupla Chance 1X',
+        'double_chance_12': 'Dupla Chance 12',
+        'double_chance_x2': 'Dupla Chance X2',
+        'dnb_home': 'Empate Anula (Mandante)',
+        'dnb_away': 'Empate Anula (Visitante)',
+    }
+    
+    @classmethod
+    def _market_name(cls, key: str) -> Optional[str]:
+        """Nome do mercado na sugestão ('Over 2.5', 'Handicap -1.0'...); None se não é precificado"""
+        if key in cls.RESULT_MARKETS:
+            return cls.RESULT_MARKETS[key]
+        
+        prefix, _, line_str = key.rpartition('_')
+        try:
+            line = float(line_str)
+        except ValueError:
+            return None
+        
+        if prefix == 'over':
+            return f'Over {line}'
+        if prefix == 'under':
+            return f'Under {line}'
+        if prefix in ('spread', 'spread_away'):
+            if line == 0:
+                line_str = "0.0"
+            else:
+                line_str = f"{line:+.2f}" if (line * 4) % 2 == 1 else f"{line:+.1f}"  # Linhas de quarto: -0.25
+            return f'Handicap {line_str}' if prefix == 'spread' else f'Handicap Visitante {line_str}'
+        return None
+    
     def _analyze_match_markets(self, match: Dict, odds: Dict, phase_info: Dict, 
                                home_stats: Dict, away_stats: Dict) -> List[Dict]:
-        """Analisa mercados disponíveis do jogo"""
+        """
+        Analisa mercados disponíveis do jogo
+        Uma matriz de placares (ScoreMatrix) por jogo precifica todos os mercados:
+        totais (todas as linhas), BTTS, 1X2, dupla chance, empate anula e handicaps
+        """
         opportunities = []
         markets = odds.get('markets', {})
         
@@ -421,227 +879,37 @@ class BettingAgent:
             print(f"   📊 Home: {home_stats['avg_scored']:.2f} gols/jogo | Away: {away_stats['avg_scored']:.2f} gols/jogo")
             print(f"   📊 EV mínimo exigido: {phase_info['min_ev']}%")
         
-        # 1. Over 2.5
-        if 'over_2.5' in markets:
-            opp = self._analyze_over(match, odds, home_stats, away_stats, 2.5, markets['over_2.5'], phase_info)
-            if opp:
-                opportunities.append(opp)
-                if should_debug:
-                    print(f"   ✅ Over 2.5 @ {markets['over_2.5']} - EV: {opp['ev']:.1f}% - Prob: {opp['probability']*100:.1f}%")
-            elif should_debug:
-                # Calcula manualmente para debug
-                probs = self.probability_model.calculate_over_under(home_stats['avg_scored'], away_stats['avg_scored'], 2.5)
-                is_valid, ev = self.probability_model.validate_opportunity(probs['prob_over'], markets['over_2.5'], phase_info['min_ev'])
-                print(f"   ❌ Over 2.5 @ {markets['over_2.5']} - EV: {ev:.1f}% - Prob: {probs['prob_over']*100:.1f}%")
-        
-        # 2. Under 2.5
-        if 'under_2.5' in markets:
-            opp = self._analyze_under(match, odds, home_stats, away_stats, 2.5, markets['under_2.5'], phase_info)
-            if opp:
-                opportunities.append(opp)
-                if should_debug:
-                    print(f"   ✅ Under 2.5 @ {markets['under_2.5']} - EV: {opp['ev']:.1f}% - Prob: {opp['probability']*100:.1f}%")
-            elif should_debug:
-                probs = self.probability_model.calculate_over_under(home_stats['avg_scored'], away_stats['avg_scored'], 2.5)
-                is_valid, ev = self.probability_model.validate_opportunity(probs['prob_under'], markets['under_2.5'], phase_info['min_ev'])
-                print(f"   ❌ Under 2.5 @ {markets['under_2.5']} - EV: {ev:.1f}% - Prob: {probs['prob_under']*100:.1f}%")
-        
-        # 3. Handicaps
-        handicap_count = 0
-        for spread_key in markets.keys():
-            if spread_key.startswith('spread_'):
-                parts = spread_key.split('_')
-                if len(parts) >= 2:
-                    try:
-                        handicap = float(parts[1])
-                        opp = self._analyze_handicap(match, odds, home_stats, away_stats, handicap, markets[spread_key], phase_info)
-                        if opp:
-                            opportunities.append(opp)
-                            if should_debug and handicap_count < 2:
-                                print(f"   ✅ Handicap {handicap:+.1f} @ {markets[spread_key]} - EV: {opp['ev']:.1f}%")
-                                handicap_count += 1
-                    except ValueError:
-                        continue
-        
-        # 4. BTTS (se disponível)
-        if 'btts_yes' in markets:
-            opp = self._analyze_btts(match, odds, home_stats, away_stats, markets['btts_yes'], phase_info)
-            if opp:
-                opportunities.append(opp)
-                if should_debug:
-                    print(f"   ✅ BTTS @ {markets['btts_yes']} - EV: {opp['ev']:.1f}%")
-        
-        return opportunities
-    
-    def _analyze_over(self, match: Dict, odds: Dict, home_stats: Dict, 
-                     away_stats: Dict, line: float, market_odds: float, 
-                     phase_info: Dict) -> Dict:
-        """Analisa oportunidade de Over usando lambdas"""
-        
-        # Calcula lambdas (ataque vs defesa)
+        # Lambdas (ataque vs defesa) e matriz calculados uma vez para o jogo
         home_lambda, away_lambda = self._expected_goals(home_stats, away_stats)
+        score_matrix = self.probability_model.score_matrix(home_lambda, away_lambda)
         
-        # Calcula probabilidades usando lambdas
-        probs = self.probability_model.calculate_over_under(home_lambda, away_lambda, line)
-        
-        is_valid, ev = self.probability_model.validate_opportunity(
-            probs['prob_over'], 
-            market_odds, 
-            phase_info['min_ev']
-        )
-        
-        if not is_valid:
-            return None
-        
-        stake = self.bankroll_manager.calculate_stake(
-            probs['prob_over'], 
-            market_odds, 
-            ev
-        )
-        
-        # Aplica ajuste de risco
-        stake_adjustment = self.risk_manager.get_stake_adjustment()
-        stake = stake * stake_adjustment
-        
-        return {
-            'match': f"{match['home_team']} x {match['away_team']}",
-            'competition': match.get('competition', 'N/A'),
-            'date': match['date'],
-            'market': f'Over {line}',
-            'odds': market_odds,
-            'probability': probs['prob_over'],
-            'ev': ev,
-            'stake': round(stake, 2),
-            'potential_return': round(stake * market_odds, 2),
-            'phase': phase_info['phase']
-        }
-    
-    def _analyze_under(self, match: Dict, odds: Dict, home_stats: Dict, 
-                      away_stats: Dict, line: float, market_odds: float, 
-                      phase_info: Dict) -> Dict:
-        """Analisa oportunidade de Under usando lambdas"""
-        
-        # Calcula lambdas (ataque vs defesa)
-        home_lambda, away_lambda = self._expected_goals(home_stats, away_stats)
-        
-        # Calcula probabilidades usando lambdas
-        probs = self.probability_model.calculate_over_under(home_lambda, away_lambda, line)
-        
-        # Usa probabilidade de UNDER
-        is_valid, ev = self.probability_model.validate_opportunity(
-            probs['prob_under'], 
-            market_odds, 
-            phase_info['min_ev']
-        )
-        
-        if not is_valid:
-            return None
-        
-        stake = self.bankroll_manager.calculate_stake(
-            probs['prob_under'], 
-            market_odds, 
-            ev
-        )
-        
-        # Aplica ajuste de risco
-        stake_adjustment = self.risk_manager.get_stake_adjustment()
-        stake = stake * stake_adjustment
-        
-        return {
-            'match': f"{match['home_team']} x {match['away_team']}",
-            'competition': match.get('competition', 'N/A'),
-            'date': match['date'],
-            'market': f'Under {line}',
-            'odds': market_odds,
-            'probability': probs['prob_under'],
-            'ev': ev,
-            'stake': round(stake, 2),
-            'potential_return': round(stake * market_odds, 2),
-            'phase': phase_info['phase']
-        }
-    
-    def _analyze_handicap(self, match: Dict, odds: Dict, home_stats: Dict, 
-                         away_stats: Dict, line: float, market_odds: float, 
-                         phase_info: Dict) -> Dict:
-        """Analisa oportunidade de Handicap/Spread usando lambdas"""
-        
-        # Calcula lambdas (ataque vs defesa)
-        home_lambda, away_lambda = self._expected_goals(home_stats, away_stats)
-        
-        # Calcula probabilidades usando lambdas
-        probs = self.probability_model.calculate_handicap(home_lambda, away_lambda, line)
-        
-        is_valid, ev = self.probability_model.validate_opportunity(
-            probs['prob_home_cover'], 
-            market_odds, 
-            phase_info['min_ev']
-        )
-        
-        if not is_valid:
-            return None
-        
-        stake = self.bankroll_manager.calculate_stake(
-            probs['prob_home_cover'], 
-            market_odds, 
-            ev
-        )
-        
-        # Aplica ajuste de risco
-        stake_adjustment = self.risk_manager.get_stake_adjustment()
-        stake = stake * stake_adjustment
-        
-        line_str = f"{line:+.1f}" if line != 0 else "0.0"
-        
-        return {
-            'match': f"{match['home_team']} x {match['away_team']}",
-            'competition': match.get('competition', 'N/A'),
-            'date': match['date'],
-            'market': f'Handicap {line_str}',
-            'odds': market_odds,
-            'probability': probs['prob_home_cover'],
-            'ev': ev,
-            'stake': round(stake, 2),
-            'potential_return': round(stake * market_odds, 2),
-            'phase': phase_info['phase']
-        }
-    
-    def _analyze_btts(self, match: Dict, odds: Dict, home_stats: Dict, 
-                     away_stats: Dict, market_odds: float, phase_info: Dict) -> Dict:
-        """Analisa oportunidade de BTTS (Both Teams To Score) usando lambdas"""
-        
-        # Calcula lambdas (ataque vs defesa)
-        home_lambda, away_lambda = self._expected_goals(home_stats, away_stats)
-        
-        # Calcula probabilidade de BTTS usando lambdas
-        prob_btts = self.probability_model.calculate_btts_from_lambdas(home_lambda, away_lambda)
-        
-        is_valid, ev = self.probability_model.validate_opportunity(
-            prob_btts, 
-            market_odds, 
-            phase_info['min_ev']
-        )
-        
-        if not is_valid:
-            return None
-        
-        stake = self.bankroll_manager.calculate_stake(prob_btts, market_odds, ev)
-        
-        # Aplica ajuste de risco
-        stake_adjustment = self.risk_manager.get_stake_adjustment()
-        stake = stake * stake_adjustment
+        handicap_count = 0
+        for key, market_odds in markets.items():
+            market = self._market_name(key)
+            prob = score_matrix.probability(key, market_odds) if market else None
+            if prob is None:
+                continue
+            
+            is_valid, ev = self.probability_model.validate_opportunity(prob, market_odds, phase_info['min_ev'])
+            
+            if is_valid:
+                opportunities.append({
+                    'match': f"{match['home_team']} x {match['away_team']}",
+                    'competition': match.get('competition', 'N/A'),
+                    'date': match['date'],
+                    'market': market,
+                    'odds': market_odds,
+                    'probability': prob,
+                    'ev': ev
+                })
+                is_handicap = key.startswith('spread')
+                if should_debug and (not is_handicap or handicap_count < 2):
+                    handicap_count += 1 if is_handicap else 0
+                    print(f"   ✅ {market} @ {market_odds} - EV: {ev:.1f}% - Prob: {prob*100:.1f}%")
+            elif should_debug and key in ('over_2.5', 'under_2.5'):
+                print(f"   ❌ {market} @ {market_odds} - EV: {ev:.1f}% - Prob: {prob*100:.1f}%")
         
-        return {
-            'match': f"{match['home_team']} x {match['away_team']}",
-            'competition': match.get('competition', 'N/A'),
-            'date': match['date'],
-            'market': 'BTTS (Ambas Marcam)',
-            'odds': market_odds,
-            'probability': prob_btts,
-            'ev': ev,
-            'stake': round(stake, 2),
-            'potential_return': round(stake * market_odds, 2),
-            'phase': phase_info['phase']
-        }
+        return opportunities
     
     def register_bet(self, bet_data: Dict) -> str:
         """Registra aposta no histórico"""
@@ -739,14 +1007,25 @@ Stake máximo: {info['max_stake_pct']}%
             
             print(f"📊 Analisando {len(matches)} partidas de tênis...")
             
+            # Stats de todos os jogadores de uma vez (um lookup em lote por circuito)
+            players_by_tour = {}
+            for match in matches:
+                players = players_by_tour.setdefault(match.get('tour', 'ATP'), [])
+                players += [match.get('player1', 'Unknown'), match.get('player2', 'Unknown')]
+            
+            player_stats = {
+                tour: tennis_api.get_players_stats_from_ranking(players, tour)
+                for tour, players in players_by_tour.items()
+            }
+            
             for match in matches:
                 player1_name = match.get('player1', 'Unknown')
                 player2_name = match.get('player2', 'Unknown')
                 tour = match.get('tour', 'ATP')
                 
-                # Busca stats dos jogadores
-                player1_stats = tennis_api.get_player_stats_from_ranking(player1_name, tour)
-                player2_stats = tennis_api.get_player_stats_from_ranking(player2_name, tour)
+                # Stats dos jogadores
+                player1_stats = player_stats[tour][player1_name]
+                player2_stats = player_stats[tour][player2_name]
                 
                 # Calcula probabilidade
                 prob = tennis_model.calculate_match_winner(
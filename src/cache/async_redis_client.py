@@ -0,0 +1,331 @@
+import asyncio
+import os
+import time
+import uuid
+from typing import Any, Dict, Iterable, Optional, Tuple
+import redis.asyncio as aioredis
+from config.config import Config
+from src.cache.local_cache import LocalTTLCache
+from src.cache.negative_cache import NegativeCache
+from src.cache.redis_client import RedisCache
+from src.cache.sqlite_fallback import SQLiteFallbackCache
+
+
+class AsyncRedisCache:
+    """
+    Cliente Redis assíncrono (redis.asyncio) com a mesma interface do RedisCache
+
+    Mesmo formato de valores (RedisCache._encode/_decode), então sync e async
+    leem e escrevem as mesmas chaves. Um client (pool) por event loop,
+    compartilhado entre instâncias; a conexão é testada no primeiro uso.
+    Usa o mesmo cache local do processo (LocalTTLCache) na frente do Redis e
+    o mesmo fallback SQLite quando o Redis está fora (acessado em thread).
+    """
+
+    _clients: Dict[int, aioredis.Redis] = {}
+    # Saúde por event loop: {loop_id: (disponível, monotonic do último teste)}
+    _health: Dict[int, Tuple[bool, float]] = {}
+
+    def __init__(self):
+        self.local = LocalTTLCache.shared()
+        self.fallback = SQLiteFallbackCache.shared()
+        # Leitura/escrita no fallback reaproveitam o cliente sync (não abre conexão com o Redis)
+        self._sync = RedisCache()
+
+    @property
+    def client(self) -> aioredis.Redis:
+        loop_id = id(asyncio.get_running_loop())
+        client = AsyncRedisCache._clients.get(loop_id)
+        if client is None:
+            client = aioredis.Redis(
+                host=os.getenv('REDIS_HOST', 'localhost'),
+                port=int(os.getenv('REDIS_PORT', 6379)),
+                db=0,
+                decode_responses=False,
+                socket_connect_timeout=2,
+                socket_timeout=Config.REDIS_SOCKET_TIMEOUT,
+                max_connections=Config.REDIS_MAX_CONNECTIONS
+            )
+            AsyncRedisCache._clients[loop_id] = client
+        return client
+
+    @property
+    def enabled(self) -> Optional[bool]:
+        """None enquanto a conexão não foi testada neste event loop"""
+        health = AsyncRedisCache._health.get(id(asyncio.get_running_loop()))
+        return health[0] if health else None
+
+    async def is_enabled(self) -> bool:
+        """
+        Redis disponível? Ping no primeiro uso do event loop e,
+        se estiver fora, novo ping a cada REDIS_RETRY_INTERVAL segundos
+        """
+        loop_id = id(asyncio.get_running_loop())
+        health = AsyncRedisCache._health.get(loop_id)
+
+        if health and (health[0] or time.monotonic() - health[1] < Config.REDIS_RETRY_INTERVAL):
+            return health[0]
+
+        try:
+            await self.client.ping()
+            healthy = True
+        except Exception:
+            healthy = False
+
+        AsyncRedisCache._health[loop_id] = (healthy, time.monotonic())
+        if healthy:
+            self.local.start_invalidation_listener()
+            await self._resync_fallback()
+        return healthy
+
+    async def _resync_fallback(self) -> int:
+        """Redis voltou: reenvia o fallback com o TTL restante (SET NX, como no RedisCache)"""
+        if not self.fallback or not await asyncio.to_thread(self.fallback.has_pending):
+            return 0
+
+        synced = 0
+        try:
+            while True:
+                batch = await asyncio.to_thread(self.fallback.pending, RedisCache.SCAN_BATCH)
+                if not batch:
+                    break
+                pipe = self.client.pipeline(transaction=False)
+                for key, data, ttl_ms, tags in batch:
+                    pipe.set(key, data, px=ttl_ms, nx=True)
+                    RedisCache._tag_commands(pipe, key, tags)
+                await pipe.execute()
+                if not await asyncio.to_thread(self.fallback.mark_synced, [key for key, *_ in batch]):
+                    break
+                synced += len(batch)
+        except (aioredis.ConnectionError, aioredis.TimeoutError):
+            self._mark_down()
+
+        await asyncio.to_thread(self.fallback.purge_expired)
+        if synced:
+            print(f"🔄 Redis de volta: {synced} entradas do cache local (SQLite) reenviadas")
+        return synced
+
+    def _mark_down(self):
+        """Erro de conexão durante uma operação: desativa até o próximo re-probe"""
+        AsyncRedisCache._health[id(asyncio.get_running_loop())] = (False, time.monotonic())
+
+    @classmethod
+    def connection_stats(cls) -> Dict[str, Any]:
+        """Saúde e conexões do pool de cada event loop"""
+        now = time.monotonic()
+        stats = {}
+        for loop_id, client in list(cls._clients.items()):
+            health = cls._health.get(loop_id)
+            stats[str(loop_id)] = {
+                "healthy": health[0] if health else None,
+                "seconds_since_check": round(now - health[1], 1) if health else None,
+                **RedisCache.pool_usage(client.connection_pool),
+            }
+        return stats
+
+    async def get(self, key: str) -> Optional[Any]:
+        return (await self.get_with_ttl(key))[0]
+
+    async def get_with_ttl(self, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        """Valor e segundos restantes de TTL no Redis (None se sem TTL/desconhecido)"""
+        value, remaining = self.local.get_with_ttl(key, LocalTTLCache._MISSING)
+        if value is not LocalTTLCache._MISSING:
+            RedisCache._count(key, hits=1, local_hits=1)
+            return value, remaining
+
+        if not await self.is_enabled():
+            return await asyncio.to_thread(self._sync._fallback_get, key)
+
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.get(key)
+            pipe.pttl(key)
+            data, pttl = await pipe.execute()
+            value = RedisCache._decode(data)
+        except (aioredis.ConnectionError, aioredis.TimeoutError):
+            self._mark_down()
+            return await asyncio.to_thread(self._sync._fallback_get, key)
+        except Exception:
+            RedisCache._count(key, misses=1)
+            return None, None
+
+        remaining = pttl / 1000 if pttl and pttl > 0 else None
+        if value is not None:
+            RedisCache._count(key, hits=1, bytes_read=len(data))
+            self.local.set(key, value, remaining)
+        else:
+            RedisCache._count(key, misses=1)
+
+        return value, remaining
+
+    async def set(self, key: str, value: Any, expire_seconds: int = 3600, tags: Optional[Iterable[str]] = None):
+        self.local.set(key, value, expire_seconds)
+
+        if not await self.is_enabled():
+            await asyncio.to_thread(self._sync._fallback_set, {key: value}, expire_seconds, tags)
+            return
+
+        try:
+            data = RedisCache._encode(value)
+            pipe = self.client.pipeline(transaction=False)
+            pipe.setex(key, expire_seconds, data)
+            RedisCache._tag_commands(pipe, key, tags)
+            if Config.LOCAL_CACHE_INVALIDATION:
+                pipe.publish(LocalTTLCache.INVALIDATION_CHANNEL, LocalTTLCache.invalidation_message(key))
+            await pipe.execute()
+            RedisCache._count(key, writes=1, bytes_written=len(data))
+        except (aioredis.ConnectionError, aioredis.TimeoutError):
+            self._mark_down()
+            await asyncio.to_thread(self._sync._fallback_set, {key: value}, expire_seconds, tags)
+        except Exception:
+            pass
+
+    async def set_negative(self, key: str, error: Optional[BaseException] = None,
+                           tags: Optional[Iterable[str]] = None):
+        """Entrada negativa com TTL curto (mesma regra do RedisCache.set_negative)"""
+        entry = NegativeCache.entry(error)
+        ttl = NegativeCache.ttl(entry)
+        if ttl <= 0:
+            return
+
+        if error is None:
+            await self.set(key, entry, ttl, tags)
+            return
+
+        if not await self.is_enabled():
+            if await self.get(key) is None:
+                await self.set(key, entry, ttl, tags)
+            return
+
+        try:
+            data = RedisCache._encode(entry)
+            pipe = self.client.pipeline(transaction=False)
+            pipe.set(key, data, ex=ttl, nx=True)
+            RedisCache._tag_commands(pipe, key, tags)
+            if (await pipe.execute())[0]:
+                self.local.set(key, entry, ttl)
+                RedisCache._count(key, writes=1, bytes_written=len(data))
+        except (aioredis.ConnectionError, aioredis.TimeoutError):
+            self._mark_down()
+        except Exception:
+            pass
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Vários valores de uma vez (local e depois MGET + PTTL em um pipeline)"""
+        found: Dict[str, Any] = {}
+        pending = []
+        for key in dict.fromkeys(keys):
+            value = self.local.get(key, LocalTTLCache._MISSING)
+            if value is LocalTTLCache._MISSING:
+                pending.append(key)
+            else:
+                found[key] = value
+                RedisCache._count(key, hits=1, local_hits=1)
+
+        if not pending:
+            return found
+
+        if not await self.is_enabled():
+            return await asyncio.to_thread(self._sync._fallback_get_many, pending, found)
+
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.mget(pending)
+            for key in pending:
+                pipe.pttl(key)
+            results = await pipe.execute()
+        except (aioredis.ConnectionError, aioredis.TimeoutError):
+            self._mark_down()
+            return await asyncio.to_thread(self._sync._fallback_get_many, pending, found)
+        except Exception:
+            return found
+
+        for key, data, pttl in zip(pending, results[0], results[1:]):
+            try:
+                value = RedisCache._decode(data)
+            except Exception:
+                value = None
+            if value is not None:
+                found[key] = value
+                RedisCache._count(key, hits=1, bytes_read=len(data))
+                self.local.set(key, value, pttl / 1000 if pttl and pttl > 0 else None)
+            else:
+                RedisCache._count(key, misses=1)
+
+        return found
+
+    async def set_many(self, mapping: Dict[str, Any], expire_seconds: int = 3600,
+                       tags: Optional[Iterable[str]] = None):
+        """Grava vários valores com o mesmo TTL (SETEX em pipeline)"""
+        if not mapping:
+            return
+
+        for key, value in mapping.items():
+            self.local.set(key, value, expire_seconds)
+
+        if not await self.is_enabled():
+            await asyncio.to_thread(self._sync._fallback_set, mapping, expire_seconds, tags)
+            return
+
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            written = []
+            for key, value in mapping.items():
+                data = RedisCache._encode(value)
+                written.append((key, len(data)))
+                pipe.setex(key, expire_seconds, data)
+                RedisCache._tag_commands(pipe, key, tags)
+                if Config.LOCAL_CACHE_INVALIDATION:
+                    pipe.publish(LocalTTLCache.INVALIDATION_CHANNEL, LocalTTLCache.invalidation_message(key))
+            await pipe.execute()
+            for key, size in written:
+                RedisCache._count(key, writes=1, bytes_written=size)
+        except (aioredis.ConnectionError, aioredis.TimeoutError):
+            self._mark_down()
+            await asyncio.to_thread(self._sync._fallback_set, mapping, expire_seconds, tags)
+        except Exception:
+            pass
+
+    async def acquire_lock(self, name: str, ttl_ms: int) -> Optional[str]:
+        """Tenta pegar lock curto (SET NX PX). Retorna token ou None se ocupado"""
+        if not await self.is_enabled():
+            return None
+
+        token = uuid.uuid4().hex
+        try:
+            if await self.client.set(name, token, nx=True, px=ttl_ms):
+                return token
+            return None
+        except Exception:
+            # Redis instável: segue sem coordenação entre workers
+            return token
+
+    async def release_lock(self, name: str, token: str):
+        if not await self.is_enabled():
+            return
+
+        try:
+            await self.client.eval(RedisCache._RELEASE_LOCK_SCRIPT, 1, name, token)
+        except Exception:
+            pass
+
+    async def lock_exists(self, name: str) -> bool:
+        if not await self.is_enabled():
+            return False
+
+        try:
+            return bool(await self.client.exists(name))
+        except Exception:
+            return False
+
+    @classmethod
+    async def close_all(cls):
+        """Fecha os clients (ex.: no shutdown do servidor)"""
+        clients = list(cls._clients.values())
+        cls._clients.clear()
+        cls._health.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception:
+                pass
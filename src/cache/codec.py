@@ -0,0 +1,121 @@
+import json
+import struct
+import zlib
+from typing import Any, Union
+from config.config import Config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class CacheCodec:
+    """
+    Envelope versionado para valores em cache (Redis e cache diário)
+
+    Cabeçalho de 5 bytes + payload:
+        magic   2 bytes  b"VB"
+        versão  1 byte   formato do envelope (ENVELOPE_VERSION)
+        codec   1 byte   0 = json, 1 = orjson, 2 = msgpack
+        flags   1 byte   bit 0 = payload comprimido com zlib
+
+    - Codec configurável (CACHE_CODEC); se a lib não estiver instalada, usa json
+    - Compressão zlib acima de CACHE_COMPRESS_MIN_BYTES (só se ficar menor)
+    - Valores sem o magic são lidos como JSON puro (entradas antigas)
+    """
+
+    MAGIC = b"VB"
+    ENVELOPE_VERSION = 1
+    HEADER = struct.Struct(">2sBBB")
+
+    JSON = 0
+    ORJSON = 1
+    MSGPACK = 2
+
+    FLAG_ZLIB = 0x01
+
+    _NAMES = {'json': JSON, 'orjson': ORJSON, 'msgpack': MSGPACK}
+    _warned = False
+
+    @classmethod
+    def _default_codec(cls) -> int:
+        codec = cls._NAMES.get(Config.CACHE_CODEC, cls.ORJSON)
+
+        if (codec == cls.ORJSON and orjson is None) or (codec == cls.MSGPACK and msgpack is None):
+            if not cls._warned:
+                cls._warned = True
+                print(f"⚠️ Codec de cache '{Config.CACHE_CODEC}' indisponível, usando json")
+            return cls.JSON
+
+        return codec
+
+    @staticmethod
+    def _default(value: Any) -> Any:
+        """Tipos que o json.dumps aceitava (ex.: numpy.float64 das probabilidades)"""
+        if hasattr(value, 'item'):
+            return value.item()
+        if isinstance(value, (set, tuple)):
+            return list(value)
+        raise TypeError(f"Tipo não serializável no cache: {type(value).__name__}")
+
+    @classmethod
+    def encode(cls, value: Any, codec: int = None) -> bytes:
+        """Serializa valor no envelope (codec padrão do Config)"""
+        codec = cls._default_codec() if codec is None else codec
+
+        if codec == cls.ORJSON:
+            # Chaves int viram str, como no json.dumps
+            payload = orjson.dumps(value, default=cls._default, option=orjson.OPT_NON_STR_KEYS)
+        elif codec == cls.MSGPACK:
+            payload = msgpack.packb(value, use_bin_type=True, default=cls._default)
+        else:
+            payload = json.dumps(value, separators=(',', ':')).encode()
+
+        flags = 0
+        if len(payload) >= Config.CACHE_COMPRESS_MIN_BYTES:
+            compressed = zlib.compress(payload, Config.CACHE_COMPRESSION_LEVEL)
+            if len(compressed) < len(payload):
+                payload = compressed
+                flags |= cls.FLAG_ZLIB
+
+        return cls.HEADER.pack(cls.MAGIC, cls.ENVELOPE_VERSION, codec, flags) + payload
+
+    @classmethod
+    def decode(cls, data: Union[bytes, str, None]) -> Any:
+        """Desserializa envelope ou JSON antigo. None/vazio -> None"""
+        if not data:
+            return None
+
+        if isinstance(data, str):
+            # Entrada antiga gravada como texto
+            return json.loads(data)
+
+        if not data.startswith(cls.MAGIC) or len(data) < cls.HEADER.size:
+            return json.loads(data)
+
+        _, version, codec, flags = cls.HEADER.unpack_from(data)
+        if version != cls.ENVELOPE_VERSION:
+            raise ValueError(f"Versão de envelope de cache desconhecida: {version}")
+
+        payload = memoryview(data)[cls.HEADER.size:]
+        if flags & cls.FLAG_ZLIB:
+            payload = zlib.decompress(payload)
+
+        if codec == cls.ORJSON:
+            if orjson is None:
+                return json.loads(bytes(payload))
+            return orjson.loads(payload)
+        if codec == cls.MSGPACK:
+            if msgpack is None:
+                raise ValueError("Entrada de cache em msgpack, mas msgpack não está instalado")
+            return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+        if codec == cls.JSON:
+            return json.loads(bytes(payload))
+
+        raise ValueError(f"Codec de cache desconhecido: {codec}")
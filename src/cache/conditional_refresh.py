@@ -0,0 +1,183 @@
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from src.cache.negative_cache import NegativeCache
+from src.utils.http_client import HttpClient
+from src.utils.async_http_client import AsyncHttpClient
+
+
+class ConditionalRefresh:
+    """
+    Refresh condicional de payloads grandes (fixtures, odds)
+
+    Guarda junto de cada chave de cache um registro "validator:{chave}" só com
+    ETag/Last-Modified, hash do corpo bruto e hash de cada jogo (match_id).
+    O resultado formatado fica apenas na própria chave de dados. Quando o TTL expira:
+
+    - 304 Not Modified      -> reutiliza o resultado que está na chave de dados
+    - corpo com mesmo hash  -> idem (sem json/format)
+    - corpo diferente       -> formata e informa quais match_ids mudaram
+
+    Sem a chave de dados (expirou ou foi limpa) a busca vai sem headers
+    condicionais e sem atalho de hash: a resposta é sempre formatada de novo.
+    O hash cobre só o corpo bruto: o registro leva a versão do formatador
+    (format_version) e registros de outra versão são ignorados.
+    """
+
+    def __init__(self, cache, format_version: int = 1):
+        self.cache = cache
+        self.format_version = format_version
+        self._changes: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def fetch(self, cache_key: str, url: str, parse: Callable[[Any], List[Dict]],
+              params: Optional[Dict] = None, headers: Optional[Dict] = None, *, ttl: int,
+              **http_kwargs) -> Tuple[List[Dict], Dict[str, Any]]:
+        """
+        Faz o GET condicional e retorna (dados formatados, mudanças)
+        parse recebe o JSON da resposta e devolve a lista formatada (com match_id)
+        ttl: o mesmo da chave de dados (o registro não vale sem ela)
+        Levanta erro HTTP como HttpClient/raise_for_status
+        """
+        validator_key = f"validator:{cache_key}"
+        record = self._current(self.cache.get(validator_key))
+        cached = NegativeCache.unwrap(self.cache.get(cache_key)) if record else None
+
+        response = HttpClient.get(
+            url, params=params, headers=self._request_headers(record if cached else None, headers), **http_kwargs
+        )
+
+        data, changes, new_record = self._process(record, cached, response, parse)
+        if new_record:
+            self.cache.set(validator_key, new_record, expire_seconds=ttl)
+        self._remember(cache_key, changes)
+
+        return data, changes
+
+    def _current(self, record: Optional[Dict]) -> Optional[Dict]:
+        """Registro salvo, se foi gravado pela mesma versão do formatador"""
+        if record and record.get('format_version') == self.format_version:
+            return record
+        return None
+
+    @staticmethod
+    def _request_headers(record: Optional[Dict], headers: Optional[Dict]) -> Dict:
+        """Headers da requisição com os validadores salvos (If-None-Match/If-Modified-Since)"""
+        request_headers = dict(headers or {})
+        if record:
+            if record.get('etag'):
+                request_headers['If-None-Match'] = record['etag']
+            if record.get('last_modified'):
+                request_headers['If-Modified-Since'] = record['last_modified']
+        return request_headers
+
+    def _process(self, record: Optional[Dict], cached: Optional[List[Dict]], response,
+                 parse: Callable[[Any], List[Dict]]) -> Tuple[List[Dict], Dict[str, Any], Optional[Dict]]:
+        """
+        Interpreta a resposta (requests ou httpx) contra o registro salvo
+        cached: resultado atual da chave de dados (None se não há: sem atalhos)
+        Retorna (dados, mudanças, novo registro a salvar ou None)
+        """
+        if response.status_code == 304 and record and cached:
+            return cached, self._unchanged(record, reason='not_modified'), None
+
+        response.raise_for_status()
+
+        content_hash = hashlib.sha1(response.content or b"").hexdigest()
+
+        if record and cached and record.get('content_hash') == content_hash:
+            changes = self._unchanged(record, reason='same_content')
+            return cached, changes, self._record(response, content_hash, record.get('item_hashes', {}))
+
+        data = parse(response.json())
+        item_hashes = {
+            str(item.get('match_id')): self.item_hash(item)
+            for item in data
+            if item.get('match_id') is not None
+        }
+        changes = self._diff(record.get('item_hashes', {}) if record else None, item_hashes)
+
+        return data, changes, self._record(response, content_hash, item_hashes)
+
+    def get_changes(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Mudanças do último refresh desta chave (neste processo)"""
+        with self._lock:
+            return self._changes.get(cache_key)
+
+    @staticmethod
+    def item_hash(item: Dict) -> str:
+        """Hash de um jogo formatado (o mesmo do diff; o agente guarda no snapshot)"""
+        return hashlib.sha1(json.dumps(item, sort_keys=True, default=str).encode()).hexdigest()
+
+    @staticmethod
+    def _unchanged(record: Dict, reason: str) -> Dict[str, Any]:
+        return {
+            'modified': False,
+            'reason': reason,
+            'added': [],
+            'changed': [],
+            'removed': [],
+            'unchanged': list(record.get('item_hashes', {}).keys()),
+        }
+
+    @staticmethod
+    def _diff(old_hashes: Optional[Dict[str, str]], new_hashes: Dict[str, str]) -> Dict[str, Any]:
+        if old_hashes is None:
+            return {
+                'modified': True,
+                'reason': 'first_fetch',
+                'added': list(new_hashes.keys()),
+                'changed': [],
+                'removed': [],
+                'unchanged': [],
+            }
+
+        added = [mid for mid in new_hashes if mid not in old_hashes]
+        removed = [mid for mid in old_hashes if mid not in new_hashes]
+        changed = [mid for mid, h in new_hashes.items() if mid in old_hashes and old_hashes[mid] != h]
+        unchanged = [mid for mid, h in new_hashes.items() if old_hashes.get(mid) == h]
+
+        return {
+            'modified': bool(added or removed or changed),
+            'reason': 'content_changed',
+            'added': added,
+            'changed': changed,
+            'removed': removed,
+            'unchanged': unchanged,
+        }
+
+    def _record(self, response, content_hash: str, item_hashes: Dict[str, str]) -> Dict:
+        return {
+            'format_version': self.format_version,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'content_hash': content_hash,
+            'item_hashes': item_hashes,
+        }
+
+    def _remember(self, cache_key: str, changes: Dict[str, Any]):
+        with self._lock:
+            self._changes[cache_key] = changes
+
+
+class AsyncConditionalRefresh(ConditionalRefresh):
+    """ConditionalRefresh com AsyncHttpClient e AsyncRedisCache (mesmo registro de validadores)"""
+
+    async def fetch(self, cache_key: str, url: str, parse: Callable[[Any], List[Dict]],
+                    params: Optional[Dict] = None, headers: Optional[Dict] = None, *, ttl: int,
+                    **http_kwargs) -> Tuple[List[Dict], Dict[str, Any]]:
+        validator_key = f"validator:{cache_key}"
+        record = self._current(await self.cache.get(validator_key))
+        cached = NegativeCache.unwrap(await self.cache.get(cache_key)) if record else None
+
+        response = await AsyncHttpClient.get(
+            url, params=params, headers=self._request_headers(record if cached else None, headers), **http_kwargs
+        )
+
+        data, changes, new_record = self._process(record, cached, response, parse)
+        if new_record:
+            await self.cache.set(validator_key, new_record, expire_seconds=ttl)
+        self._remember(cache_key, changes)
+
+        return data, changes
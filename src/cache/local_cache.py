@@ -0,0 +1,169 @@
+import os
+import threading
+import time
+import uuid
+import redis
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from config.config import Config
+
+
+class LocalTTLCache:
+    """
+    Cache em memória do processo (LRU limitado + TTL por entrada)
+
+    Fica na frente do Redis: leitura local -> Redis -> provedor.
+    Os valores são os mesmos objetos para todos os chamadores: trate-os
+    como somente leitura (copie antes de alterar).
+    """
+
+    _MISSING = object()
+
+    # Instância compartilhada pelo processo (RedisCache e AsyncRedisCache)
+    _shared: Optional["LocalTTLCache"] = None
+    _shared_lock = threading.Lock()
+
+    # Identifica este processo nas mensagens de invalidação
+    PROCESS_ID = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+    INVALIDATION_CHANNEL = "cache:invalidate"
+
+    def __init__(self, max_entries: int, max_ttl: float):
+        self.max_entries = max_entries
+        self.max_ttl = max_ttl
+        # {chave: (expira localmente em, valor, expira na origem em)}
+        self._data: "OrderedDict[str, Tuple[float, Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0, "invalidations": 0}
+        self._subscriber = None
+        self._listener_attempted = False
+
+    @classmethod
+    def shared(cls) -> "LocalTTLCache":
+        """Cache local do processo (criado no primeiro uso)"""
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls(Config.LOCAL_CACHE_MAX_ENTRIES, Config.LOCAL_CACHE_TTL)
+        return cls._shared
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.get_with_ttl(key, default)[0]
+
+    def get_with_ttl(self, key: str, default: Any = None) -> Tuple[Any, Optional[float]]:
+        """
+        Valor e segundos restantes do TTL de origem (o do Redis, não o local)
+        Usado pelo stale-while-revalidate para saber a idade da entrada
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return default, None
+
+            now = time.monotonic()
+            expires_at, value, origin_expires_at = entry
+            if expires_at <= now:
+                del self._data[key]
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return default, None
+
+            self._data.move_to_end(key)
+            self._stats["hits"] += 1
+            return value, origin_expires_at - now
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Guarda por min(ttl, max_ttl) segundos (ttl é o TTL de origem)"""
+        origin_ttl = self.max_ttl if ttl is None else ttl
+        ttl = min(origin_ttl, self.max_ttl)
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            self._data[key] = (now + ttl, value, now + origin_ttl)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_many(self, keys):
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self._lock:
+            keys = [key for key in self._data if key.startswith(prefix)]
+            for key in keys:
+                del self._data[key]
+        return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "entries": len(self._data),
+                "max_entries": self.max_entries,
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+                "invalidation_listener": self._subscriber is not None,
+            }
+
+    # =========================
+    # 🔹 INVALIDAÇÃO ENTRE WORKERS (Redis pub/sub)
+    # =========================
+    @classmethod
+    def invalidation_message(cls, key: str) -> str:
+        """Chave terminada em * invalida o prefixo inteiro"""
+        return f"{cls.PROCESS_ID}|{key}"
+
+    def start_invalidation_listener(self):
+        """
+        Escuta cache:invalidate e remove as chaves alteradas por outros workers
+        (uma thread daemon por processo; só se LOCAL_CACHE_INVALIDATION=true)
+        """
+        if not Config.LOCAL_CACHE_INVALIDATION or self._listener_attempted:
+            return
+
+        with LocalTTLCache._shared_lock:
+            if self._listener_attempted:
+                return
+            self._listener_attempted = True
+            try:
+                client = redis.Redis(
+                    host=os.getenv('REDIS_HOST', 'localhost'),
+                    port=int(os.getenv('REDIS_PORT', 6379)),
+                    db=0,
+                    socket_connect_timeout=2
+                )
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(**{self.INVALIDATION_CHANNEL: self._on_invalidation})
+                self._subscriber = pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+            except Exception as e:
+                print(f"⚠️ Invalidação do cache local desativada: {e}")
+
+    def _on_invalidation(self, message: Dict):
+        data = message.get("data")
+        if isinstance(data, bytes):
+            data = data.decode()
+        sender, _, key = str(data).partition("|")
+
+        if sender == self.PROCESS_ID or not key:
+            return
+
+        if key.endswith("*"):
+            self.delete_prefix(key[:-1])
+        else:
+            self.delete(key)
+        with self._lock:
+            self._stats["invalidations"] += 1
@@ -0,0 +1,56 @@
+import time
+from typing import Any, Dict, Optional
+from config.config import Config
+
+
+class NegativeCache:
+    """
+    Entradas negativas do cache: "o provedor não tem dado" ou "a última busca falhou"
+
+    Um miss é None; uma entrada negativa é um dict marcado com MARKER, gravado
+    com TTL curto (NEGATIVE_CACHE_EMPTY_TTL / NEGATIVE_CACHE_ERROR_TTL).
+    Times sem estatísticas, ligas sem jogos e endpoints com erro deixam de ser
+    buscados de novo a cada execução. Quem lê converte com unwrap(valor, padrão).
+    """
+
+    MARKER = "__negative__"
+    EMPTY = "empty"
+    ERROR = "error"
+
+    @classmethod
+    def entry(cls, error: Optional[BaseException] = None) -> Dict[str, Any]:
+        """Entrada a gravar: vazia ou com a classe do erro"""
+        if error is None:
+            return {cls.MARKER: cls.EMPTY, "at": time.time()}
+        return {
+            cls.MARKER: cls.ERROR,
+            "error": type(error).__name__,
+            "message": str(error)[:200],
+            "at": time.time(),
+        }
+
+    @classmethod
+    def ttl(cls, entry: Dict[str, Any]) -> int:
+        if entry.get(cls.MARKER) == cls.ERROR:
+            return Config.NEGATIVE_CACHE_ERROR_TTL
+        return Config.NEGATIVE_CACHE_EMPTY_TTL
+
+    @classmethod
+    def is_negative(cls, value: Any) -> bool:
+        return isinstance(value, dict) and cls.MARKER in value
+
+    @classmethod
+    def is_error(cls, value: Any) -> bool:
+        return cls.is_negative(value) and value[cls.MARKER] == cls.ERROR
+
+    @classmethod
+    def unwrap(cls, value: Any, default: Any = None) -> Any:
+        """Valor do cache para o chamador: entrada negativa vira default"""
+        return default if cls.is_negative(value) else value
+
+    @classmethod
+    def describe(cls, value: Dict[str, Any]) -> str:
+        """Texto curto para logs ("vazio" ou "HTTPError")"""
+        if cls.is_error(value):
+            return value.get("error") or cls.ERROR
+        return "vazio"
@@ -1,44 +1,628 @@
 import redis
-import json
 import os
-from typing import Any, Optional
+import threading
+import time
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from config.config import Config
+from src.cache.codec import CacheCodec
+from src.cache.local_cache import LocalTTLCache
+from src.cache.negative_cache import NegativeCache
+from src.cache.sqlite_fallback import SQLiteFallbackCache
 
 class RedisCache:
-    """Cliente Redis para cache"""
+    """
+    Cliente Redis para cache
+    
+    Leitura em dois níveis: cache local do processo (LocalTTLCache) e depois Redis.
+    Escrita vai para os dois. Valores retornados são compartilhados: somente leitura.
+    
+    Conexões vêm de um pool único do processo; criar RedisCache não abre conexão.
+    A saúde do Redis é verificada no primeiro uso e guardada: se cair, as operações
+    usam o fallback SQLite local (SQLiteFallbackCache) e um novo ping só é feito a
+    cada REDIS_RETRY_INTERVAL segundos. Quando o Redis volta, o que foi gravado no
+    fallback é reenviado com o TTL restante.
+    
+    Chaves organizadas em namespaces (prefixos) e tags (ex.: league:39):
+    limpeza por SCAN + UNLINK, sem FLUSHDB, e contadores por namespace.
+    """
+    
+    # Namespace -> prefixos das chaves (ordem importa: o primeiro que casar)
+    NAMESPACES = {
+        'odds': ('odds:',),
+        'fixtures': ('api_football_fixtures_', 'matches:'),
+        'team_stats': ('api_football_team_stats_', 'api_football_team_form_', 'api_football_standings_',
+                       'api_football_h2h_', 'team_stats:'),
+        'tennis': ('tennis:',),
+        'nfl': ('nfl:',),
+        'validators': ('validator:',),
+        'team_aliases': ('team_alias:',),
+        'locks': ('lock:',),
+        'tags': ('tag:',),
+    }
+    # Fora do clear_all: só saem com clear_namespace explícito
+    # - locks: single-flight/SWR de workers rodando (sem eles, buscas duplicadas gastam cota)
+    # - validators: só ETag/Last-Modified e hashes; o resultado é relido da chave de dados
+    # - team_aliases: sem Postgres, o espelho no Redis é a única cópia persistente
+    PRESERVED_NAMESPACES = ('locks', 'validators', 'team_aliases')
+    TAG_PREFIX = "tag:"
+    SCAN_BATCH = 500
+    
+    # Estado compartilhado pelo processo
+    _pool: Optional[redis.ConnectionPool] = None
+    _client: Optional[redis.Redis] = None
+    _healthy: Optional[bool] = None     # None = ainda não testado
+    _checked_at = 0.0
+    _health = {"probes": 0, "probe_failures": 0, "marked_down": 0}
+    _lock = threading.Lock()
+    _probe_lock = threading.Lock()
+    
+    # Contadores por namespace: {namespace: {hits, local_hits, fallback_hits, misses, bytes_read, ...}}
+    _namespace_stats: Dict[str, Dict[str, int]] = {}
+    _stats_lock = threading.Lock()
     
     def __init__(self):
-        redis_host = os.getenv('REDIS_HOST', 'localhost')
-        redis_port = int(os.getenv('REDIS_PORT', 6379))
+        self.local = LocalTTLCache.shared()
+        self.fallback = SQLiteFallbackCache.shared()
+    
+    @classmethod
+    def _get_client(cls) -> redis.Redis:
+        """Client sobre o pool do processo (criado no primeiro uso)"""
+        if cls._client is None:
+            with cls._lock:
+                if cls._client is None:
+                    cls._pool = redis.BlockingConnectionPool(
+                        host=os.getenv('REDIS_HOST', 'localhost'),
+                        port=int(os.getenv('REDIS_PORT', 6379)),
+                        db=0,
+                        decode_responses=False,  # Valores são bytes (CacheCodec)
+                        socket_connect_timeout=2,
+                        socket_timeout=Config.REDIS_SOCKET_TIMEOUT,
+                        max_connections=Config.REDIS_MAX_CONNECTIONS,
+                        timeout=Config.REDIS_POOL_TIMEOUT,
+                    )
+                    cls._client = redis.Redis(connection_pool=cls._pool)
+        return cls._client
+    
+    @property
+    def client(self) -> redis.Redis:
+        return self._get_client()
+    
+    @property
+    def enabled(self) -> bool:
+        """Redis disponível? (ping só no primeiro uso e, se caiu, a cada REDIS_RETRY_INTERVAL)"""
+        cls = RedisCache
+        if not cls._needs_probe():
+            return cls._healthy
+        return cls._probe()
+    
+    @classmethod
+    def _needs_probe(cls) -> bool:
+        if cls._healthy is None:
+            return True
+        return cls._healthy is False and time.monotonic() - cls._checked_at >= Config.REDIS_RETRY_INTERVAL
+    
+    @classmethod
+    def _probe(cls) -> bool:
+        # Primeiro uso: espera o teste em andamento. Redis já fora: não espera, segue desativado
+        if not cls._probe_lock.acquire(blocking=cls._healthy is None):
+            return False
         
         try:
-            self.client = redis.Redis(
-                host=redis_host,
-                port=redis_port,
-                db=0,
-                decode_responses=True,
-                socket_connect_timeout=2
-            )
-            self.client.ping()
-            self.enabled = True
-        except:
-            self.enabled = False
-            self.client = None
+            # Outra thread pode ter acabado de testar
+            if not cls._needs_probe():
+                return cls._healthy
+            
+            try:
+                cls._get_client().ping()
+                healthy = True
+            except Exception:
+                healthy = False
+            
+            with cls._lock:
+                cls._health["probes"] += 1
+                if not healthy:
+                    cls._health["probe_failures"] += 1
+                was_healthy = cls._healthy
+                cls._healthy = healthy
+                cls._checked_at = time.monotonic()
+        finally:
+            cls._probe_lock.release()
+        
+        if healthy and was_healthy is not True:
+            LocalTTLCache.shared().start_invalidation_listener()
+            RedisCache()._resync_fallback()
+        
+        return healthy
+    
+    @classmethod
+    def _mark_down(cls):
+        """Erro de conexão durante uma operação: desativa até o próximo re-probe"""
+        with cls._lock:
+            if cls._healthy:
+                cls._health["marked_down"] += 1
+            cls._healthy = False
+            cls._checked_at = time.monotonic()
+    
+    @classmethod
+    def connection_stats(cls) -> Dict[str, Any]:
+        """Estado de saúde e uso do pool de conexões do processo"""
+        pool = cls._pool
+        stats: Dict[str, Any] = {
+            "healthy": cls._healthy,
+            "seconds_since_check": round(time.monotonic() - cls._checked_at, 1) if cls._checked_at else None,
+            **cls._health,
+        }
+        if pool is not None:
+            stats.update(cls.pool_usage(pool))
+        return stats
+    
+    @staticmethod
+    def pool_usage(pool) -> Dict[str, Any]:
+        """
+        Conexões criadas/ociosas/em uso de um pool do redis-py (sync ou asyncio)
+        Os contadores vêm de atributos internos, que mudam entre versões: sem eles
+        devolve só max_connections (o /metrics degrada em vez de quebrar)
+        """
+        usage: Dict[str, Any] = {"max_connections": getattr(pool, "max_connections", None)}
+        try:
+            available = getattr(pool, "_available_connections", None)
+            in_use = getattr(pool, "_in_use_connections", None)
+            if available is not None and in_use is not None:
+                idle, busy = len(available), len(in_use)
+            else:
+                # BlockingConnectionPool: fila com slots (None = conexão ainda não criada)
+                idle = sum(1 for conn in list(pool.pool.queue) if conn is not None)
+                busy = len(pool._connections) - idle
+        except Exception:
+            usage["connections"] = "indisponível nesta versão do redis-py"
+            return usage
+        
+        usage.update({"created_connections": idle + busy, "idle_connections": idle, "in_use_connections": busy})
+        return usage
+    
+    # =========================
+    # 🔹 NAMESPACES E CONTADORES
+    # =========================
+    @classmethod
+    def namespace_of(cls, key: str) -> str:
+        for namespace, prefixes in cls.NAMESPACES.items():
+            if key.startswith(prefixes):
+                return namespace
+        return 'other'
+    
+    @classmethod
+    def _count(cls, key: str, **increments: int):
+        """Soma contadores do namespace da chave (compartilhado com AsyncRedisCache)"""
+        namespace = cls.namespace_of(key)
+        with cls._stats_lock:
+            stats = cls._namespace_stats.get(namespace)
+            if stats is None:
+                stats = cls._namespace_stats[namespace] = dict.fromkeys(
+                    ('hits', 'local_hits', 'fallback_hits', 'misses', 'bytes_read', 'writes', 'bytes_written'), 0
+                )
+            for field, amount in increments.items():
+                stats[field] += amount
+    
+    @classmethod
+    def namespace_stats(cls) -> Dict[str, Dict[str, Any]]:
+        """Hits/misses/bytes por namespace desde o início do processo"""
+        with cls._stats_lock:
+            stats = {namespace: dict(counters) for namespace, counters in cls._namespace_stats.items()}
+        for counters in stats.values():
+            lookups = counters['hits'] + counters['misses']
+            counters['hit_rate'] = round(counters['hits'] / lookups, 3) if lookups else 0.0
+        return stats
+    
+    @classmethod
+    def _tag_commands(cls, pipe, key: str, tags: Optional[Iterable[str]]):
+        """Registra a chave nos conjuntos tag:{tag} (mesmo pipeline da escrita)"""
+        for tag in tags or ():
+            pipe.sadd(f"{cls.TAG_PREFIX}{tag}", key)
+            pipe.expire(f"{cls.TAG_PREFIX}{tag}", Config.CACHE_TAG_TTL)
     
     def get(self, key: str) -> Optional[Any]:
+        return self.get_with_ttl(key)[0]
+    
+    def get_with_ttl(self, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        """Valor e segundos restantes de TTL no Redis (None se sem TTL/desconhecido)"""
+        value, remaining = self.local.get_with_ttl(key, LocalTTLCache._MISSING)
+        if value is not LocalTTLCache._MISSING:
+            self._count(key, hits=1, local_hits=1)
+            return value, remaining
+        
         if not self.enabled:
-            return None
+            return self._fallback_get(key)
         
         try:
-            data = self.client.get(key)
-            return json.loads(data) if data else None
+            # GET + PTTL na mesma ida ao Redis: cópia local não vive mais que a do Redis
+            pipe = self.client.pipeline(transaction=False)
+            pipe.get(key)
+            pipe.pttl(key)
+            data, pttl = pipe.execute()
+            value = self._decode(data)
+        except (redis.ConnectionError, redis.TimeoutError):
+            self._mark_down()
+            return self._fallback_get(key)
         except:
+            self._count(key, misses=1)
+            return None, None
+        
+        remaining = pttl / 1000 if pttl and pttl > 0 else None
+        if value is not None:
+            self._count(key, hits=1, bytes_read=len(data))
+            self.local.set(key, value, remaining)
+        else:
+            self._count(key, misses=1)
+        
+        return value, remaining
+    
+    def set(self, key: str, value: Any, expire_seconds: int = 3600, tags: Optional[Iterable[str]] = None):
+        """Grava nos dois níveis; tags permitem invalidar em grupo (invalidate_tag)"""
+        self.local.set(key, value, expire_seconds)
+        
+        if not self.enabled:
+            self._fallback_set({key: value}, expire_seconds, tags)
+            return
+        
+        try:
+            data = self._encode(value)
+            pipe = self.client.pipeline(transaction=False)
+            pipe.setex(key, expire_seconds, data)
+            self._tag_commands(pipe, key, tags)
+            if Config.LOCAL_CACHE_INVALIDATION:
+                pipe.publish(LocalTTLCache.INVALIDATION_CHANNEL, LocalTTLCache.invalidation_message(key))
+            pipe.execute()
+            self._count(key, writes=1, bytes_written=len(data))
+        except (redis.ConnectionError, redis.TimeoutError):
+            self._mark_down()
+            self._fallback_set({key: value}, expire_seconds, tags)
+        except:
+            pass
+    
+    def set_negative(self, key: str, error: Optional[BaseException] = None, tags: Optional[Iterable[str]] = None):
+        """
+        Grava entrada negativa (NegativeCache) com TTL curto
+        Erro só é gravado se a chave não existe (SET NX): um refresh que falha
+        não apaga o valor antigo que ainda está sendo servido
+        """
+        entry = NegativeCache.entry(error)
+        ttl = NegativeCache.ttl(entry)
+        if ttl <= 0:
+            return
+        
+        if error is None:
+            self.set(key, entry, ttl, tags)
+            return
+        
+        if not self.enabled:
+            if self.get(key) is None:
+                self.set(key, entry, ttl, tags)
+            return
+        
+        try:
+            data = self._encode(entry)
+            pipe = self.client.pipeline(transaction=False)
+            pipe.set(key, data, ex=ttl, nx=True)
+            self._tag_commands(pipe, key, tags)
+            if pipe.execute()[0]:
+                self.local.set(key, entry, ttl)
+                self._count(key, writes=1, bytes_written=len(data))
+        except (redis.ConnectionError, redis.TimeoutError):
+            self._mark_down()
+        except:
+            pass
+    
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Vários valores de uma vez: cache local e, para o resto, MGET + PTTL
+        numa única ida ao Redis. Retorna só as chaves encontradas
+        """
+        found: Dict[str, Any] = {}
+        pending = []
+        for key in dict.fromkeys(keys):
+            value = self.local.get(key, LocalTTLCache._MISSING)
+            if value is LocalTTLCache._MISSING:
+                pending.append(key)
+            else:
+                found[key] = value
+                self._count(key, hits=1, local_hits=1)
+        
+        if not pending:
+            return found
+        
+        if not self.enabled:
+            return self._fallback_get_many(pending, found)
+        
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.mget(pending)
+            for key in pending:
+                pipe.pttl(key)
+            results = pipe.execute()
+        except (redis.ConnectionError, redis.TimeoutError):
+            self._mark_down()
+            return self._fallback_get_many(pending, found)
+        except:
+            return found
+        
+        for key, data, pttl in zip(pending, results[0], results[1:]):
+            try:
+                value = self._decode(data)
+            except:
+                value = None
+            if value is not None:
+                found[key] = value
+                self._count(key, hits=1, bytes_read=len(data))
+                self.local.set(key, value, pttl / 1000 if pttl and pttl > 0 else None)
+            else:
+                self._count(key, misses=1)
+        
+        return found
+    
+    def set_many(self, mapping: Dict[str, Any], expire_seconds: int = 3600, tags: Optional[Iterable[str]] = None):
+        """Grava vários valores com o mesmo TTL (SETEX em pipeline, uma ida ao Redis)"""
+        if not mapping:
+            return
+        
+        for key, value in mapping.items():
+            self.local.set(key, value, expire_seconds)
+        
+        if not self.enabled:
+            self._fallback_set(mapping, expire_seconds, tags)
+            return
+        
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            written = []
+            for key, value in mapping.items():
+                data = self._encode(value)
+                written.append((key, len(data)))
+                pipe.setex(key, expire_seconds, data)
+                self._tag_commands(pipe, key, tags)
+                if Config.LOCAL_CACHE_INVALIDATION:
+                    pipe.publish(LocalTTLCache.INVALIDATION_CHANNEL, LocalTTLCache.invalidation_message(key))
+            pipe.execute()
+            for key, size in written:
+                self._count(key, writes=1, bytes_written=size)
+        except (redis.ConnectionError, redis.TimeoutError):
+            self._mark_down()
+            self._fallback_set(mapping, expire_seconds, tags)
+        except:
+            pass
+    
+    # =========================
+    # 🔹 FALLBACK SQLITE (Redis fora)
+    # =========================
+    def _fallback_get(self, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        """Lê do fallback; o valor também vai para o cache local"""
+        data, remaining = self.fallback.get_with_ttl(key) if self.fallback else (None, None)
+        try:
+            value = self._decode(data)
+        except:
+            value = None
+        
+        if value is None:
+            self._count(key, misses=1)
+            return None, None
+        
+        self._count(key, hits=1, fallback_hits=1, bytes_read=len(data))
+        self.local.set(key, value, remaining)
+        return value, remaining
+    
+    def _fallback_get_many(self, keys: List[str], found: Dict[str, Any]) -> Dict[str, Any]:
+        """Completa found com o que houver no fallback (só chaves encontradas)"""
+        rows = self.fallback.get_many(keys) if self.fallback else {}
+        for key in keys:
+            data, remaining = rows.get(key, (None, None))
+            try:
+                value = self._decode(data)
+            except:
+                value = None
+            if value is not None:
+                found[key] = value
+                self._count(key, hits=1, fallback_hits=1, bytes_read=len(data))
+                self.local.set(key, value, remaining)
+            else:
+                self._count(key, misses=1)
+        return found
+    
+    def _fallback_set(self, mapping: Dict[str, Any], expire_seconds: int, tags: Optional[Iterable[str]] = None):
+        if not self.fallback:
+            return
+        try:
+            encoded = {key: self._encode(value) for key, value in mapping.items()}
+        except:
+            return
+        self.fallback.set_many(encoded, expire_seconds, tags)
+        for key, data in encoded.items():
+            self._count(key, writes=1, bytes_written=len(data))
+    
+    def _resync_fallback(self) -> int:
+        """
+        Redis voltou: reenvia as entradas do fallback com o TTL restante e as remove
+        SET NX: o que outro worker já gravou no Redis desde a volta não é sobrescrito
+        """
+        if not self.fallback or not self.fallback.has_pending():
+            return 0
+        
+        synced = 0
+        try:
+            while True:
+                batch = self.fallback.pending(self.SCAN_BATCH)
+                if not batch:
+                    break
+                pipe = self.client.pipeline(transaction=False)
+                for key, data, ttl_ms, tags in batch:
+                    pipe.set(key, data, px=ttl_ms, nx=True)
+                    self._tag_commands(pipe, key, tags)
+                pipe.execute()
+                if not self.fallback.mark_synced([key for key, *_ in batch]):
+                    break
+                synced += len(batch)
+        except (redis.ConnectionError, redis.TimeoutError):
+            self._mark_down()
+        
+        self.fallback.purge_expired()
+        if synced:
+            print(f"🔄 Redis de volta: {synced} entradas do cache local (SQLite) reenviadas")
+        return synced
+    
+    # =========================
+    # 🔹 LIMPEZA POR PREFIXO, NAMESPACE E TAG (sem FLUSHDB)
+    # =========================
+    def _unlink(self, keys: List[str], publish: bool = True) -> int:
+        """UNLINK (remoção sem bloquear o Redis) + cache local + aviso aos outros workers"""
+        if not keys:
+            return 0
+        
+        self.local.delete_many(keys)
+        removed = self.client.unlink(*keys)
+        if publish and Config.LOCAL_CACHE_INVALIDATION:
+            pipe = self.client.pipeline(transaction=False)
+            for key in keys:
+                pipe.publish(LocalTTLCache.INVALIDATION_CHANNEL, LocalTTLCache.invalidation_message(key))
+            pipe.execute()
+        return removed
+    
+    def delete_prefix(self, prefix: str) -> int:
+        """Remove todas as chaves com o prefixo (SCAN em lotes + UNLINK). Retorna quantas"""
+        self.local.delete_prefix(prefix)
+        if not prefix:
+            return 0
+        
+        removed = self.fallback.delete_prefix(prefix) if self.fallback else 0
+        if not self.enabled:
+            return removed
+        
+        batch: List[str] = []
+        try:
+            for key in self.client.scan_iter(match=f"{prefix}*", count=self.SCAN_BATCH):
+                batch.append(key.decode() if isinstance(key, bytes) else key)
+                if len(batch) >= self.SCAN_BATCH:
+                    removed += self._unlink(batch, publish=False)
+                    batch = []
+            removed += self._unlink(batch, publish=False)
+            
+            # Uma mensagem para o prefixo inteiro
+            if removed and Config.LOCAL_CACHE_INVALIDATION:
+                self.client.publish(LocalTTLCache.INVALIDATION_CHANNEL, LocalTTLCache.invalidation_message(f"{prefix}*"))
+        except (redis.ConnectionError, redis.TimeoutError):
+            self._mark_down()
+        
+        return removed
+    
+    def clear_namespace(self, namespace: str) -> int:
+        """Remove as chaves de um namespace (odds, fixtures, team_stats, tennis, ...)"""
+        if namespace not in self.NAMESPACES:
+            raise ValueError(f"Namespace desconhecido: {namespace} (use {', '.join(self.NAMESPACES)})")
+        return sum(self.delete_prefix(prefix) for prefix in self.NAMESPACES[namespace])
+    
+    def clear_all(self) -> bool:
+        """
+        Remove todas as chaves dos namespaces do agente (SCAN + UNLINK)
+        Não usa FLUSHDB: outras chaves do banco Redis ficam intactas
+        PRESERVED_NAMESPACES ficam de fora (limpe com clear_namespace)
+        """
+        if not self.enabled:
+            self.local.clear()
+            if self.fallback:
+                self.fallback.clear()
+            print("⚠️ Redis indisponível: limpo apenas o cache local")
+            return False
+        
+        try:
+            removed = {
+                namespace: self.clear_namespace(namespace)
+                for namespace in self.NAMESPACES if namespace not in self.PRESERVED_NAMESPACES
+            }
+        except Exception as e:
+            print(f"❌ Erro ao limpar cache: {e}")
+            return False
+        
+        self.local.clear()
+        print(f"🗑️  {sum(removed.values())} chaves removidas: "
+              + ", ".join(f"{namespace}={count}" for namespace, count in removed.items() if count))
+        return True
+    
+    def invalidate_tag(self, tag: str) -> int:
+        """Remove todas as chaves marcadas com a tag (ex.: league:39, team:42). Retorna quantas"""
+        removed = self.fallback.delete_tag(tag) if self.fallback else 0
+        if not self.enabled:
+            return removed
+        
+        tag_key = f"{self.TAG_PREFIX}{tag}"
+        batch: List[str] = []
+        try:
+            for key in self.client.sscan_iter(tag_key, count=self.SCAN_BATCH):
+                batch.append(key.decode() if isinstance(key, bytes) else key)
+                if len(batch) >= self.SCAN_BATCH:
+                    removed += self._unlink(batch)
+                    batch = []
+            removed += self._unlink(batch)
+            self.client.unlink(tag_key)
+        except (redis.ConnectionError, redis.TimeoutError):
+            self._mark_down()
+        
+        return removed
+    
+    def list_tags(self) -> Dict[str, int]:
+        """Tags existentes e nº de chaves em cada uma"""
+        if not self.enabled:
+            return {}
+        
+        tags = {}
+        for key in self.client.scan_iter(match=f"{self.TAG_PREFIX}*", count=self.SCAN_BATCH):
+            key = key.decode() if isinstance(key, bytes) else key
+            tags[key[len(self.TAG_PREFIX):]] = self.client.scard(key)
+        return tags
+    
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        """Serializa valor para o Redis (compartilhado com AsyncRedisCache)"""
+        return CacheCodec.encode(value)
+    
+    @staticmethod
+    def _decode(data: Optional[bytes]) -> Optional[Any]:
+        """Lê envelope do CacheCodec ou JSON de entradas antigas"""
+        return CacheCodec.decode(data)
+    
+    # Libera o lock apenas se ainda for do mesmo dono (compare-and-delete)
+    _RELEASE_LOCK_SCRIPT = """
+    if redis.call('get', KEYS[1]) == ARGV[1] then
+        return redis.call('del', KEYS[1])
+    end
+    return 0
+    """
+    
+    def acquire_lock(self, name: str, ttl_ms: int) -> Optional[str]:
+        """Tenta pegar lock curto (SET NX PX). Retorna token ou None se ocupado"""
+        if not self.enabled:
+            return None
+        
+        token = uuid.uuid4().hex
+        try:
+            if self.client.set(name, token, nx=True, px=ttl_ms):
+                return token
             return None
+        except:
+            # Redis instável: segue sem coordenação entre workers
+            return token
     
-    def set(self, key: str, value: Any, expire_seconds: int = 3600):
+    def release_lock(self, name: str, token: str):
         if not self.enabled:
             return
         
         try:
-            self.client.setex(key, expire_seconds, json.dumps(value))
+            self.client.eval(self._RELEASE_LOCK_SCRIPT, 1, name, token)
         except:
             pass
+    
+    def lock_exists(self, name: str) -> bool:
+        if not self.enabled:
+            return False
+        
+        try:
+            return bool(self.client.exists(name))
+        except:
+            return False
@@ -0,0 +1,324 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+from config.config import Config
+from src.cache.negative_cache import NegativeCache
+
+
+class _Call:
+    """Busca em andamento para uma chave (compartilhada pelos chamadores)"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+def _is_stale(cached: Any, remaining: Optional[float], soft_ttl: float, hard_ttl: float) -> bool:
+    """
+    Entrada gravada com hard_ttl já passou do soft_ttl? (idade = hard_ttl - TTL restante)
+    Entradas negativas têm TTL próprio e curto: expiram sozinhas, sem refresh
+    """
+    if NegativeCache.is_negative(cached):
+        return False
+    return remaining is not None and remaining <= hard_ttl - soft_ttl
+
+
+def _log_hit(cached: Any, label: Optional[str]):
+    if not label:
+        return
+    if NegativeCache.is_negative(cached):
+        print(f"📦 Usando cache negativo ({label}: {NegativeCache.describe(cached)})")
+    else:
+        print(f"📦 Usando cache ({label})")
+
+
+class SingleFlight:
+    """
+    Coalescência de cache misses: apenas 1 chamador por chave busca no provedor,
+    os demais esperam o resultado.
+
+    - Mesmo processo: threads esperam a busca em andamento (threading.Event)
+    - Entre workers: lock curto no Redis (SET NX PX); quem não pegou o lock
+      espera o valor aparecer no cache
+    - get_or_refresh: stale-while-revalidate (soft/hard TTL) sobre o mesmo lock
+
+    Qualquer valor diferente de None é hit, inclusive vazio e entradas
+    negativas (NegativeCache): o chamador converte com NegativeCache.unwrap.
+    """
+
+    # Buscas em andamento no processo (compartilhado entre instâncias)
+    _calls: Dict[str, _Call] = {}
+    _lock = threading.Lock()
+
+    # Refresh em segundo plano (stale-while-revalidate)
+    _refreshing: Set[str] = set()
+    _executor: Optional[ThreadPoolExecutor] = None
+
+    POLL_INTERVAL = 0.1
+
+    def __init__(self, cache, lock_ttl_ms: Optional[int] = None, wait_timeout: Optional[float] = None):
+        self.cache = cache
+        self.lock_ttl_ms = lock_ttl_ms or Config.SINGLE_FLIGHT_LOCK_TTL_MS
+        self.wait_timeout = wait_timeout or Config.SINGLE_FLIGHT_WAIT_TIMEOUT
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        Executa fn() uma única vez por chave
+        fn deve salvar o resultado no cache em `key` (é lá que outros workers procuram)
+        """
+        with SingleFlight._lock:
+            call = SingleFlight._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _Call()
+                SingleFlight._calls[key] = call
+
+        if not is_leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._do_across_workers(key, fn)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with SingleFlight._lock:
+                SingleFlight._calls.pop(key, None)
+            call.event.set()
+
+    def get_or_refresh(self, key: str, fn: Callable[[], Any], soft_ttl: float, hard_ttl: float,
+                       label: Optional[str] = None) -> Any:
+        """
+        Stale-while-revalidate
+        fn deve salvar o resultado em `key` com expire_seconds=hard_ttl
+
+        - Idade < soft_ttl: devolve o cache
+        - Entre soft e hard: devolve o cache na hora e 1 refresh roda em segundo plano
+        - Sem valor (passou do hard): busca bloqueando, com coalescência (do)
+        """
+        cached, remaining = self.cache.get_with_ttl(key)
+        if cached is not None:
+            _log_hit(cached, label)
+            if _is_stale(cached, remaining, soft_ttl, hard_ttl):
+                self._refresh_in_background(key, fn)
+            return cached
+
+        return self.do(key, fn)
+
+    def _refresh_in_background(self, key: str, fn: Callable[[], Any]):
+        with SingleFlight._lock:
+            # Já tem busca (em primeiro plano ou refresh) desta chave no processo
+            if key in SingleFlight._refreshing or key in SingleFlight._calls:
+                return
+            SingleFlight._refreshing.add(key)
+            if SingleFlight._executor is None:
+                SingleFlight._executor = ThreadPoolExecutor(
+                    max_workers=max(1, Config.SWR_REFRESH_WORKERS), thread_name_prefix="swr-refresh"
+                )
+
+        SingleFlight._executor.submit(self._refresh, key, fn)
+
+    def _refresh(self, key: str, fn: Callable[[], Any]):
+        """Refresh de uma entrada velha; se outro worker já está atualizando, não faz nada"""
+        try:
+            if not self.cache.enabled:
+                fn()
+                return
+
+            lock_name = f"lock:{key}"
+            token = self.cache.acquire_lock(lock_name, self.lock_ttl_ms)
+            if token is None:
+                return
+
+            try:
+                fn()
+            finally:
+                self.cache.release_lock(lock_name, token)
+        except Exception as e:
+            print(f"⚠️ Erro no refresh em segundo plano de {key}: {e}")
+        finally:
+            with SingleFlight._lock:
+                SingleFlight._refreshing.discard(key)
+
+    def _do_across_workers(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Coordena com outros processos via lock no Redis"""
+        if not self.cache.enabled:
+            return fn()
+
+        lock_name = f"lock:{key}"
+        token = self.cache.acquire_lock(lock_name, self.lock_ttl_ms)
+
+        if token is None:
+            # Outro worker está buscando: espera o valor chegar no cache
+            cached = self._wait_for_value(key, lock_name)
+            if cached is not None:
+                return cached
+            # Líder falhou ou demorou demais: busca por conta própria
+            return fn()
+
+        try:
+            # Double-check: outro worker pode ter acabado de salvar
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+            return fn()
+        finally:
+            self.cache.release_lock(lock_name, token)
+
+    def _wait_for_value(self, key: str, lock_name: str) -> Optional[Any]:
+        deadline = time.monotonic() + self.wait_timeout
+
+        while time.monotonic() < deadline:
+            time.sleep(self.POLL_INTERVAL)
+
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+            if not self.cache.lock_exists(lock_name):
+                # Lock liberado sem valor no cache (erro ou resultado vazio)
+                return self.cache.get(key)
+
+        return None
+
+
+class AsyncSingleFlight:
+    """
+    SingleFlight para asyncio (AsyncRedisCache)
+
+    - Mesmo event loop: tasks esperam a mesma busca (asyncio.Future)
+    - Entre workers: mesmo lock curto no Redis (SET NX PX) do SingleFlight
+    """
+
+    # Buscas em andamento por event loop: {(loop_id, key): Future}
+    _calls: Dict[tuple, asyncio.Future] = {}
+    # Refresh em segundo plano por event loop: {(loop_id, key): Task}
+    _refreshing: Dict[tuple, asyncio.Task] = {}
+
+    POLL_INTERVAL = SingleFlight.POLL_INTERVAL
+
+    def __init__(self, cache, lock_ttl_ms: Optional[int] = None, wait_timeout: Optional[float] = None):
+        self.cache = cache
+        self.lock_ttl_ms = lock_ttl_ms or Config.SINGLE_FLIGHT_LOCK_TTL_MS
+        self.wait_timeout = wait_timeout or Config.SINGLE_FLIGHT_WAIT_TIMEOUT
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Executa await fn() uma única vez por chave
+        fn deve salvar o resultado no cache em `key` (é lá que outros workers procuram)
+        """
+        loop = asyncio.get_running_loop()
+        call_key = (id(loop), key)
+
+        future = AsyncSingleFlight._calls.get(call_key)
+        if future is not None:
+            # shield: cancelar quem espera não cancela a busca do líder
+            return await asyncio.shield(future)
+
+        future = loop.create_future()
+        AsyncSingleFlight._calls[call_key] = future
+
+        try:
+            result = await self._do_across_workers(key, fn)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Evita "exception was never retrieved" quando ninguém esperava
+            future.exception()
+            raise
+        finally:
+            AsyncSingleFlight._calls.pop(call_key, None)
+
+    async def get_or_refresh(self, key: str, fn: Callable[[], Awaitable[Any]], soft_ttl: float, hard_ttl: float,
+                             label: Optional[str] = None) -> Any:
+        """Stale-while-revalidate (mesma regra do SingleFlight.get_or_refresh; refresh vira uma task)"""
+        cached, remaining = await self.cache.get_with_ttl(key)
+        if cached is not None:
+            _log_hit(cached, label)
+            if _is_stale(cached, remaining, soft_ttl, hard_ttl):
+                self._refresh_in_background(key, fn)
+            return cached
+
+        return await self.do(key, fn)
+
+    def _refresh_in_background(self, key: str, fn: Callable[[], Awaitable[Any]]):
+        loop = asyncio.get_running_loop()
+        call_key = (id(loop), key)
+        if call_key in AsyncSingleFlight._refreshing or call_key in AsyncSingleFlight._calls:
+            return
+
+        # Guarda a referência da task até terminar (senão pode ser coletada)
+        task = loop.create_task(self._refresh(key, fn))
+        AsyncSingleFlight._refreshing[call_key] = task
+        task.add_done_callback(lambda _: AsyncSingleFlight._refreshing.pop(call_key, None))
+
+    async def _refresh(self, key: str, fn: Callable[[], Awaitable[Any]]):
+        """Refresh de uma entrada velha; se outro worker já está atualizando, não faz nada"""
+        try:
+            if not await self.cache.is_enabled():
+                await fn()
+                return
+
+            lock_name = f"lock:{key}"
+            token = await self.cache.acquire_lock(lock_name, self.lock_ttl_ms)
+            if token is None:
+                return
+
+            try:
+                await fn()
+            finally:
+                await self.cache.release_lock(lock_name, token)
+        except Exception as e:
+            print(f"⚠️ Erro no refresh em segundo plano de {key}: {e}")
+
+    async def _do_across_workers(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Coordena com outros processos via lock no Redis"""
+        if not await self.cache.is_enabled():
+            return await fn()
+
+        lock_name = f"lock:{key}"
+        token = await self.cache.acquire_lock(lock_name, self.lock_ttl_ms)
+
+        if token is None:
+            # Outro worker está buscando: espera o valor chegar no cache
+            cached = await self._wait_for_value(key, lock_name)
+            if cached is not None:
+                return cached
+            # Líder falhou ou demorou demais: busca por conta própria
+            return await fn()
+
+        try:
+            # Double-check: outro worker pode ter acabado de salvar
+            cached = await self.cache.get(key)
+            if cached is not None:
+                return cached
+            return await fn()
+        finally:
+            await self.cache.release_lock(lock_name, token)
+
+    async def _wait_for_value(self, key: str, lock_name: str) -> Optional[Any]:
+        deadline = time.monotonic() + self.wait_timeout
+
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.POLL_INTERVAL)
+
+            cached = await self.cache.get(key)
+            if cached is not None:
+                return cached
+
+            if not await self.cache.lock_exists(lock_name):
+                # Lock liberado sem valor no cache (erro ou resultado vazio)
+                return await self.cache.get(key)
+
+        return None
@@ -0,0 +1,241 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from config.config import Config
+
+
+class SQLiteFallbackCache:
+    """
+    Cache persistente local usado quando o Redis está fora
+
+    SQLite em modo WAL (leitores não bloqueiam o escritor, vários processos
+    no mesmo arquivo). Guarda os mesmos bytes do CacheCodec que iriam para
+    o Redis, com expiração absoluta (epoch): o TTL vale entre processos e
+    reinícios. Entradas gravadas aqui ficam pendentes até o Redis voltar;
+    o RedisCache/AsyncRedisCache então as reenvia com o TTL restante
+    (SET NX: não sobrescreve o que já foi gravado no Redis) e as remove.
+    """
+
+    # Instância compartilhada pelo processo (RedisCache e AsyncRedisCache)
+    _shared: Optional["SQLiteFallbackCache"] = None
+    _shared_lock = threading.Lock()
+
+    PURGE_EVERY = 500  # Remove expirados a cada N gravações
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS cache (
+        key TEXT PRIMARY KEY,
+        value BLOB NOT NULL,
+        expires_at REAL NOT NULL,
+        tags TEXT
+    )
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "synced": 0, "errors": 0}
+
+    @classmethod
+    def shared(cls) -> Optional["SQLiteFallbackCache"]:
+        """Fallback do processo (None se desativado em CACHE_FALLBACK_ENABLED)"""
+        if not Config.CACHE_FALLBACK_ENABLED:
+            return None
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls(Config.CACHE_FALLBACK_PATH)
+        return cls._shared
+
+    def _connect(self) -> sqlite3.Connection:
+        """Conexão única do processo (aberta no primeiro uso, protegida por self._lock)"""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")  # WAL: durável a cada checkpoint, sem fsync por commit
+            conn.execute(self._SCHEMA)
+            conn.execute("CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (expires_at)")
+            self._conn = conn
+        return self._conn
+
+    def _absent(self) -> bool:
+        """Arquivo ainda não existe: leituras e remoções não precisam criá-lo"""
+        return self._conn is None and not os.path.exists(self.path)
+
+    def _execute(self, fn, default=None):
+        """Roda fn(conexão) sob o lock; erro do SQLite vira aviso e default"""
+        try:
+            with self._lock:
+                return fn(self._connect())
+        except sqlite3.Error as e:
+            self._stats["errors"] += 1
+            print(f"⚠️ Erro no cache local (SQLite): {e}")
+            return default
+
+    # =========================
+    # 🔹 LEITURA / ESCRITA
+    # =========================
+    def get_with_ttl(self, key: str) -> Tuple[Optional[bytes], Optional[float]]:
+        """Bytes e segundos restantes (None, None se ausente ou expirado)"""
+        now = time.time()
+        row = None if self._absent() else self._execute(lambda conn: conn.execute(
+            "SELECT value, expires_at FROM cache WHERE key = ? AND expires_at > ?", (key, now)
+        ).fetchone())
+
+        if row is None:
+            self._stats["misses"] += 1
+            return None, None
+
+        self._stats["hits"] += 1
+        return row[0], row[1] - now
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Tuple[bytes, float]]:
+        """{chave: (bytes, segundos restantes)} das chaves encontradas"""
+        keys = list(dict.fromkeys(keys))
+        if not keys or self._absent():
+            return {}
+
+        now = time.time()
+
+        def select(conn):
+            rows = []
+            # Limite de variáveis por consulta do SQLite (999 em versões antigas)
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                rows += conn.execute(
+                    f"SELECT key, value, expires_at FROM cache WHERE key IN ({','.join('?' * len(batch))})"
+                    " AND expires_at > ?", (*batch, now)
+                ).fetchall()
+            return rows
+
+        found = {key: (value, expires_at - now) for key, value, expires_at in self._execute(select, [])}
+        self._stats["hits"] += len(found)
+        self._stats["misses"] += len(keys) - len(found)
+        return found
+
+    def set_many(self, mapping: Dict[str, bytes], expire_seconds: float, tags: Optional[Iterable[str]] = None):
+        """Grava bytes já codificados com expiração absoluta (uma transação)"""
+        if not mapping:
+            return
+
+        expires_at = time.time() + expire_seconds
+        tags_text = ",".join(tags) if tags else None
+        rows = [(key, sqlite3.Binary(data), expires_at, tags_text) for key, data in mapping.items()]
+
+        def write(conn):
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO cache (key, value, expires_at, tags) VALUES (?, ?, ?, ?)", rows
+                )
+                self._writes += len(rows)
+                if self._writes >= self.PURGE_EVERY:
+                    self._writes = 0
+                    conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+            return True
+
+        if self._execute(write, False):
+            self._stats["writes"] += len(rows)
+
+    def set(self, key: str, data: bytes, expire_seconds: float, tags: Optional[Iterable[str]] = None):
+        self.set_many({key: data}, expire_seconds, tags)
+
+    # =========================
+    # 🔹 REMOÇÃO
+    # =========================
+    def delete_many(self, keys: Iterable[str]) -> int:
+        keys = list(keys)
+        if not keys or self._absent():
+            return 0
+
+        def delete(conn):
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                return conn.executemany("DELETE FROM cache WHERE key = ?", [(key,) for key in keys]).rowcount
+
+        return self._execute(delete, 0)
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Remove as chaves com o prefixo (substr em vez de LIKE: '_' e '%' são literais)"""
+        if not prefix or self._absent():
+            return 0
+
+        def delete(conn):
+            with conn:
+                return conn.execute(
+                    "DELETE FROM cache WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+                ).rowcount
+
+        return self._execute(delete, 0)
+
+    def delete_tag(self, tag: str) -> int:
+        """Remove as chaves gravadas com a tag"""
+        if self._absent():
+            return 0
+
+        def delete(conn):
+            with conn:
+                return conn.execute(
+                    "DELETE FROM cache WHERE instr(',' || tags || ',', ?) > 0", (f",{tag},",)
+                ).rowcount
+
+        return self._execute(delete, 0)
+
+    def clear(self) -> int:
+        if self._absent():
+            return 0
+
+        def delete(conn):
+            with conn:
+                return conn.execute("DELETE FROM cache").rowcount
+
+        return self._execute(delete, 0)
+
+    # =========================
+    # 🔹 RESSINCRONIZAÇÃO COM O REDIS
+    # =========================
+    def has_pending(self) -> bool:
+        """Há entradas válidas esperando o Redis? (não cria o arquivo se não existe)"""
+        if self._absent():
+            return False
+        return bool(self._execute(lambda conn: conn.execute(
+            "SELECT 1 FROM cache WHERE expires_at > ? LIMIT 1", (time.time(),)
+        ).fetchone()))
+
+    def pending(self, limit: int = 500) -> List[Tuple[str, bytes, int, List[str]]]:
+        """Próximo lote a reenviar: [(chave, bytes, TTL restante em ms, tags)]"""
+        now = time.time()
+        rows = self._execute(lambda conn: conn.execute(
+            "SELECT key, value, expires_at, tags FROM cache WHERE expires_at > ? ORDER BY expires_at LIMIT ?",
+            (now, limit)
+        ).fetchall(), [])
+        return [
+            (key, bytes(value), max(1, int((expires_at - now) * 1000)), tags.split(",") if tags else [])
+            for key, value, expires_at, tags in rows
+        ]
+
+    def mark_synced(self, keys: List[str]) -> int:
+        """Entradas já enviadas ao Redis saem do fallback (o Redis volta a ser a fonte)"""
+        removed = self.delete_many(keys)
+        self._stats["synced"] += removed
+        return removed
+
+    def purge_expired(self) -> int:
+        if self._absent():
+            return 0
+
+        def delete(conn):
+            with conn:
+                return conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),)).rowcount
+
+        return self._execute(delete, 0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"path": self.path, **self._stats}
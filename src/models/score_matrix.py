@@ -0,0 +1,144 @@
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+
+class ScoreMatrix:
+    """
+    Matriz de placares de um jogo: P(mandante faz i, visitante faz j), Poisson independente
+
+    Montada uma vez por jogo com NumPy; todos os mercados saem de somas sobre
+    ela ou sobre as distribuições de total e de saldo de gols:
+    - totais (over_X / under_X, qualquer linha de _extract_totals)
+    - btts_yes / btts_no
+    - home_win / draw / away_win (1X2) e dupla chance (double_chance_1x/_12/_x2)
+    - empate anula (dnb_home / dnb_away)
+    - handicap asiático do mandante (spread_X) e do visitante (spread_away_X)
+
+    Linhas inteiras devolvem a aposta no empate (push) e linhas de quarto
+    (.25/.75) dividem a aposta entre as duas linhas vizinhas. probability()
+    converte isso na probabilidade equivalente para o cálculo de EV do
+    ProbabilityModel: p tal que p * odd = retorno esperado.
+    """
+
+    MAX_GOALS = 10  # Placares de 0 a MAX_GOALS; a cauda fica na última linha/coluna
+    RESULT_KEYS = frozenset({'home_win', 'draw', 'away_win', 'double_chance_1x', 'double_chance_12',
+                             'double_chance_x2', 'dnb_home', 'dnb_away'})
+
+    def __init__(self, home_lambda: float, away_lambda: float, max_goals: Optional[int] = None):
+        self.home_lambda = home_lambda
+        self.away_lambda = away_lambda
+        n = max_goals or self.MAX_GOALS
+
+        self.home_pmf = self._poisson(home_lambda, n)
+        self.away_pmf = self._poisson(away_lambda, n)
+        self.matrix = np.outer(self.home_pmf, self.away_pmf)
+
+        # Distribuições derivadas: total de gols (0..2n) e saldo do mandante (-n..n)
+        goals = np.arange(n + 1)
+        weights = self.matrix.ravel()
+        self.total_pmf = np.bincount(np.add.outer(goals, goals).ravel(), weights=weights, minlength=2 * n + 1)
+        self.diff_pmf = np.bincount(np.subtract.outer(goals, goals).ravel() + n, weights=weights, minlength=2 * n + 1)
+        self._totals = np.arange(2 * n + 1)
+        self._diffs = np.arange(-n, n + 1)
+
+        self._prices: Dict[str, Optional[Tuple[float, float]]] = {}
+
+    @staticmethod
+    def _poisson(lam: float, n: int) -> np.ndarray:
+        """pmf de Poisson de 0 a n (recorrência p(k) = p(k-1) * λ / k), cauda somada em n"""
+        lam = max(float(lam), 0.0)
+        pmf = np.exp(-lam) * np.cumprod(np.concatenate(([1.0], lam / np.arange(1, n + 1))))
+        pmf[-1] += max(0.0, 1.0 - pmf.sum())
+        return pmf
+
+    # =========================
+    # 🔹 LIQUIDAÇÃO
+    # =========================
+    @staticmethod
+    def _settle(pmf: np.ndarray, values: np.ndarray, line: float) -> Tuple[float, float]:
+        """
+        (vitória, push) de uma aposta que ganha quando valor + linha > 0
+        Linhas de quarto viram meia aposta em cada linha vizinha (±0.25)
+        """
+        if (line * 4) % 2 == 1:
+            low = ScoreMatrix._settle(pmf, values, line - 0.25)
+            high = ScoreMatrix._settle(pmf, values, line + 0.25)
+            return (low[0] + high[0]) / 2, (low[1] + high[1]) / 2
+
+        margin = values + line
+        return float(pmf[margin > 0].sum()), float(pmf[margin == 0].sum())
+
+    # =========================
+    # 🔹 MERCADOS
+    # =========================
+    def over(self, line: float) -> Tuple[float, float]:
+        return self._settle(self.total_pmf, self._totals, -line)
+
+    def under(self, line: float) -> Tuple[float, float]:
+        return self._settle(self.total_pmf, -self._totals, line)
+
+    def asian_handicap(self, line: float, home: bool = True) -> Tuple[float, float]:
+        """Handicap asiático: linha do mandante (home=True) ou do visitante"""
+        return self._settle(self.diff_pmf, self._diffs if home else -self._diffs, line)
+
+    def btts(self) -> float:
+        return float(self.matrix[1:, 1:].sum())
+
+    def result(self) -> Tuple[float, float, float]:
+        """1X2: (casa, empate, fora)"""
+        home = float(self.diff_pmf[self._diffs > 0].sum())
+        draw = float(self.diff_pmf[self._diffs == 0].sum())
+        return home, draw, max(0.0, 1.0 - home - draw)
+
+    def price(self, key: str) -> Optional[Tuple[float, float]]:
+        """(vitória, push) do mercado no formato de chave do OddsAPI; None se desconhecido"""
+        if key not in self._prices:
+            self._prices[key] = self._price(key)
+        return self._prices[key]
+
+    def _price(self, key: str) -> Optional[Tuple[float, float]]:
+        if key in self.RESULT_KEYS:
+            home, draw, away = self.result()
+            return {
+                'home_win': (home, 0.0),
+                'draw': (draw, 0.0),
+                'away_win': (away, 0.0),
+                'double_chance_1x': (home + draw, 0.0),
+                'double_chance_12': (home + away, 0.0),
+                'double_chance_x2': (draw + away, 0.0),
+                'dnb_home': (home, draw),
+                'dnb_away': (away, draw),
+            }[key]
+        if key in ('btts_yes', 'btts_no'):
+            btts = self.btts()
+            return (btts, 0.0) if key == 'btts_yes' else (1.0 - btts, 0.0)
+
+        prefix, _, line = key.rpartition('_')
+        try:
+            line = float(line)
+        except ValueError:
+            return None
+
+        if prefix == 'over':
+            return self.over(line)
+        if prefix == 'under':
+            return self.under(line)
+        if prefix == 'spread':
+            return self.asian_handicap(line, home=True)
+        if prefix == 'spread_away':
+            return self.asian_handicap(line, home=False)
+        return None
+
+    def probability(self, key: str, odds: float) -> Optional[float]:
+        """
+        Probabilidade equivalente para EV: (P(vitória) * odd + P(push)) / odd
+        Igual a P(vitória) em linhas sem push; None se o mercado é desconhecido
+        """
+        price = self.price(key)
+        if price is None or not odds:
+            return None
+        win, push = price
+        return round(win + push / odds, 4)
+
+    def expected_goals(self) -> float:
+        return round(self.home_lambda + self.away_lambda, 2)
@@ -1,17 +1,230 @@
-import requests
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Iterable, Tuple
 from datetime import datetime, timedelta
 from config.config import Config
+from src.cache.negative_cache import NegativeCache
 from src.cache.redis_client import RedisCache
+from src.cache.single_flight import SingleFlight
+from src.cache.conditional_refresh import ConditionalRefresh
+from src.utils.http_client import HttpClient
+from src.utils.quota_scheduler import Priority
 
 
-class APIFootballService:
+class APIFootballParser:
+    """
+    Constantes, chaves de cache e extratores da API-Football (sem I/O)
+    Base comum do APIFootballService e do AsyncAPIFootballService: o cliente async não herda métodos sync
+    """
+    
+    # Fixtures: frescas por 6h; depois servidas velhas por mais SWR_STALE_TTL (refresh em segundo plano)
+    FIXTURES_SOFT_TTL = 21600
+    FIXTURES_HARD_TTL = FIXTURES_SOFT_TTL + Config.SWR_STALE_TTL
+    # Versão do _format_fixtures: suba ao mudar chaves/estrutura (descarta resultados guardados nos validadores)
+    FORMAT_VERSION = 1
+    
+    @staticmethod
+    def _cached_form(cached: List[str], last_n_games: int) -> List[str]:
+        """Forma vinda do cache: erro recente -> empates (como na busca), sem jogos -> []"""
+        if NegativeCache.is_error(cached):
+            return ['D'] * last_n_games
+        return NegativeCache.unwrap(cached, [])
+    
+    @staticmethod
+    def _team_stats_cache_key(team_id: int, league_id: int, season: int) -> str:
+        return f"api_football_team_stats_{team_id}_{league_id}_{season}"
+    
+    @staticmethod
+    def _team_form_cache_key(team_id: int, last_n_games: int) -> str:
+        return f"api_football_team_form_{team_id}_{last_n_games}"
+    
+    def _format_fixtures(self, fixtures: List[Dict]) -> List[Dict]:
+        """Formata fixtures para padrão interno"""
+        formatted = []
+        
+        for fixture in fixtures:
+            # Filtra apenas jogos futuros ou ao vivo
+            status = fixture.get('fixture', {}).get('status', {}).get('short')
+            if status not in ['NS', 'TBD', '1H', '2H', 'HT', 'LIVE']:
+                continue
+            
+            fixture_data = fixture.get('fixture', {})
+            teams = fixture.get('teams', {})
+            league = fixture.get('league', {})
+            
+            formatted_fixture = {
+                'match_id': f"apif_{fixture_data.get('id')}",
+                'home_team': teams.get('home', {}).get('name', ''),
+                'away_team': teams.get('away', {}).get('name', ''),
+                'competition': league.get('name', 'Unknown'),
+                'date': fixture_data.get('date', ''),
+                'status': status,
+                'source': 'api-football',
+                'league_id': league.get('id'),
+                'home_team_id': teams.get('home', {}).get('id'),
+                'away_team_id': teams.get('away', {}).get('id')
+            }
+            
+            formatted.append(formatted_fixture)
+        
+        return formatted
+    
+    def _extract_team_statistics(self, response: Dict) -> Dict:
+        """Extrai estatísticas relevantes da resposta da API"""
+        fixtures = response.get('fixtures', {})
+        goals = response.get('goals', {})
+        
+        # Jogos totais
+        played = fixtures.get('played', {}).get('total', 0)
+        if played == 0:
+            played = 1  # Evita divisão por zero
+        
+        # Gols marcados
+        scored_total = goals.get('for', {}).get('total', {}).get('total', 0)
+        avg_scored = scored_total / played
+        
+        # Gols sofridos
+        conceded_total = goals.get('against', {}).get('total', {}).get('total', 0)
+        avg_conceded = conceded_total / played
+        
+        # Vitórias, empates, derrotas
+        wins = fixtures.get('wins', {}).get('total', 0)
+        draws = fixtures.get('draws', {}).get('total', 0)
+        losses = fixtures.get('loses', {}).get('total', 0)
+        
+        # Desempenho em casa vs fora
+        home_avg_scored = 0
+        home_avg_conceded = 0
+        away_avg_scored = 0
+        away_avg_conceded = 0
+        
+        home_played = fixtures.get('played', {}).get('home', 0)
+        away_played = fixtures.get('played', {}).get('away', 0)
+        
+        if home_played > 0:
+            home_scored = goals.get('for', {}).get('total', {}).get('home', 0)
+            home_conceded = goals.get('against', {}).get('total', {}).get('home', 0)
+            home_avg_scored = home_scored / home_played
+            home_avg_conceded = home_conceded / home_played
+        
+        if away_played > 0:
+            away_scored = goals.get('for', {}).get('total', {}).get('away', 0)
+            away_conceded = goals.get('against', {}).get('total', {}).get('away', 0)
+            away_avg_scored = away_scored / away_played
+            away_avg_conceded = away_conceded / away_played
+        
+        return {
+            'avg_scored': round(avg_scored, 2),
+            'avg_conceded': round(avg_conceded, 2),
+            'home_avg_scored': round(home_avg_scored, 2),
+            'home_avg_conceded': round(home_avg_conceded, 2),
+            'away_avg_scored': round(away_avg_scored, 2),
+            'away_avg_conceded': round(away_avg_conceded, 2),
+            'wins': wins,
+            'draws': draws,
+            'losses': losses,
+            'played': played
+        }
+    
+    def _extract_standing_statistics(self, row: Dict) -> Dict:
+        """Extrai estatísticas de uma linha de /standings (mesmo formato de _extract_team_statistics)"""
+        overall = row.get('all', {})
+        home = row.get('home', {})
+        away = row.get('away', {})
+        
+        played = overall.get('played', 0) or 1  # Evita divisão por zero
+        home_played = home.get('played', 0)
+        away_played = away.get('played', 0)
+        
+        def avg(goals: Optional[int], games: int) -> float:
+            return round((goals or 0) / games, 2) if games > 0 else 0
+        
+        # Forma: string tipo "WWDLW" (últimos 5 jogos)
+        form = [result for result in (row.get('form') or '') if result in ('W', 'D', 'L')][-5:]
+        
+        return {
+            'avg_scored': avg(overall.get('goals', {}).get('for'), played),
+            'avg_conceded': avg(overall.get('goals', {}).get('against'), played),
+            'home_avg_scored': avg(home.get('goals', {}).get('for'), home_played),
+            'home_avg_conceded': avg(home.get('goals', {}).get('against'), home_played),
+            'away_avg_scored': avg(away.get('goals', {}).get('for'), away_played),
+            'away_avg_conceded': avg(away.get('goals', {}).get('against'), away_played),
+            'wins': overall.get('win', 0),
+            'draws': overall.get('draw', 0),
+            'losses': overall.get('lose', 0),
+            'played': played,
+            'form': form
+        }
+    
+    def _get_match_result(self, fixture: Dict, team_id: int) -> Optional[str]:
+        """Retorna 'W', 'L' ou 'D' para o time específico"""
+        if fixture.get('fixture', {}).get('status', {}).get('short') not in ['FT', 'AET', 'PEN']:
+            return None
+        
+        teams = fixture.get('teams', {})
+        goals = fixture.get('goals', {})
+        
+        home_id = teams.get('home', {}).get('id')
+        away_id = teams.get('away', {}).get('id')
+        home_goals = goals.get('home', 0)
+        away_goals = goals.get('away', 0)
+        
+        if home_goals == away_goals:
+            return 'D'
+        
+        if team_id == home_id:
+            return 'W' if home_goals > away_goals else 'L'
+        elif team_id == away_id:
+            return 'W' if away_goals > home_goals else 'L'
+        
+        return None
+    
+    def _analyze_h2h(self, fixtures: List[Dict], team1_id: int, team2_id: int) -> Dict:
+        """Analisa confrontos diretos"""
+        team1_wins = 0
+        team2_wins = 0
+        draws = 0
+        
+        for fixture in fixtures:
+            if fixture.get('fixture', {}).get('status', {}).get('short') not in ['FT', 'AET', 'PEN']:
+                continue
+            
+            teams = fixture.get('teams', {})
+            goals = fixture.get('goals', {})
+            
+            home_id = teams.get('home', {}).get('id')
+            home_goals = goals.get('home', 0)
+            away_goals = goals.get('away', 0)
+            
+            if home_goals == away_goals:
+                draws += 1
+            elif home_id == team1_id:
+                if home_goals > away_goals:
+                    team1_wins += 1
+                else:
+                    team2_wins += 1
+            else:
+                if away_goals > home_goals:
+                    team1_wins += 1
+                else:
+                    team2_wins += 1
+        
+        return {
+            'team1_wins': team1_wins,
+            'team2_wins': team2_wins,
+            'draws': draws,
+            'total_games': team1_wins + team2_wins + draws
+        }
+
+
+class APIFootballService(APIFootballParser):
     """Serviço para API-Football (api-sports.io) com estatísticas avançadas"""
     
     def __init__(self):
         self.api_key = Config.API_FOOTBALL_KEY
         self.base_url = Config.API_FOOTBALL_BASE_URL
         self.cache = RedisCache()
+        self.single_flight = SingleFlight(self.cache)
+        self.refresher = ConditionalRefresh(self.cache, self.FORMAT_VERSION)
     
     def get_fixtures_by_date(self, date: str) -> List[Dict]:
         """
@@ -21,15 +234,19 @@ class APIFootballService:
         """
         cache_key = f"api_football_fixtures_{date}"
         
-        # Verifica cache
-        cached = self.cache.get(cache_key)
-        if cached:
-            print(f"📦 Usando cache (API-Football {date})")
-            return cached
-        
         if not self.api_key:
-            return []
-        
+            return NegativeCache.unwrap(self.cache.get(cache_key)) or []
+        
+        # Cache velho: devolve na hora e atualiza em segundo plano
+        # Sem cache: apenas 1 chamador por chave busca na API; os outros esperam
+        fixtures = self.single_flight.get_or_refresh(
+            cache_key, lambda: self._fetch_fixtures_by_date(date, cache_key),
+            self.FIXTURES_SOFT_TTL, self.FIXTURES_HARD_TTL, label=f"API-Football {date}"
+        )
+        return NegativeCache.unwrap(fixtures, [])
+    
+    def _fetch_fixtures_by_date(self, date: str, cache_key: str) -> List[Dict]:
+        """Busca fixtures na API (sem consultar cache) e salva no cache"""
         url = f"{self.base_url}/fixtures"
         headers = {
             'x-apisports-key': self.api_key
@@ -39,21 +256,97 @@ class APIFootballService:
         }
         
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            # Refresh condicional: payload igual reaproveita o resultado já formatado
+            fixtures, changes = self.refresher.fetch(
+                cache_key, url, lambda data: self._format_fixtures(data.get('response', [])),
+                params=params, headers=headers, ttl=self.FIXTURES_HARD_TTL,
+                provider='api_football', priority=Priority.HIGH
+            )
             
-            fixtures = self._format_fixtures(data.get('response', []))
+            # Cache por 6 horas (+ janela SWR); data sem jogos vira entrada negativa curta
+            if fixtures:
+                self.cache.set(cache_key, fixtures, expire_seconds=self.FIXTURES_HARD_TTL)
+            else:
+                self.cache.set_negative(cache_key)
             
-            # Cache por 6 horas
-            self.cache.set(cache_key, fixtures, expire_seconds=21600)
+            if not changes['modified']:
+                print(f"♻️  Fixtures {date} sem mudanças ({changes['reason']})")
             
             return fixtures
             
         except Exception as e:
             print(f"❌ Erro ao buscar fixtures da API-Football: {e}")
+            self.cache.set_negative(cache_key, error=e)
+            return []
+    
+    def get_fixtures_by_league(self, league_id: int, season: int, date: str) -> List[Dict]:
+        """
+        Busca jogos de uma liga/temporada em uma data (payload só da liga)
+        Args:
+            league_id: ID da liga na API-Football
+            season: Temporada (ex: 2025)
+            date: Data no formato YYYY-MM-DD
+        """
+        cache_key = f"api_football_fixtures_{league_id}_{season}_{date}"
+        
+        if not self.api_key:
+            return NegativeCache.unwrap(self.cache.get(cache_key)) or []
+        
+        fixtures = self.single_flight.get_or_refresh(
+            cache_key, lambda: self._fetch_fixtures_by_league(league_id, season, date, cache_key),
+            self.FIXTURES_SOFT_TTL, self.FIXTURES_HARD_TTL
+        )
+        return NegativeCache.unwrap(fixtures, [])
+    
+    def _fetch_fixtures_by_league(self, league_id: int, season: int, date: str, cache_key: str) -> List[Dict]:
+        """Busca fixtures da liga na API (sem consultar cache) e salva no cache"""
+        url = f"{self.base_url}/fixtures"
+        headers = {
+            'x-apisports-key': self.api_key
+        }
+        params = {
+            'league': league_id,
+            'season': season,
+            'date': date
+        }
+        
+        try:
+            fixtures, _ = self.refresher.fetch(
+                cache_key, url, lambda data: self._format_fixtures(data.get('response', [])),
+                params=params, headers=headers, ttl=self.FIXTURES_HARD_TTL,
+                provider='api_football', priority=Priority.HIGH
+            )
+            
+            # Cache por 6 horas (+ janela SWR); liga sem jogos na data vira entrada negativa curta
+            if fixtures:
+                self.cache.set(cache_key, fixtures, expire_seconds=self.FIXTURES_HARD_TTL, tags=[f"league:{league_id}"])
+            else:
+                self.cache.set_negative(cache_key, tags=[f"league:{league_id}"])
+            
+            return fixtures
+            
+        except Exception as e:
+            print(f"❌ Erro ao buscar fixtures da liga {league_id}: {e}")
+            self.cache.set_negative(cache_key, error=e, tags=[f"league:{league_id}"])
             return []
     
+    def get_fixtures_for_leagues(self, leagues: Iterable[Tuple[int, int]], date: str,
+                                 max_workers: Optional[int] = None) -> Dict[Tuple[int, int], List[Dict]]:
+        """
+        Busca fixtures de várias ligas em paralelo (1 requisição por liga)
+        Returns:
+            {(league_id, season): fixtures}
+        """
+        leagues = list(dict.fromkeys(leagues))
+        if not leagues:
+            return {}
+        
+        workers = max(1, min(max_workers or Config.API_FOOTBALL_MAX_CONCURRENCY, len(leagues)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fixtures") as executor:
+            results = list(executor.map(lambda key: self.get_fixtures_by_league(key[0], key[1], date), leagues))
+        
+        return dict(zip(leagues, results))
+    
     def get_fixtures_next_days(self, days: int = 3) -> List[Dict]:
         """Busca jogos dos próximos N dias"""
         all_fixtures = []
@@ -70,13 +363,31 @@ class APIFootballService:
         Busca estatísticas detalhadas de um time em uma liga/temporada
         Retorna: avg_scored, avg_conceded, wins, draws, losses, etc
         """
-        cache_key = f"api_football_team_stats_{team_id}_{league_id}_{season}"
+        cache_key = self._team_stats_cache_key(team_id, league_id, season)
         
-        # Verifica cache (24 horas)
+        # Verifica cache (24 horas; time sem stats: entrada negativa curta)
         cached = self.cache.get(cache_key)
-        if cached:
-            return cached
+        if cached is not None:
+            return NegativeCache.unwrap(cached)
         
+        return self._fetch_team_statistics_once(team_id, league_id, season)
+    
+    def _fetch_team_statistics_once(self, team_id: int, league_id: int, season: int) -> Optional[Dict]:
+        """Busca estatísticas com coalescência (1 busca por chave entre threads/workers)"""
+        return NegativeCache.unwrap(self.single_flight.do(
+            self._team_stats_cache_key(team_id, league_id, season),
+            lambda: self._fetch_team_statistics(team_id, league_id, season)
+        ))
+    
+    def _fetch_team_form_once(self, team_id: int, last_n_games: int = 5) -> List[str]:
+        """Busca forma recente com coalescência (1 busca por chave entre threads/workers)"""
+        return self._cached_form(self.single_flight.do(
+            self._team_form_cache_key(team_id, last_n_games),
+            lambda: self._fetch_team_form(team_id, last_n_games)
+        ), last_n_games)
+    
+    def _fetch_team_statistics(self, team_id: int, league_id: int, season: int) -> Optional[Dict]:
+        """Busca estatísticas na API (sem consultar cache) e salva no cache"""
         if not self.api_key:
             return None
         
@@ -91,22 +402,32 @@ class APIFootballService:
         }
         
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = HttpClient.get(
+                url, headers=headers, params=params,
+                provider='api_football', priority=Priority.NORMAL
+            )
             response.raise_for_status()
             data = response.json()
             
             if not data.get('response'):
+                self.cache.set_negative(
+                    self._team_stats_cache_key(team_id, league_id, season), tags=[f"league:{league_id}", f"team:{team_id}"]
+                )
                 return None
             
             stats = self._extract_team_statistics(data['response'])
             
             # Cache por 24 horas
-            self.cache.set(cache_key, stats, expire_seconds=86400)
+            self.cache.set(
+                self._team_stats_cache_key(team_id, league_id, season), stats, expire_seconds=86400,
+                tags=[f"league:{league_id}", f"team:{team_id}"]
+            )
             
             return stats
             
         except Exception as e:
             print(f"⚠️ Erro ao buscar estatísticas do time {team_id}: {e}")
+            self.cache.set_negative(self._team_stats_cache_key(team_id, league_id, season), error=e)
             return None
     
     def get_team_form(self, team_id: int, last_n_games: int = 5) -> List[str]:
@@ -114,13 +435,17 @@ class APIFootballService:
         Busca forma recente do time (últimos N jogos)
         Retorna: ['W', 'L', 'D', 'W', 'W']
         """
-        cache_key = f"api_football_team_form_{team_id}_{last_n_games}"
+        cache_key = self._team_form_cache_key(team_id, last_n_games)
         
-        # Verifica cache (6 horas)
+        # Verifica cache (6 horas; sem jogos recentes: entrada negativa curta)
         cached = self.cache.get(cache_key)
-        if cached:
-            return cached
+        if cached is not None:
+            return self._cached_form(cached, last_n_games)
         
+        return self._fetch_team_form_once(team_id, last_n_games)
+    
+    def _fetch_team_form(self, team_id: int, last_n_games: int = 5) -> List[str]:
+        """Busca forma recente na API (sem consultar cache) e salva no cache"""
         if not self.api_key:
             return ['D'] * last_n_games  # Retorna empates como fallback
         
@@ -134,7 +459,10 @@ class APIFootballService:
         }
         
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = HttpClient.get(
+                url, headers=headers, params=params,
+                provider='api_football', priority=Priority.NORMAL
+            )
             response.raise_for_status()
             data = response.json()
             
@@ -145,14 +473,149 @@ class APIFootballService:
                     form.append(result)
             
             # Cache por 6 horas
-            self.cache.set(cache_key, form, expire_seconds=21600)
+            cache_key = self._team_form_cache_key(team_id, last_n_games)
+            if form:
+                self.cache.set(cache_key, form, expire_seconds=21600, tags=[f"team:{team_id}"])
+            else:
+                self.cache.set_negative(cache_key, tags=[f"team:{team_id}"])
             
             return form
             
         except Exception as e:
             print(f"⚠️ Erro ao buscar forma do time {team_id}: {e}")
+            self.cache.set_negative(self._team_form_cache_key(team_id, last_n_games), error=e)
             return ['D'] * last_n_games
     
+    def prefetch_team_data(self, stats_keys: Iterable[Tuple[int, int, int]],
+                           form_team_ids: Iterable[int], last_n_games: int = 5,
+                           max_workers: Optional[int] = None) -> Dict[str, Dict]:
+        """
+        Pré-carrega stats e forma de todos os times do dia de uma vez
+        
+        Args:
+            stats_keys: Chaves (team_id, league_id, season) para /teams/statistics
+            form_team_ids: IDs dos times para forma recente
+            last_n_games: Jogos considerados na forma
+            max_workers: Máximo de requisições simultâneas
+        
+        Returns:
+            {'stats': {(team_id, league_id, season): stats}, 'form': {team_id: form}}
+        """
+        stats_keys = list(dict.fromkeys(stats_keys))
+        form_team_ids = list(dict.fromkeys(form_team_ids))
+        
+        prefetched = {'stats': {}, 'form': {}}
+        
+        # 1. Resolve tudo que já está no cache (uma ida ao Redis para stats e forma)
+        stats_cache_keys = {key: self._team_stats_cache_key(*key) for key in stats_keys}
+        form_cache_keys = {team_id: self._team_form_cache_key(team_id, last_n_games) for team_id in form_team_ids}
+        cached = self.cache.get_many([*stats_cache_keys.values(), *form_cache_keys.values()])
+        
+        # Entradas negativas também são hit (time sem stats/jogos, erro recente)
+        for key, cache_key in stats_cache_keys.items():
+            if cache_key in cached:
+                prefetched['stats'][key] = NegativeCache.unwrap(cached[cache_key])
+        
+        for team_id, cache_key in form_cache_keys.items():
+            if cache_key in cached:
+                prefetched['form'][team_id] = self._cached_form(cached[cache_key], last_n_games)
+        
+        stats_misses = [key for key in stats_keys if key not in prefetched['stats']]
+        form_misses = [team_id for team_id in form_team_ids if team_id not in prefetched['form']]
+        
+        print(f"   📦 Prefetch: {len(prefetched['stats'])}/{len(stats_keys)} stats e "
+              f"{len(prefetched['form'])}/{len(form_team_ids)} formas em cache")
+        
+        if not stats_misses and not form_misses:
+            return prefetched
+        
+        # 2. Busca os misses em paralelo (pool limitado)
+        workers = max(1, max_workers or Config.API_FOOTBALL_MAX_CONCURRENCY)
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="api-football") as executor:
+            stats_futures = {key: executor.submit(self._fetch_team_statistics_once, *key) for key in stats_misses}
+            form_futures = {
+                team_id: executor.submit(self._fetch_team_form_once, team_id, last_n_games)
+                for team_id in form_misses
+            }
+            
+            for key, future in stats_futures.items():
+                prefetched['stats'][key] = future.result()
+            
+            for team_id, future in form_futures.items():
+                prefetched['form'][team_id] = future.result()
+        
+        print(f"   🌐 Prefetch: {len(stats_misses)} stats e {len(form_misses)} formas buscadas na API")
+        
+        return prefetched
+    
+    def get_standings(self, league_id: int, season: int) -> Optional[Dict[int, Dict]]:
+        """
+        Busca a classificação da liga/temporada (1 requisição para a liga inteira)
+        Retorna {team_id: stats} no mesmo formato de get_team_statistics + 'form'
+        """
+        cache_key = f"api_football_standings_{league_id}_{season}"
+        
+        # Verifica cache (12 horas; liga sem tabela: entrada negativa curta)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            cached = NegativeCache.unwrap(cached)
+            # JSON transforma chaves int em str
+            return {int(team_id): stats for team_id, stats in cached.items()} if cached else None
+        
+        if not self.api_key:
+            return None
+        
+        standings = NegativeCache.unwrap(self.single_flight.do(
+            cache_key, lambda: self._fetch_standings(league_id, season, cache_key)
+        ))
+        if not standings:
+            return None
+        
+        return {int(team_id): stats for team_id, stats in standings.items()}
+    
+    def _fetch_standings(self, league_id: int, season: int, cache_key: str) -> Optional[Dict]:
+        """Busca classificação na API (sem consultar cache) e salva no cache"""
+        url = f"{self.base_url}/standings"
+        headers = {
+            'x-apisports-key': self.api_key
+        }
+        params = {
+            'league': league_id,
+            'season': season
+        }
+        
+        try:
+            response = HttpClient.get(
+                url, headers=headers, params=params,
+                provider='api_football', priority=Priority.NORMAL
+            )
+            response.raise_for_status()
+            data = response.json()
+            
+            standings = {}
+            for league_data in data.get('response', []):
+                # Ligas com grupos retornam várias tabelas
+                for group in league_data.get('league', {}).get('standings', []):
+                    for row in group:
+                        team_id = row.get('team', {}).get('id')
+                        if team_id:
+                            standings[str(team_id)] = self._extract_standing_statistics(row)
+            
+            if not standings:
+                self.cache.set_negative(cache_key, tags=[f"league:{league_id}"])
+                return None
+            
+            # Cache por 12 horas
+            self.cache.set(cache_key, standings, expire_seconds=43200, tags=[f"league:{league_id}"])
+            
+            return standings
+            
+        except Exception as e:
+            print(f"⚠️ Erro ao buscar classificação da liga {league_id}: {e}")
+            self.cache.set_negative(cache_key, error=e, tags=[f"league:{league_id}"])
+            return None
+    
     def get_head_to_head(self, team1_id: int, team2_id: int, last_n: int = 5) -> Dict:
         """
         Busca confrontos diretos entre dois times
@@ -162,8 +625,8 @@ class APIFootballService:
         
         # Verifica cache (24 horas)
         cached = self.cache.get(cache_key)
-        if cached:
-            return cached
+        if cached is not None:
+            return NegativeCache.unwrap(cached, {'team1_wins': 0, 'team2_wins': 0, 'draws': 0})
         
         if not self.api_key:
             return {'team1_wins': 0, 'team2_wins': 0, 'draws': 0}
@@ -178,7 +641,10 @@ class APIFootballService:
         }
         
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = HttpClient.get(
+                url, headers=headers, params=params,
+                provider='api_football', priority=Priority.LOW
+            )
             response.raise_for_status()
             data = response.json()
             
@@ -191,152 +657,5 @@ class APIFootballService:
             
         except Exception as e:
             print(f"⚠️ Erro ao buscar H2H: {e}")
+            self.cache.set_negative(cache_key, error=e)
             return {'team1_wins': 0, 'team2_wins': 0, 'draws': 0}
-    
-    def _format_fixtures(self, fixtures: List[Dict]) -> List[Dict]:
-        """Formata fixtures para padrão interno"""
-        formatted = []
-        
-        for fixture in fixtures:
-            # Filtra apenas jogos futuros ou ao vivo
-            status = fixture.get('fixture', {}).get('status', {}).get('short')
-            if status not in ['NS', 'TBD', '1H', '2H', 'HT', 'LIVE']:
-                continue
-            
-            fixture_data = fixture.get('fixture', {})
-            teams = fixture.get('teams', {})
-            league = fixture.get('league', {})
-            
-            formatted_fixture = {
-                'match_id': f"apif_{fixture_data.get('id')}",
-                'home_team': teams.get('home', {}).get('name', ''),
-                'away_team': teams.get('away', {}).get('name', ''),
-                'competition': league.get('name', 'Unknown'),
-                'date': fixture_data.get('date', ''),
-                'status': status,
-                'source': 'api-football',
-                'league_id': league.get('id'),
-                'home_team_id': teams.get('home', {}).get('id'),
-                'away_team_id': teams.get('away', {}).get('id')
-            }
-            
-            formatted.append(formatted_fixture)
-        
-        return formatted
-    
-    def _extract_team_statistics(self, response: Dict) -> Dict:
-        """Extrai estatísticas relevantes da resposta da API"""
-        fixtures = response.get('fixtures', {})
-        goals = response.get('goals', {})
-        
-        # Jogos totais
-        played = fixtures.get('played', {}).get('total', 0)
-        if played == 0:
-            played = 1  # Evita divisão por zero
-        
-        # Gols marcados
-        scored_total = goals.get('for', {}).get('total', {}).get('total', 0)
-        avg_scored = scored_total / played
-        
-        # Gols sofridos
-        conceded_total = goals.get('against', {}).get('total', {}).get('total', 0)
-        avg_conceded = conceded_total / played
-        
-        # Vitórias, empates, derrotas
-        wins = fixtures.get('wins', {}).get('total', 0)
-        draws = fixtures.get('draws', {}).get('total', 0)
-        losses = fixtures.get('loses', {}).get('total', 0)
-        
-        # Desempenho em casa vs fora
-        home_avg_scored = 0
-        home_avg_conceded = 0
-        away_avg_scored = 0
-        away_avg_conceded = 0
-        
-        home_played = fixtures.get('played', {}).get('home', 0)
-        away_played = fixtures.get('played', {}).get('away', 0)
-        
-        if home_played > 0:
-            home_scored = goals.get('for', {}).get('total', {}).get('home', 0)
-            home_conceded = goals.get('against', {}).get('total', {}).get('home', 0)
-            home_avg_scored = home_scored / home_played
-            home_avg_conceded = home_conceded / home_played
-        
-        if away_played > 0:
-            away_scored = goals.get('for', {}).get('total', {}).get('away', 0)
-            away_conceded = goals.get('against', {}).get('total', {}).get('away', 0)
-            away_avg_scored = away_scored / away_played
-            away_avg_conceded = away_conceded / away_played
-        
-        return {
-            'avg_scored': round(avg_scored, 2),
-            'avg_conceded': round(avg_conceded, 2),
-            'home_avg_scored': round(home_avg_scored, 2),
-            'home_avg_conceded': round(home_avg_conceded, 2),
-            'away_avg_scored': round(away_avg_scored, 2),
-            'away_avg_conceded': round(away_avg_conceded, 2),
-            'wins': wins,
-            'draws': draws,
-            'losses': losses,
-            'played': played
-        }
-    
-    def _get_match_result(self, fixture: Dict, team_id: int) -> Optional[str]:
-        """Retorna 'W', 'L' ou 'D' para o time específico"""
-        if fixture.get('fixture', {}).get('status', {}).get('short') not in ['FT', 'AET', 'PEN']:
-            return None
-        
-        teams = fixture.get('teams', {})
-        goals = fixture.get('goals', {})
-        
-        home_id = teams.get('home', {}).get('id')
-        away_id = teams.get('away', {}).get('id')
-        home_goals = goals.get('home', 0)
-        away_goals = goals.get('away', 0)
-        
-        if home_goals == away_goals:
-            return 'D'
-        
-        if team_id == home_id:
-            return 'W' if home_goals > away_goals else 'L'
-        elif team_id == away_id:
-            return 'W' if away_goals > home_goals else 'L'
-        
-        return None
-    
-    def _analyze_h2h(self, fixtures: List[Dict], team1_id: int, team2_id: int) -> Dict:
-        """Analisa confrontos diretos"""
-        team1_wins = 0
-        team2_wins = 0
-        draws = 0
-        
-        for fixture in fixtures:
-            if fixture.get('fixture', {}).get('status', {}).get('short') not in ['FT', 'AET', 'PEN']:
-                continue
-            
-            teams = fixture.get('teams', {})
-            goals = fixture.get('goals', {})
-            
-            home_id = teams.get('home', {}).get('id')
-            home_goals = goals.get('home', 0)
-            away_goals = goals.get('away', 0)
-            
-            if home_goals == away_goals:
-                draws += 1
-            elif home_id == team1_id:
-                if home_goals > away_goals:
-                    team1_wins += 1
-                else:
-                    team2_wins += 1
-            else:
-                if away_goals > home_goals:
-                    team1_wins += 1
-                else:
-                    team2_wins += 1
-        
-        return {
-            'team1_wins': team1_wins,
-            'team2_wins': team2_wins,
-            'draws': draws,
-            'total_games': team1_wins + team2_wins + draws
-        }
\ No newline at end of file
@@ -0,0 +1,291 @@
+import asyncio
+from typing import List, Dict, Optional, Iterable, Tuple
+from datetime import datetime, timedelta
+from config.config import Config
+from src.cache.async_redis_client import AsyncRedisCache
+from src.cache.negative_cache import NegativeCache
+from src.cache.single_flight import AsyncSingleFlight
+from src.cache.conditional_refresh import AsyncConditionalRefresh
+from src.services.api_football_service import APIFootballParser
+from src.utils.async_http_client import AsyncHttpClient
+from src.utils.quota_scheduler import Priority
+
+
+class AsyncAPIFootballService(APIFootballParser):
+    """
+    Versão asyncio do APIFootballService (mesmas chaves de cache e extratores, via APIFootballParser)
+    Todas as chamadas simultâneas dividem um semáforo de API_FOOTBALL_MAX_CONCURRENCY
+    Só expõe métodos async: os métodos sync do APIFootballService não existem aqui
+    """
+
+    def __init__(self):
+        self.api_key = Config.API_FOOTBALL_KEY
+        self.base_url = Config.API_FOOTBALL_BASE_URL
+        self.cache = AsyncRedisCache()
+        self.single_flight = AsyncSingleFlight(self.cache)
+        self.refresher = AsyncConditionalRefresh(self.cache, self.FORMAT_VERSION)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(max(1, Config.API_FOOTBALL_MAX_CONCURRENCY))
+        return self._semaphore
+
+    async def _get_json(self, path: str, params: Dict, priority: int) -> Dict:
+        """GET na API-Football (limitado pelo semáforo) e retorna o JSON"""
+        async with self.semaphore:
+            response = await AsyncHttpClient.get(
+                f"{self.base_url}{path}", headers={'x-apisports-key': self.api_key}, params=params,
+                provider='api_football', priority=priority
+            )
+        response.raise_for_status()
+        return response.json()
+
+    # =========================
+    # 🔹 FIXTURES
+    # =========================
+    async def get_fixtures_by_date(self, date: str) -> List[Dict]:
+        """Jogos de uma data (mesmo cache de 6h do APIFootballService)"""
+        cache_key = f"api_football_fixtures_{date}"
+
+        if not self.api_key:
+            return NegativeCache.unwrap(await self.cache.get(cache_key)) or []
+
+        fixtures = await self.single_flight.get_or_refresh(
+            cache_key, lambda: self._fetch_fixtures(cache_key, {'date': date}, f"data {date}"),
+            self.FIXTURES_SOFT_TTL, self.FIXTURES_HARD_TTL, label=f"API-Football {date}"
+        )
+        return NegativeCache.unwrap(fixtures, [])
+
+    async def get_fixtures_next_days(self, days: int = 3) -> List[Dict]:
+        """Jogos dos próximos N dias (datas buscadas ao mesmo tempo)"""
+        dates = [(datetime.now() + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(days)]
+        results = await asyncio.gather(*(self.get_fixtures_by_date(date) for date in dates))
+        return [fixture for fixtures in results for fixture in fixtures]
+
+    async def get_fixtures_by_league(self, league_id: int, season: int, date: str) -> List[Dict]:
+        """Jogos de uma liga/temporada em uma data (mesmo cache de 6h)"""
+        cache_key = f"api_football_fixtures_{league_id}_{season}_{date}"
+
+        if not self.api_key:
+            return NegativeCache.unwrap(await self.cache.get(cache_key)) or []
+
+        params = {'league': league_id, 'season': season, 'date': date}
+        fixtures = await self.single_flight.get_or_refresh(
+            cache_key, lambda: self._fetch_fixtures(cache_key, params, f"liga {league_id}"),
+            self.FIXTURES_SOFT_TTL, self.FIXTURES_HARD_TTL
+        )
+        return NegativeCache.unwrap(fixtures, [])
+
+    async def _fetch_fixtures(self, cache_key: str, params: Dict, label: str) -> List[Dict]:
+        """Busca fixtures na API (refresh condicional) e salva no cache"""
+        tags = [f"league:{params['league']}"] if 'league' in params else None
+        try:
+            async with self.semaphore:
+                fixtures, changes = await self.refresher.fetch(
+                    cache_key, f"{self.base_url}/fixtures",
+                    lambda data: self._format_fixtures(data.get('response', [])),
+                    params=params, headers={'x-apisports-key': self.api_key}, ttl=self.FIXTURES_HARD_TTL,
+                    provider='api_football', priority=Priority.HIGH
+                )
+
+            # Cache por 6 horas (+ janela SWR); sem jogos vira entrada negativa curta
+            if fixtures:
+                await self.cache.set(cache_key, fixtures, expire_seconds=self.FIXTURES_HARD_TTL, tags=tags)
+            else:
+                await self.cache.set_negative(cache_key, tags=tags)
+
+            return fixtures
+
+        except Exception as e:
+            print(f"❌ Erro ao buscar fixtures da API-Football ({label}): {e}")
+            await self.cache.set_negative(cache_key, error=e, tags=tags)
+            return []
+
+    async def get_fixtures_for_leagues(self, leagues: Iterable[Tuple[int, int]],
+                                       date: str) -> Dict[Tuple[int, int], List[Dict]]:
+        """Fixtures de várias ligas ao mesmo tempo. Retorna {(league_id, season): fixtures}"""
+        leagues = list(dict.fromkeys(leagues))
+        results = await asyncio.gather(*(self.get_fixtures_by_league(l, s, date) for l, s in leagues))
+        return dict(zip(leagues, results))
+
+    # =========================
+    # 🔹 CLASSIFICAÇÃO
+    # =========================
+    async def get_standings(self, league_id: int, season: int) -> Optional[Dict[int, Dict]]:
+        """Classificação da liga/temporada (mesmo cache de 12h)"""
+        cache_key = f"api_football_standings_{league_id}_{season}"
+
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            cached = NegativeCache.unwrap(cached)
+            # JSON transforma chaves int em str
+            return {int(team_id): stats for team_id, stats in cached.items()} if cached else None
+
+        if not self.api_key:
+            return None
+
+        standings = NegativeCache.unwrap(await self.single_flight.do(
+            cache_key, lambda: self._fetch_standings(league_id, season, cache_key)
+        ))
+        if not standings:
+            return None
+
+        return {int(team_id): stats for team_id, stats in standings.items()}
+
+    async def _fetch_standings(self, league_id: int, season: int, cache_key: str) -> Optional[Dict]:
+        """Busca classificação na API (sem consultar cache) e salva no cache"""
+        try:
+            data = await self._get_json('/standings', {'league': league_id, 'season': season}, Priority.NORMAL)
+
+            standings = {}
+            for league_data in data.get('response', []):
+                # Ligas com grupos retornam várias tabelas
+                for group in league_data.get('league', {}).get('standings', []):
+                    for row in group:
+                        team_id = row.get('team', {}).get('id')
+                        if team_id:
+                            standings[str(team_id)] = self._extract_standing_statistics(row)
+
+            if not standings:
+                await self.cache.set_negative(cache_key, tags=[f"league:{league_id}"])
+                return None
+
+            # Cache por 12 horas
+            await self.cache.set(cache_key, standings, expire_seconds=43200, tags=[f"league:{league_id}"])
+
+            return standings
+
+        except Exception as e:
+            print(f"⚠️ Erro ao buscar classificação da liga {league_id}: {e}")
+            await self.cache.set_negative(cache_key, error=e, tags=[f"league:{league_id}"])
+            return None
+
+    # =========================
+    # 🔹 STATS E FORMA POR TIME
+    # =========================
+    async def get_team_statistics(self, team_id: int, league_id: int, season: int) -> Optional[Dict]:
+        cache_key = self._team_stats_cache_key(team_id, league_id, season)
+
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return NegativeCache.unwrap(cached)
+
+        return NegativeCache.unwrap(await self.single_flight.do(
+            cache_key, lambda: self._fetch_team_statistics(team_id, league_id, season)
+        ))
+
+    async def _fetch_team_statistics(self, team_id: int, league_id: int, season: int) -> Optional[Dict]:
+        """Busca estatísticas na API (sem consultar cache) e salva no cache"""
+        if not self.api_key:
+            return None
+
+        try:
+            data = await self._get_json(
+                '/teams/statistics', {'team': team_id, 'league': league_id, 'season': season}, Priority.NORMAL
+            )
+
+            if not data.get('response'):
+                await self.cache.set_negative(
+                    self._team_stats_cache_key(team_id, league_id, season), tags=[f"league:{league_id}", f"team:{team_id}"]
+                )
+                return None
+
+            stats = self._extract_team_statistics(data['response'])
+
+            # Cache por 24 horas
+            await self.cache.set(
+                self._team_stats_cache_key(team_id, league_id, season), stats, expire_seconds=86400,
+                tags=[f"league:{league_id}", f"team:{team_id}"]
+            )
+
+            return stats
+
+        except Exception as e:
+            print(f"⚠️ Erro ao buscar estatísticas do time {team_id}: {e}")
+            await self.cache.set_negative(self._team_stats_cache_key(team_id, league_id, season), error=e)
+            return None
+
+    async def get_team_form(self, team_id: int, last_n_games: int = 5) -> List[str]:
+        cache_key = self._team_form_cache_key(team_id, last_n_games)
+
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return self._cached_form(cached, last_n_games)
+
+        form = await self.single_flight.do(cache_key, lambda: self._fetch_team_form(team_id, last_n_games))
+        return self._cached_form(form, last_n_games)
+
+    async def _fetch_team_form(self, team_id: int, last_n_games: int = 5) -> List[str]:
+        """Busca forma recente na API (sem consultar cache) e salva no cache"""
+        if not self.api_key:
+            return ['D'] * last_n_games  # Retorna empates como fallback
+
+        try:
+            data = await self._get_json('/fixtures', {'team': team_id, 'last': last_n_games}, Priority.NORMAL)
+
+            form = []
+            for fixture in data.get('response', []):
+                result = self._get_match_result(fixture, team_id)
+                if result:
+                    form.append(result)
+
+            # Cache por 6 horas
+            cache_key = self._team_form_cache_key(team_id, last_n_games)
+            if form:
+                await self.cache.set(cache_key, form, expire_seconds=21600, tags=[f"team:{team_id}"])
+            else:
+                await self.cache.set_negative(cache_key, tags=[f"team:{team_id}"])
+
+            return form
+
+        except Exception as e:
+            print(f"⚠️ Erro ao buscar forma do time {team_id}: {e}")
+            await self.cache.set_negative(self._team_form_cache_key(team_id, last_n_games), error=e)
+            return ['D'] * last_n_games
+
+    async def prefetch_team_data(self, stats_keys: Iterable[Tuple[int, int, int]],
+                                 form_team_ids: Iterable[int], last_n_games: int = 5) -> Dict[str, Dict]:
+        """
+        Pré-carrega stats e forma de vários times ao mesmo tempo
+        Returns:
+            {'stats': {(team_id, league_id, season): stats}, 'form': {team_id: form}}
+        """
+        stats_keys = list(dict.fromkeys(stats_keys))
+        form_team_ids = list(dict.fromkeys(form_team_ids))
+
+        # Cache primeiro, numa única ida ao Redis
+        stats_cache_keys = {key: self._team_stats_cache_key(*key) for key in stats_keys}
+        form_cache_keys = {team_id: self._team_form_cache_key(team_id, last_n_games) for team_id in form_team_ids}
+        cached = await self.cache.get_many([*stats_cache_keys.values(), *form_cache_keys.values()])
+
+        # Entradas negativas também são hit (time sem stats/jogos, erro recente)
+        prefetched = {
+            'stats': {key: NegativeCache.unwrap(cached[k]) for key, k in stats_cache_keys.items() if k in cached},
+            'form': {
+                team_id: self._cached_form(cached[k], last_n_games)
+                for team_id, k in form_cache_keys.items() if k in cached
+            },
+        }
+        stats_misses = [key for key in stats_keys if key not in prefetched['stats']]
+        form_misses = [team_id for team_id in form_team_ids if team_id not in prefetched['form']]
+
+        async def fetch_stats(key):
+            return NegativeCache.unwrap(await self.single_flight.do(
+                stats_cache_keys[key], lambda: self._fetch_team_statistics(*key)
+            ))
+
+        async def fetch_form(team_id):
+            return self._cached_form(await self.single_flight.do(
+                form_cache_keys[team_id], lambda: self._fetch_team_form(team_id, last_n_games)
+            ), last_n_games)
+
+        stats, forms = await asyncio.gather(
+            asyncio.gather(*(fetch_stats(key) for key in stats_misses)),
+            asyncio.gather(*(fetch_form(team_id) for team_id in form_misses)),
+        )
+
+        prefetched['stats'].update(zip(stats_misses, stats))
+        prefetched['form'].update(zip(form_misses, forms))
+        return prefetched
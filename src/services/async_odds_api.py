@@ -0,0 +1,171 @@
+import asyncio
+from typing import List, Dict, Optional, Tuple
+from datetime import datetime
+from config.config import Config
+from src.cache.async_redis_client import AsyncRedisCache
+from src.cache.negative_cache import NegativeCache
+from src.cache.single_flight import AsyncSingleFlight
+from src.cache.conditional_refresh import AsyncConditionalRefresh
+from src.services.odds_api import OddsAPIParser
+from src.utils.api_retry import is_rate_limit_error
+from src.utils.async_http_client import AsyncHttpClient
+from src.utils.quota_scheduler import Priority
+
+
+class AsyncOddsAPI(OddsAPIParser):
+    """
+    Versão asyncio do OddsAPI (mesmas chaves de cache e formatadores, via OddsAPIParser)
+    Ligas e eventos são buscados com asyncio.gather, limitados por semáforo
+    Só expõe métodos async: os métodos sync do OddsAPI não existem aqui
+    """
+
+    def __init__(self):
+        self.api_key = Config.ODDS_API_KEY
+        self.base_url = Config.ODDS_API_BASE_URL
+        self.cache = AsyncRedisCache()
+        self.single_flight = AsyncSingleFlight(self.cache)
+        self.refresher = AsyncConditionalRefresh(self.cache, self.FORMAT_VERSION)
+
+    # =========================
+    # 🔹 BUSCA DE ODDS (ETAPA 1)
+    # =========================
+    async def get_odds_for_sport(self, sport: str) -> List[Dict]:
+        """Odds principais de uma liga (mesmo cache de 12h do OddsAPI)"""
+        cache_key = f"odds:{sport}:{datetime.now().strftime('%Y-%m-%d')}"
+
+        if not self.api_key:
+            return NegativeCache.unwrap(await self.cache.get(cache_key)) or []
+
+        odds = await self.single_flight.get_or_refresh(
+            cache_key, lambda: self._fetch_odds_for_sport(sport, cache_key),
+            self.ODDS_SOFT_TTL, self.ODDS_HARD_TTL, label=f"odds {sport}"
+        )
+        return NegativeCache.unwrap(odds, [])
+
+    async def _fetch_odds_for_sport(self, sport: str, cache_key: str) -> List[Dict]:
+        """Busca odds na API (sem consultar cache) e salva no cache"""
+        url = f"{self.base_url}/sports/{sport}/odds"
+
+        params = {
+            "apiKey": self.api_key,
+            "regions": Config.ODDS_API_REGIONS,
+            "markets": Config.ODDS_API_BULK_MARKETS,
+            "oddsFormat": "decimal",
+        }
+
+        try:
+            formatted, changes = await self.refresher.fetch(
+                cache_key, url, self._format_odds, params=params, ttl=self.ODDS_HARD_TTL,
+                provider="odds_api", cost=self._credit_cost(params), priority=Priority.HIGH
+            )
+        except Exception as e:
+            if not is_rate_limit_error(e):
+                await self.cache.set_negative(cache_key, error=e, tags=[f"sport:{sport}"])
+            raise
+
+        if formatted:
+            await self.cache.set(cache_key, formatted, expire_seconds=self.ODDS_HARD_TTL, tags=[f"sport:{sport}"])  # 12 HORAS + SWR
+        else:
+            await self.cache.set_negative(cache_key, tags=[f"sport:{sport}"])  # Liga sem jogos com odds
+
+        if not changes['modified']:
+            print(f"♻️  Odds {sport} sem mudanças ({changes['reason']})")
+
+        return formatted
+
+    async def gather_odds_for_sports(self, sports: List[str], max_concurrency: Optional[int] = None
+                                     ) -> List[Tuple[str, List[Dict], Optional[Exception]]]:
+        """
+        Busca odds de várias ligas ao mesmo tempo
+        Retorna [(sport, odds, erro)]; erro de uma liga não afeta as outras
+        """
+        sports = list(dict.fromkeys(sports))
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or Config.ODDS_API_MAX_CONCURRENCY))
+
+        async def fetch(sport: str) -> Tuple[str, List[Dict], Optional[Exception]]:
+            async with semaphore:
+                try:
+                    return sport, await self.get_odds_for_sport(sport) or [], None
+                except Exception as e:
+                    return sport, [], e
+
+        return list(await asyncio.gather(*(fetch(sport) for sport in sports)))
+
+    # =========================
+    # 🔹 MERCADOS EXTRAS POR EVENTO (ETAPA 2)
+    # =========================
+    async def get_event_odds(self, sport: str, event_id: str, markets: Optional[str] = None) -> Dict:
+        """Mercados extras de UM evento (mesmo cache de 12h do OddsAPI)"""
+        markets = markets or Config.ODDS_API_EVENT_MARKETS
+        cache_key = f"odds:event:{event_id}:{markets}:{datetime.now().strftime('%Y-%m-%d')}"
+
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return NegativeCache.unwrap(cached, {})
+
+        if not self.api_key:
+            return {}
+
+        return NegativeCache.unwrap(await self.single_flight.do(
+            cache_key, lambda: self._fetch_event_odds(sport, event_id, markets, cache_key)
+        ), {})
+
+    async def _fetch_event_odds(self, sport: str, event_id: str, markets: str, cache_key: str) -> Dict:
+        """Busca odds de um evento na API (sem consultar cache) e salva no cache"""
+        url = f"{self.base_url}/sports/{sport}/events/{event_id}/odds"
+
+        params = {
+            "apiKey": self.api_key,
+            "regions": Config.ODDS_API_EVENT_REGIONS,
+            "markets": markets,
+            "oddsFormat": "decimal",
+        }
+
+        try:
+            response = await AsyncHttpClient.get(
+                url, params=params,
+                provider="odds_api", cost=self._credit_cost(params), priority=Priority.NORMAL
+            )
+            response.raise_for_status()
+        except Exception as e:
+            if not is_rate_limit_error(e):
+                await self.cache.set_negative(cache_key, error=e, tags=[f"sport:{sport}"])
+            raise
+
+        formatted = self._format_odds([response.json()])
+        event_markets = formatted[0]["markets"] if formatted else {}
+
+        if event_markets:
+            await self.cache.set(cache_key, event_markets, expire_seconds=43200, tags=[f"sport:{sport}"])  # 12 HORAS
+        else:
+            await self.cache.set_negative(cache_key, tags=[f"sport:{sport}"])  # Evento sem os mercados pedidos
+
+        return event_markets
+
+    async def get_event_odds_batch(self, events: List[Dict],
+                                   max_concurrency: Optional[int] = None) -> Dict[str, Dict]:
+        """
+        Mercados extras de vários eventos ao mesmo tempo
+        Retorna {match_id: mercados}. Eventos com erro ficam de fora.
+        """
+        events = [e for e in events if e.get("sport_key") and e.get("match_id")]
+        if not events:
+            return {}
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or Config.ODDS_API_MAX_CONCURRENCY))
+
+        async def fetch(event: Dict) -> Optional[Dict]:
+            async with semaphore:
+                try:
+                    return await self.get_event_odds(event["sport_key"], event["match_id"]) or {}
+                except Exception as e:
+                    print(f"⚠️ Falha ao buscar mercados extras do evento {event['match_id']}: {e}")
+                    return None
+
+        results = await asyncio.gather(*(fetch(event) for event in events))
+
+        return {
+            event["match_id"]: markets
+            for event, markets in zip(events, results)
+            if markets is not None
+        }
@@ -1,9 +1,9 @@
-import requests
 from datetime import datetime, timedelta
 from typing import List, Dict
 from config.config import Config
 from src.cache.redis_client import RedisCache
 from src.utils.api_retry import retry_on_rate_limit
+from src.utils.http_client import HttpClient
 
 class FootballAPI:
     """Serviço para buscar dados de jogos com cache Redis"""
@@ -33,7 +33,7 @@ class FootballAPI:
         url = f"{self.base_url}/matches"
         params = {'dateFrom': today, 'dateTo': today}
         
-        response = requests.get(url, headers=self.headers, params=params)
+        response = HttpClient.get(url, headers=self.headers, params=params)
         response.raise_for_status()
         
         matches = response.json().get('matches', [])
@@ -64,7 +64,7 @@ class FootballAPI:
         url = f"{self.base_url}/matches"
         params = {'dateFrom': date_from, 'dateTo': date_to}
         
-        response = requests.get(url, headers=self.headers, params=params)
+        response = HttpClient.get(url, headers=self.headers, params=params)
         response.raise_for_status()
         
         matches = response.json().get('matches', [])
@@ -105,7 +105,7 @@ class FootballAPI:
         url = f"{self.base_url}/teams/{team_id}/matches"
         params = {'limit': last_n_games}
         
-        response = requests.get(url, headers=self.headers, params=params)
+        response = HttpClient.get(url, headers=self.headers, params=params)
         response.raise_for_status()
         
         matches = response.json().get('matches', [])
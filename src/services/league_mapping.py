@@ -0,0 +1,80 @@
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+
+# Mapeamento Odds API (sport key) -> API-Football (league id)
+# calendar:
+#   'european'      -> temporada começa no meio do ano (2025/26 = season 2025)
+#   'calendar_year' -> temporada = ano civil (Brasil, MLS, Japão...)
+ODDS_TO_API_FOOTBALL: Dict[str, Dict] = {
+    # Inglaterra
+    'soccer_epl': {'league_id': 39, 'name': 'Premier League', 'calendar': 'european'},
+    'soccer_efl_champ': {'league_id': 40, 'name': 'Championship', 'calendar': 'european'},
+    'soccer_england_league1': {'league_id': 41, 'name': 'League One', 'calendar': 'european'},
+    'soccer_england_league2': {'league_id': 42, 'name': 'League Two', 'calendar': 'european'},
+    'soccer_fa_cup': {'league_id': 45, 'name': 'FA Cup', 'calendar': 'european'},
+
+    # Espanha
+    'soccer_spain_la_liga': {'league_id': 140, 'name': 'La Liga', 'calendar': 'european'},
+    'soccer_spain_segunda_division': {'league_id': 141, 'name': 'Segunda División', 'calendar': 'european'},
+
+    # Alemanha
+    'soccer_germany_bundesliga': {'league_id': 78, 'name': 'Bundesliga', 'calendar': 'european'},
+    'soccer_germany_bundesliga2': {'league_id': 79, 'name': '2. Bundesliga', 'calendar': 'european'},
+
+    # Itália
+    'soccer_italy_serie_a': {'league_id': 135, 'name': 'Serie A', 'calendar': 'european'},
+    'soccer_italy_serie_b': {'league_id': 136, 'name': 'Serie B', 'calendar': 'european'},
+
+    # França
+    'soccer_france_ligue_one': {'league_id': 61, 'name': 'Ligue 1', 'calendar': 'european'},
+    'soccer_france_ligue_two': {'league_id': 62, 'name': 'Ligue 2', 'calendar': 'european'},
+
+    # Outras ligas europeias
+    'soccer_portugal_primeira_liga': {'league_id': 94, 'name': 'Primeira Liga', 'calendar': 'european'},
+    'soccer_netherlands_eredivisie': {'league_id': 88, 'name': 'Eredivisie', 'calendar': 'european'},
+    'soccer_belgium_first_div': {'league_id': 144, 'name': 'Jupiler Pro League', 'calendar': 'european'},
+    'soccer_turkey_super_league': {'league_id': 203, 'name': 'Süper Lig', 'calendar': 'european'},
+    'soccer_spl': {'league_id': 179, 'name': 'Premiership', 'calendar': 'european'},
+    'soccer_greece_super_league': {'league_id': 197, 'name': 'Super League 1', 'calendar': 'european'},
+    'soccer_austria_bundesliga': {'league_id': 218, 'name': 'Bundesliga (Áustria)', 'calendar': 'european'},
+    'soccer_switzerland_superleague': {'league_id': 207, 'name': 'Super League', 'calendar': 'european'},
+    'soccer_denmark_superliga': {'league_id': 119, 'name': 'Superliga', 'calendar': 'european'},
+
+    # Competições UEFA
+    'soccer_uefa_champs_league': {'league_id': 2, 'name': 'UEFA Champions League', 'calendar': 'european'},
+    'soccer_uefa_europa_league': {'league_id': 3, 'name': 'UEFA Europa League', 'calendar': 'european'},
+    'soccer_uefa_europa_conference_league': {'league_id': 848, 'name': 'UEFA Conference League', 'calendar': 'european'},
+
+    # Américas
+    'soccer_brazil_campeonato': {'league_id': 71, 'name': 'Brasileirão Série A', 'calendar': 'calendar_year'},
+    'soccer_brazil_serie_b': {'league_id': 72, 'name': 'Brasileirão Série B', 'calendar': 'calendar_year'},
+    'soccer_argentina_primera_division': {'league_id': 128, 'name': 'Liga Profesional', 'calendar': 'calendar_year'},
+    'soccer_usa_mls': {'league_id': 253, 'name': 'MLS', 'calendar': 'calendar_year'},
+    'soccer_mexico_ligamx': {'league_id': 262, 'name': 'Liga MX', 'calendar': 'european'},
+    'soccer_conmebol_copa_libertadores': {'league_id': 13, 'name': 'Copa Libertadores', 'calendar': 'calendar_year'},
+
+    # Ásia
+    'soccer_japan_j_league': {'league_id': 98, 'name': 'J1 League', 'calendar': 'calendar_year'},
+    'soccer_korea_kleague1': {'league_id': 292, 'name': 'K League 1', 'calendar': 'calendar_year'},
+}
+
+
+def season_for(calendar: str = 'european', on_date: Optional[date] = None) -> int:
+    """Temporada da API-Football para a data (ex.: out/2025 na Europa -> 2025)"""
+    on_date = on_date or date.today()
+
+    if calendar == 'calendar_year':
+        return on_date.year
+
+    # Temporadas europeias começam em julho/agosto
+    return on_date.year if on_date.month >= 7 else on_date.year - 1
+
+
+def get_api_football_league(sport_key: str, on_date: Optional[date] = None) -> Optional[Tuple[int, int]]:
+    """Retorna (league_id, season) da API-Football para um sport key da Odds API"""
+    mapping = ODDS_TO_API_FOOTBALL.get(sport_key)
+    if not mapping:
+        return None
+
+    return mapping['league_id'], season_for(mapping['calendar'], on_date)
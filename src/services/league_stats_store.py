@@ -0,0 +1,76 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
+from config.config import Config
+
+
+class LeagueStatsStore:
+    """
+    Estatísticas de todos os times de uma liga/temporada a partir de /standings
+
+    Uma única requisição por liga (cache 12h) substitui as chamadas
+    /teams/statistics + /fixtures?team=&last=5 de cada time.
+    Lookup O(1) por team_id depois de carregado.
+    """
+
+    def __init__(self, api_football):
+        self.api_football = api_football
+        self._leagues: Dict[Tuple[int, int], Dict[int, Dict]] = {}
+        self._teams: Dict[Tuple[int, int, int], Dict] = {}
+        self._by_team: Dict[int, Dict] = {}
+
+    def load(self, league_id: int, season: int) -> bool:
+        """Carrega (uma vez) a liga/temporada. Retorna True se há dados"""
+        self.load_many([(league_id, season)])
+        return bool(self._leagues.get((league_id, season)))
+
+    def load_many(self, leagues: Iterable[Tuple[int, int]], max_workers: Optional[int] = None) -> int:
+        """Carrega várias ligas em paralelo (1 requisição por liga). Retorna quantas têm dados"""
+        leagues = list(dict.fromkeys(leagues))
+        pending = [key for key in leagues if key not in self._leagues]
+
+        if pending:
+            workers = max(1, min(max_workers or Config.API_FOOTBALL_MAX_CONCURRENCY, len(pending)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="standings") as executor:
+                results = list(executor.map(lambda key: self.api_football.get_standings(*key) or {}, pending))
+
+            for key, standings in zip(pending, results):
+                self._index(key, standings)
+
+        return sum(1 for key in leagues if self._leagues.get(key))
+
+    def _index(self, key: Tuple[int, int], standings: Dict[int, Dict]):
+        """Indexa a classificação da liga por (time, liga, temporada) e por time"""
+        league_id, season = key
+        self._leagues[key] = standings
+        for team_id, stats in standings.items():
+            self._teams[(team_id, league_id, season)] = stats
+            self._by_team[team_id] = stats
+
+    def get(self, team_id: int, league_id: Optional[int] = None, season: Optional[int] = None) -> Optional[Dict]:
+        """
+        Stats do time (mesmo formato de get_team_statistics + 'form')
+        Sem liga/temporada, usa a última liga carregada que contém o time
+        """
+        if league_id is None or season is None:
+            return self._by_team.get(team_id)
+        return self._teams.get((team_id, league_id, season))
+
+
+class AsyncLeagueStatsStore(LeagueStatsStore):
+    """LeagueStatsStore sobre AsyncAPIFootballService (classificações buscadas ao mesmo tempo)"""
+
+    async def load(self, league_id: int, season: int) -> bool:
+        await self.load_many([(league_id, season)])
+        return bool(self._leagues.get((league_id, season)))
+
+    async def load_many(self, leagues: Iterable[Tuple[int, int]], max_workers: Optional[int] = None) -> int:
+        """Carrega várias ligas (o semáforo do serviço limita as chamadas simultâneas)"""
+        leagues = list(dict.fromkeys(leagues))
+        pending = [key for key in leagues if key not in self._leagues]
+
+        results = await asyncio.gather(*(self.api_football.get_standings(*key) for key in pending))
+        for key, standings in zip(pending, results):
+            self._index(key, standings or {})
+
+        return sum(1 for key in leagues if self._leagues.get(key))
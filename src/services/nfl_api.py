@@ -1,8 +1,8 @@
-import requests
 from datetime import datetime, timedelta
 from typing import List, Dict
 from src.cache.redis_client import RedisCache
 from src.utils.api_retry import retry_on_rate_limit
+from src.utils.http_client import HttpClient
 
 class NFLAPI:
     """Serviço para buscar dados da NFL via ESPN API"""
@@ -24,7 +24,7 @@ class NFLAPI:
         
         url = f"{self.base_url}/scoreboard"
         
-        response = requests.get(url)
+        response = HttpClient.get(url)
         response.raise_for_status()
         
         data = response.json()
@@ -49,7 +49,7 @@ class NFLAPI:
         
         url = f"{self.base_url}/scoreboard"
         
-        response = requests.get(url)
+        response = HttpClient.get(url)
         response.raise_for_status()
         
         data = response.json()
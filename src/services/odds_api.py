@@ -1,18 +1,175 @@
-import requests
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Iterator, Optional, Tuple
 from datetime import datetime
 from config.config import Config
+from src.cache.negative_cache import NegativeCache
 from src.cache.redis_client import RedisCache
-from src.utils.api_retry import retry_on_rate_limit
+from src.cache.single_flight import SingleFlight
+from src.cache.conditional_refresh import ConditionalRefresh
+from src.utils.api_retry import is_rate_limit_error, retry_on_rate_limit
+from src.utils.http_client import HttpClient
+from src.utils.quota_scheduler import Priority
+
+
+class OddsAPIParser:
+    """
+    Constantes, chaves e formatadores da The Odds API (sem I/O)
+    Base comum do OddsAPI e do AsyncOddsAPI: o cliente async não herda métodos sync
+    """
+
+    # Odds por liga: frescas por 12h; depois disso servidas velhas por mais SWR_STALE_TTL
+    # enquanto 1 refresh roda em segundo plano
+    ODDS_SOFT_TTL = 43200
+    ODDS_HARD_TTL = ODDS_SOFT_TTL + Config.SWR_STALE_TTL
+    # Versão do _format_odds: suba ao mudar chaves/estrutura (descarta resultados guardados nos validadores)
+    FORMAT_VERSION = 2
+
+    def get_odds_changes(self, sport: str) -> Optional[Dict]:
+        """
+        match_ids adicionados/alterados/removidos no último refresh da liga
+        (None se a liga veio do cache ou não foi buscada neste processo)
+        """
+        return self.refresher.get_changes(f"odds:{sport}:{datetime.now().strftime('%Y-%m-%d')}")
+
+    @staticmethod
+    def _credit_cost(params: Dict) -> int:
+        """Custo em créditos da Odds API: nº de mercados x nº de regiões"""
+        markets = [m for m in params.get("markets", "").split(",") if m]
+        regions = [r for r in params.get("regions", "").split(",") if r]
+        return max(1, len(markets)) * max(1, len(regions))
+
+    # =========================
+    # 🔹 FORMATADORES
+    # =========================
+    def _format_odds(self, data: List[Dict]) -> List[Dict]:
+        formatted: List[Dict] = []
+
+        for game in data:
+            game_data = {
+                "match_id": game.get("id"),
+                "sport_key": game.get("sport_key"),
+                "home_team": game.get("home_team"),
+                "away_team": game.get("away_team"),
+                "commence_time": game.get("commence_time"),
+                "markets": {},
+            }
 
+            for bookmaker in game.get("bookmakers", []):
+                for market in bookmaker.get("markets", []):
+                    key = market.get("key")
+
+                    if key in ("totals", "alternate_totals"):
+                        self._extract_totals(market, game_data["markets"])
+                    elif key == "btts":
+                        self._extract_btts(market, game_data["markets"])
+                    elif key in ("h2h", "draw_no_bet"):
+                        self._extract_h2h(market, game_data["markets"], game_data["home_team"],
+                                          prefix="dnb" if key == "draw_no_bet" else None)
+                    elif key == "spreads":
+                        self._extract_spreads(market, game_data["markets"], game_data["home_team"])
+
+            if game_data["markets"]:
+                formatted.append(game_data)
+
+        return formatted
+
+    def _extract_totals(self, market: Dict, markets_dict: Dict):
+        """Extrai Over e Under"""
+        for outcome in market.get("outcomes", []):
+            point = outcome.get("point", 2.5)
+            price = outcome.get("price")
+
+            if outcome.get("name") == "Over":
+                key = f"over_{point}"
+            elif outcome.get("name") == "Under":
+                key = f"under_{point}"
+            else:
+                continue
+
+            if price is None:
+                continue
+
+            # Pega a melhor odd (maior)
+            if key not in markets_dict or price > markets_dict[key]:
+                markets_dict[key] = price
+
+    def _extract_h2h(self, market: Dict, markets_dict: Dict, home_team: Optional[str] = None,
+                     prefix: Optional[str] = None):
+        """
+        Extrai 1X2 (home_win, draw, away_win) ou, com prefix="dnb", empate anula (dnb_home, dnb_away)
+        Os outcomes de time vêm com o nome do time: o mandante é comparado com home_team
+        """
+        for outcome in market.get("outcomes", []):
+            name = outcome.get("name", "")
+            price = outcome.get("price")
+            
+            if price is None:
+                continue
+            
+            if name == "Draw":
+                if prefix:
+                    continue
+                key = "draw"
+            elif not home_team:
+                continue
+            elif prefix:
+                key = f"{prefix}_home" if name == home_team else f"{prefix}_away"
+            else:
+                key = "home_win" if name == home_team else "away_win"
+            
+            if key not in markets_dict or price > markets_dict[key]:
+                markets_dict[key] = price
+
+    def _extract_btts(self, market: Dict, markets_dict: Dict):
+        """Extrai Ambas Marcam (Sim/Não)"""
+        for outcome in market.get("outcomes", []):
+            name = outcome.get("name")
+            price = outcome.get("price")
+
+            if price is None:
+                continue
+
+            if name == "Yes":
+                key = "btts_yes"
+            elif name == "No":
+                key = "btts_no"
+            else:
+                continue
+
+            # Pega a melhor odd (maior)
+            if key not in markets_dict or price > markets_dict[key]:
+                markets_dict[key] = price
+
+    def _extract_spreads(self, market: Dict, markets_dict: Dict, home_team: Optional[str] = None):
+        """
+        Extrai Handicaps/Spreads
+        spread_X: linha do mandante; spread_away_X: linha do visitante
+        """
+        for outcome in market.get("outcomes", []):
+            point = outcome.get("point")
+            price = outcome.get("price")
+
+            if point is None or price is None:
+                continue
+
+            if home_team and outcome.get("name") != home_team:
+                key = f"spread_away_{point}"
+            else:
+                key = f"spread_{point}"
+            # Pega a melhor odd (maior)
+            if key not in markets_dict or price > markets_dict[key]:
+                markets_dict[key] = price
 
-class OddsAPI:
+
+class OddsAPI(OddsAPIParser):
     """Serviço para buscar odds com descoberta dinâmica de ligas (soccer)"""
 
     def __init__(self):
         self.api_key = Config.ODDS_API_KEY
         self.base_url = Config.ODDS_API_BASE_URL
         self.cache = RedisCache()
+        self.single_flight = SingleFlight(self.cache)
+        self.refresher = ConditionalRefresh(self.cache, self.FORMAT_VERSION)
 
     # ==========================================================
     # ✅ COMPATIBILIDADE (NÃO QUEBRAR O BettingAgent ANTIGO)
@@ -36,9 +193,9 @@ class OddsAPI:
         cache_key = "odds:available_soccer_sports"
 
         cached = self.cache.get(cache_key)
-        if cached:
+        if cached is not None:
             print("📦 Usando cache (ligas de futebol)")
-            return cached
+            return NegativeCache.unwrap(cached, [])
 
         if not self.api_key:
             return []
@@ -46,8 +203,15 @@ class OddsAPI:
         url = f"{self.base_url}/sports"
         params = {"apiKey": self.api_key}
 
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
+        # /sports não consome créditos, mas atualiza a cota restante
+        try:
+            response = HttpClient.get(url, params=params, provider="odds_api", cost=0, priority=Priority.HIGH)
+            response.raise_for_status()
+        except Exception as e:
+            # Rate limit fica com o retry; outros erros ficam em cache por pouco tempo
+            if not is_rate_limit_error(e):
+                self.cache.set_negative(cache_key, error=e)
+            raise
 
         sports = response.json()
 
@@ -68,133 +232,198 @@ class OddsAPI:
     @retry_on_rate_limit(max_retries=3)
     def get_odds_for_sport(self, sport: str) -> List[Dict]:
         """
-        Busca odds para uma liga específica
+        Busca odds para uma liga específica (etapa 1: lote barato)
+        Apenas mercados principais (ODDS_API_BULK_MARKETS); mercados extras
+        vêm por evento em get_event_odds (etapa 2)
         Cache: 12 HORAS (economia de créditos)
         """
         cache_key = f"odds:{sport}:{datetime.now().strftime('%Y-%m-%d')}"
 
-        cached = self.cache.get(cache_key)
-        if cached:
-            print(f"📦 Usando cache (odds {sport})")
-            return cached
-
         if not self.api_key:
-            return []
-
+            return NegativeCache.unwrap(self.cache.get(cache_key)) or []
+
+        # Cache velho: devolve na hora e atualiza em segundo plano
+        # Sem cache: apenas 1 chamador por chave busca na API; os outros esperam
+        odds = self.single_flight.get_or_refresh(
+            cache_key, lambda: self._fetch_odds_for_sport(sport, cache_key),
+            self.ODDS_SOFT_TTL, self.ODDS_HARD_TTL, label=f"odds {sport}"
+        )
+        return NegativeCache.unwrap(odds, [])
+
+    def _fetch_odds_for_sport(self, sport: str, cache_key: str) -> List[Dict]:
+        """Busca odds na API (sem consultar cache) e salva no cache"""
         url = f"{self.base_url}/sports/{sport}/odds"
 
         params = {
             "apiKey": self.api_key,
-            "regions": "us,uk,eu",
-            "markets": "h2h,totals,spreads",
+            "regions": Config.ODDS_API_REGIONS,
+            "markets": Config.ODDS_API_BULK_MARKETS,
             "oddsFormat": "decimal",
         }
 
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-
-        formatted = self._format_odds(response.json())
-        self.cache.set(cache_key, formatted, expire_seconds=43200)  # 12 HORAS
+        # Refresh condicional: payload igual reaproveita o resultado já formatado
+        try:
+            formatted, changes = self.refresher.fetch(
+                cache_key, url, self._format_odds, params=params, ttl=self.ODDS_HARD_TTL,
+                provider="odds_api", cost=self._credit_cost(params), priority=Priority.HIGH
+            )
+        except Exception as e:
+            if not is_rate_limit_error(e):
+                self.cache.set_negative(cache_key, error=e, tags=[f"sport:{sport}"])
+            raise
+
+        if formatted:
+            self.cache.set(cache_key, formatted, expire_seconds=self.ODDS_HARD_TTL, tags=[f"sport:{sport}"])  # 12 HORAS + SWR
+        else:
+            self.cache.set_negative(cache_key, tags=[f"sport:{sport}"])  # Liga sem jogos com odds
+
+        if not changes['modified']:
+            print(f"♻️  Odds {sport} sem mudanças ({changes['reason']})")
 
         return formatted
 
     # =========================
-    # 🔹 BUSCA DE ODDS (MASSIVA)
+    # 🔹 MERCADOS EXTRAS POR EVENTO (ETAPA 2)
     # =========================
-    def get_all_soccer_odds(self) -> List[Dict]:
+    @retry_on_rate_limit(max_retries=3)
+    def get_event_odds(self, sport: str, event_id: str, markets: Optional[str] = None) -> Dict:
         """
-        Busca odds de TODAS as ligas de futebol disponíveis
+        Busca mercados extras (btts, alternate_totals, spreads...) de UM evento
+        Usado apenas para eventos aprovados no pré-filtro do modelo
+        Cache: 12 HORAS
+        Retorna dict de mercados no mesmo formato de game['markets']
         """
-        all_odds: List[Dict] = []
+        markets = markets or Config.ODDS_API_EVENT_MARKETS
+        cache_key = f"odds:event:{event_id}:{markets}:{datetime.now().strftime('%Y-%m-%d')}"
 
-        sports = self.get_available_soccer_sports()
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return NegativeCache.unwrap(cached, {})
 
-        for sport in sports:
-            try:
-                odds = self.get_odds_for_sport(sport)
-                all_odds.extend(odds)
-            except Exception as e:
-                print(f"⚠️ Falha ao buscar odds de {sport}: {e}")
+        if not self.api_key:
+            return {}
 
-        print(f"💰 Total de jogos com odds: {len(all_odds)}")
-        return all_odds
+        return NegativeCache.unwrap(self.single_flight.do(
+            cache_key, lambda: self._fetch_event_odds(sport, event_id, markets, cache_key)
+        ), {})
 
-    # =========================
-    # 🔹 FORMATADORES
-    # =========================
-    def _format_odds(self, data: List[Dict]) -> List[Dict]:
-        formatted: List[Dict] = []
+    def _fetch_event_odds(self, sport: str, event_id: str, markets: str, cache_key: str) -> Dict:
+        """Busca odds de um evento na API (sem consultar cache) e salva no cache"""
+        url = f"{self.base_url}/sports/{sport}/events/{event_id}/odds"
 
-        for game in data:
-            game_data = {
-                "match_id": game.get("id"),
-                "home_team": game.get("home_team"),
-                "away_team": game.get("away_team"),
-                "commence_time": game.get("commence_time"),
-                "markets": {},
+        params = {
+            "apiKey": self.api_key,
+            "regions": Config.ODDS_API_EVENT_REGIONS,
+            "markets": markets,
+            "oddsFormat": "decimal",
+        }
+
+        try:
+            response = HttpClient.get(
+                url, params=params,
+                provider="odds_api", cost=self._credit_cost(params), priority=Priority.NORMAL
+            )
+            response.raise_for_status()
+        except Exception as e:
+            if not is_rate_limit_error(e):
+                self.cache.set_negative(cache_key, error=e, tags=[f"sport:{sport}"])
+            raise
+
+        formatted = self._format_odds([response.json()])
+        event_markets = formatted[0]["markets"] if formatted else {}
+
+        if event_markets:
+            self.cache.set(cache_key, event_markets, expire_seconds=43200, tags=[f"sport:{sport}"])  # 12 HORAS
+        else:
+            self.cache.set_negative(cache_key, tags=[f"sport:{sport}"])  # Evento sem os mercados pedidos
+
+        return event_markets
+
+    def get_event_odds_batch(self, events: List[Dict],
+                             max_concurrency: Optional[int] = None) -> Dict[str, Dict]:
+        """
+        Busca mercados extras de vários eventos em paralelo
+        events: jogos no formato de _format_odds (precisam de sport_key e match_id)
+        Retorna {match_id: mercados}. Eventos com erro ficam de fora.
+        """
+        events = [e for e in events if e.get("sport_key") and e.get("match_id")]
+        if not events:
+            return {}
+
+        workers = max(1, min(max_concurrency or Config.ODDS_API_MAX_CONCURRENCY, len(events)))
+        results: Dict[str, Dict] = {}
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="odds-api-event") as executor:
+            futures = {
+                executor.submit(self.get_event_odds, event["sport_key"], event["match_id"]): event["match_id"]
+                for event in events
             }
 
-            for bookmaker in game.get("bookmakers", []):
-                for market in bookmaker.get("markets", []):
-                    key = market.get("key")
+            for future in as_completed(futures):
+                event_id = futures[future]
+                try:
+                    results[event_id] = future.result() or {}
+                except Exception as e:
+                    print(f"⚠️ Falha ao buscar mercados extras do evento {event_id}: {e}")
 
-                    if key == "totals":
-                        self._extract_totals(market, game_data["markets"])
-                    elif key == "h2h":
-                        self._extract_h2h(market, game_data["markets"])
-                    elif key == "spreads":
-                        self._extract_spreads(market, game_data["markets"])
+        return results
 
-            if game_data["markets"]:
-                formatted.append(game_data)
+    # =========================
+    # 🔹 BUSCA DE ODDS (LOTE CONCORRENTE)
+    # =========================
+    def iter_odds_for_sports(self, sports: List[str],
+                             max_concurrency: Optional[int] = None
+                             ) -> Iterator[Tuple[str, List[Dict], Optional[Exception]]]:
+        """
+        Busca odds de várias ligas em paralelo (thread pool)
+        Entrega (sport, odds, erro) na ordem em que cada liga termina.
+        Erro de uma liga não afeta as outras; cache continua por liga.
+        """
+        sports = list(dict.fromkeys(sports))  # Remove duplicadas mantendo ordem
+        if not sports:
+            return
 
-        return formatted
+        workers = max(1, min(max_concurrency or Config.ODDS_API_MAX_CONCURRENCY, len(sports)))
 
-    def _extract_totals(self, market: Dict, markets_dict: Dict):
-        """Extrai Over e Under"""
-        for outcome in market.get("outcomes", []):
-            point = outcome.get("point", 2.5)
-            price = outcome.get("price")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="odds-api") as executor:
+            futures = {executor.submit(self.get_odds_for_sport, sport): sport for sport in sports}
 
-            if outcome.get("name") == "Over":
-                key = f"over_{point}"
-            elif outcome.get("name") == "Under":
-                key = f"under_{point}"
-            else:
-                continue
+            for future in as_completed(futures):
+                sport = futures[future]
+                try:
+                    yield sport, future.result() or [], None
+                except Exception as e:
+                    yield sport, [], e
 
-            if price is None:
+    def get_odds_for_sports(self, sports: List[str],
+                            max_concurrency: Optional[int] = None) -> Dict[str, List[Dict]]:
+        """
+        Busca odds de várias ligas em paralelo
+        Retorna {sport: odds} (ordem de conclusão). Ligas com erro ficam de fora.
+        """
+        results: Dict[str, List[Dict]] = {}
+
+        for sport, odds, error in self.iter_odds_for_sports(sports, max_concurrency):
+            if error:
+                print(f"⚠️ Falha ao buscar odds de {sport}: {error}")
                 continue
+            results[sport] = odds
 
-            # Pega a melhor odd (maior)
-            if key not in markets_dict or price > markets_dict[key]:
-                markets_dict[key] = price
+        return results
 
-    def _extract_h2h(self, market: Dict, markets_dict: Dict):
-        """Extrai 1X2 (casa, empate, fora)"""
-        for outcome in market.get("outcomes", []):
-            name = outcome.get("name", "")
-            price = outcome.get("price")
-            
-            if price is None:
-                continue
-            
-            # Extrai empate (pode ser usado futuramente)
-            if name == "Draw":
-                key = "draw"
-                if key not in markets_dict or price > markets_dict[key]:
-                    markets_dict[key] = price
+    # =========================
+    # 🔹 BUSCA DE ODDS (MASSIVA)
+    # =========================
+    def get_all_soccer_odds(self) -> List[Dict]:
+        """
+        Busca odds de TODAS as ligas de futebol disponíveis (em paralelo)
+        """
+        all_odds: List[Dict] = []
 
-    def _extract_spreads(self, market: Dict, markets_dict: Dict):
-        """Extrai Handicaps/Spreads"""
-        for outcome in market.get("outcomes", []):
-            point = outcome.get("point")
-            price = outcome.get("price")
+        sports = self.get_available_soccer_sports()
 
-            if point is None or price is None:
-                continue
+        for odds in self.get_odds_for_sports(sports).values():
+            all_odds.extend(odds)
 
-            key = f"spread_{point}"
-            # Pega a melhor odd (maior)
-            if key not in markets_dict or price > markets_dict[key]:
-                markets_dict[key] = price
\ No newline at end of file
+        print(f"💰 Total de jogos com odds: {len(all_odds)}")
+        return all_odds
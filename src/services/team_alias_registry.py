@@ -0,0 +1,293 @@
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from config.config import Config
+from src.cache.redis_client import RedisCache
+from src.services.team_matcher import TeamMatcher
+
+
+class TeamAliasRegistry:
+    """
+    Aliases de times aprendidos entre provedores: nome no provedor -> ID na API-Football
+
+    A fonte da verdade é a tabela team_aliases do Postgres. O Redis guarda um
+    espelho (um hash por provedor em REDIS_PREFIX + provedor) e cada processo
+    carrega o provedor inteiro num dict na primeira consulta: resolve() é um
+    lookup O(1) pelo nome sem acentos e pontuação (TeamMatcher.fold_name).
+    A chave não passa por STOPWORDS nem KNOWN_MAPPINGS: "Man City" e
+    "Man Utd" viram "manchester" no canonical_name e não podem dividir alias.
+
+    - 'auto': gravado pelo matching (score >= TEAM_ALIAS_MIN_SCORE e horário batendo)
+    - 'manual': override (scripts/team_aliases.py), nunca sobrescrito por 'auto'
+
+    Sem Postgres (ou sem a tabela) o registro segue só com o Redis e o processo.
+    """
+
+    AUTO = "auto"
+    MANUAL = "manual"
+    REDIS_PREFIX = "team_alias:"
+
+    # Aliases por provedor, compartilhados pelo processo
+    _aliases: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    _lock = threading.Lock()
+    _db_available: Optional[bool] = None  # None: ainda não testado
+
+    @staticmethod
+    def alias_key(name: str) -> str:
+        """Chave do alias: nome sem acentos e pontuação, com todas as palavras"""
+        return TeamMatcher.fold_name(name)
+
+    @staticmethod
+    def _entry(team_id: int, team_name: Optional[str], source: str, score: Optional[float]) -> Dict[str, Any]:
+        return {
+            "team_id": int(team_id),
+            "team_name": team_name,
+            "source": source,
+            "score": round(float(score), 3) if score is not None else None,
+        }
+
+    # =========================
+    # 🔹 CONSULTA
+    # =========================
+    @classmethod
+    def load(cls, provider: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Aliases do provedor {alias: entrada}, carregados uma vez por processo
+        Ordem: processo -> espelho no Redis -> Postgres (que repõe o espelho).
+        """
+        aliases = cls._aliases.get(provider)
+        if aliases is not None:
+            return aliases
+
+        with cls._lock:
+            if provider in cls._aliases:
+                return cls._aliases[provider]
+
+            aliases = cls._redis_load(provider)
+            if not aliases:
+                from_db = cls._db_load(provider)
+                if from_db is not None:
+                    aliases = from_db
+                    cls._redis_store(provider, aliases, replace=True)
+
+            cls._aliases[provider] = aliases
+            return aliases
+
+    @classmethod
+    def reload(cls, provider: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Relê o Postgres e reconstrói o espelho no Redis e o dict do processo
+        Retorna None se o Postgres não respondeu: espelho e processo ficam como estavam.
+        """
+        with cls._lock:
+            aliases = cls._db_load(provider)
+            if aliases is None:
+                return None
+            cls._redis_store(provider, aliases, replace=True)
+            cls._aliases[provider] = aliases
+            return aliases
+
+    @classmethod
+    def resolve(cls, provider: str, name: str) -> Optional[int]:
+        """ID do time na API-Football para o nome do provedor (None se desconhecido)"""
+        if not Config.TEAM_ALIAS_ENABLED or not name:
+            return None
+        entry = cls.load(provider).get(cls.alias_key(name))
+        return entry["team_id"] if entry else None
+
+    @classmethod
+    def list_aliases(cls, provider: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """Aliases do provedor ordenados pelo nome (para scripts e relatórios)"""
+        return sorted(cls.load(provider).items())
+
+    # =========================
+    # 🔹 GRAVAÇÃO
+    # =========================
+    @classmethod
+    def record_many(cls, provider: str, matches: Iterable[Tuple[str, Optional[int], Optional[str], float]]) -> int:
+        """
+        Grava aliases 'auto' de matches confiáveis: [(nome no provedor, team_id, nome na API-Football, score)]
+        Ignora score abaixo de TEAM_ALIAS_MIN_SCORE, aliases já conhecidos e overrides manuais.
+        Alias que aponta para dois times diferentes no mesmo lote é ambíguo e fica de fora.
+        Uma transação no Postgres e um HSET no Redis para o lote todo.
+        """
+        if not Config.TEAM_ALIAS_ENABLED:
+            return 0
+
+        aliases = cls.load(provider)
+        candidates: Dict[str, Dict[str, Any]] = {}
+        ids_by_alias: Dict[str, set] = {}
+        for name, team_id, team_name, score in matches:
+            if team_id is None or score < Config.TEAM_ALIAS_MIN_SCORE:
+                continue
+            alias = cls.alias_key(name)
+            if not alias:
+                continue
+            ids_by_alias.setdefault(alias, set()).add(int(team_id))
+            candidates[alias] = cls._entry(team_id, team_name, cls.AUTO, score)
+
+        ambiguous = {alias for alias, ids in ids_by_alias.items() if len(ids) > 1}
+        learned = {}
+        for alias, entry in candidates.items():
+            if alias in ambiguous:
+                continue
+            current = aliases.get(alias)
+            if current and (current["source"] == cls.MANUAL or current["team_id"] == entry["team_id"]):
+                continue
+            learned[alias] = entry
+
+        if ambiguous:
+            print(f"⚠️ {len(ambiguous)} aliases ambíguos ignorados ({provider}): {', '.join(sorted(ambiguous))}")
+
+        if not learned:
+            return 0
+
+        cls._db_upsert(provider, learned, manual=False)
+        cls._redis_store(provider, learned)
+        with cls._lock:
+            aliases.update(learned)
+
+        print(f"🔖 {len(learned)} aliases de times aprendidos ({provider})")
+        return len(learned)
+
+    @classmethod
+    def set_override(cls, provider: str, name: str, team_id: int, team_name: Optional[str] = None) -> bool:
+        """Override manual: vale sobre qualquer alias 'auto' (inclusive nos próximos matchings)"""
+        alias = cls.alias_key(name)
+        entry = cls._entry(team_id, team_name, cls.MANUAL, None)
+        saved = cls._db_upsert(provider, {alias: entry}, manual=True)
+        cls._redis_store(provider, {alias: entry})
+        with cls._lock:
+            cls._aliases.setdefault(provider, {})[alias] = entry
+        return saved
+
+    @classmethod
+    def remove(cls, provider: str, name: str) -> bool:
+        """Remove o alias (auto ou manual) do Postgres, do Redis e do processo"""
+        alias = cls.alias_key(name)
+
+        def delete(db, text):
+            return db.execute(text(
+                "DELETE FROM team_aliases WHERE provider = :provider AND alias = :alias"
+            ), {"provider": provider, "alias": alias}).rowcount > 0
+
+        removed = cls._db_execute(delete, False)
+
+        cache = RedisCache()
+        if cache.enabled:
+            try:
+                removed = bool(cache.client.hdel(cls._redis_key(provider), alias)) or removed
+            except Exception as e:
+                print(f"⚠️ Erro ao remover alias do Redis: {e}")
+
+        with cls._lock:
+            removed = cls._aliases.get(provider, {}).pop(alias, None) is not None or removed
+        return removed
+
+    # =========================
+    # 🔹 ESPELHO NO REDIS
+    # =========================
+    @classmethod
+    def _redis_key(cls, provider: str) -> str:
+        return f"{cls.REDIS_PREFIX}{provider}"
+
+    @classmethod
+    def _redis_load(cls, provider: str) -> Dict[str, Dict[str, Any]]:
+        cache = RedisCache()
+        if not cache.enabled:
+            return {}
+
+        try:
+            raw = cache.client.hgetall(cls._redis_key(provider))
+        except Exception as e:
+            print(f"⚠️ Erro ao ler aliases do Redis: {e}")
+            return {}
+
+        aliases = {}
+        for field, data in raw.items():
+            entry = RedisCache._decode(data)
+            if isinstance(entry, dict) and entry.get("team_id") is not None:
+                aliases[field.decode() if isinstance(field, bytes) else field] = entry
+        return aliases
+
+    @classmethod
+    def _redis_store(cls, provider: str, entries: Dict[str, Dict[str, Any]], replace: bool = False):
+        """Grava entradas no hash do provedor (replace=True reconstrói o hash inteiro)"""
+        cache = RedisCache()
+        if not cache.enabled or not (entries or replace):
+            return
+
+        key = cls._redis_key(provider)
+        try:
+            pipe = cache.client.pipeline(transaction=True)
+            if replace:
+                pipe.delete(key)
+            if entries:
+                pipe.hset(key, mapping={alias: RedisCache._encode(entry) for alias, entry in entries.items()})
+            pipe.execute()
+        except Exception as e:
+            print(f"⚠️ Erro ao gravar aliases no Redis: {e}")
+
+    # =========================
+    # 🔹 POSTGRES
+    # =========================
+    @classmethod
+    def _db_execute(cls, fn, default=None):
+        """
+        Roda fn(db, text) numa sessão do get_db()
+        A primeira falha de conexão desliga o Postgres para o resto do processo
+        (sem esperar timeout a cada consulta); depois disso, erros só viram aviso.
+        """
+        if cls._db_available is False:
+            return default
+
+        try:
+            from sqlalchemy import text
+            from src.database.connection import get_db
+
+            with get_db() as db:
+                result = fn(db, text)
+            cls._db_available = True
+            return result
+        except Exception as e:
+            if cls._db_available:
+                print(f"⚠️ Erro no Postgres (aliases de times): {e}")
+            else:
+                print(f"⚠️ Aliases de times sem Postgres ({type(e).__name__}): usando só Redis/processo")
+                cls._db_available = False
+            return default
+
+    @classmethod
+    def _db_load(cls, provider: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        def select(db, text):
+            rows = db.execute(text("""
+                SELECT alias, team_id, team_name, source, score
+                FROM team_aliases
+                WHERE provider = :provider
+            """), {"provider": provider}).fetchall()
+            return {
+                row.alias: cls._entry(row.team_id, row.team_name, row.source, row.score)
+                for row in rows
+            }
+
+        return cls._db_execute(select)
+
+    @classmethod
+    def _db_upsert(cls, provider: str, entries: Dict[str, Dict[str, Any]], manual: bool) -> bool:
+        """INSERT ... ON CONFLICT; gravação 'auto' não passa por cima de 'manual'"""
+        guard = "" if manual else "WHERE team_aliases.source <> 'manual'"
+
+        def upsert(db, text):
+            db.execute(text(f"""
+                INSERT INTO team_aliases (provider, alias, team_id, team_name, source, score)
+                VALUES (:provider, :alias, :team_id, :team_name, :source, :score)
+                ON CONFLICT (provider, alias) DO UPDATE SET
+                    team_id = EXCLUDED.team_id,
+                    team_name = EXCLUDED.team_name,
+                    source = EXCLUDED.source,
+                    score = EXCLUDED.score,
+                    updated_at = NOW()
+                {guard}
+            """), [{"provider": provider, "alias": alias, **entry} for alias, entry in entries.items()])
+            return True
+
+        return cls._db_execute(upsert, False)
@@ -1,12 +1,21 @@
+import calendar
+import re
+import unicodedata
+from bisect import bisect_left, bisect_right
 from difflib import SequenceMatcher
-from typing import Optional, Dict, List
+from functools import lru_cache
+from typing import Optional, Dict, List, Tuple
 from datetime import datetime, timedelta
+import numpy as np
+from scipy import sparse
+from scipy.optimize import linear_sum_assignment
 
 
 class TeamMatcher:
     """Serviço para fazer matching inteligente entre nomes de times de diferentes APIs"""
     
-    # Mapeamento manual de abreviações conhecidas
+    # Mapeamento manual de abreviações conhecidas (num sentido só: apelido -> nome)
+    # Acentos não precisam de entrada: normalize_name já remove ("são paulo" == "sao paulo")
     KNOWN_MAPPINGS = {
         # Premier League
         "man utd": "manchester united",
@@ -17,7 +26,6 @@ class TeamMatcher:
         
         # La Liga
         "athletic bilbao": "athletic club",
-        "athletic club": "athletic bilbao",
         
         # Serie A
         "ac milan": "milan",
@@ -25,49 +33,89 @@ class TeamMatcher:
         
         # Bundesliga
         "bayern munich": "bayern munchen",
-        "bayern munchen": "bayern munich",
         
         # Portugal
         "sporting lisbon": "sporting cp",
-        "sporting cp": "sporting lisbon",
         "sporting clube de portugal": "sporting cp",
         
         # Brasil
-        "sao paulo": "são paulo",
-        "atletico mineiro": "atlético mineiro",
         "atletico paranaense": "athletico paranaense",
     }
     
+    # Palavras removidas do nome (token inteiro: "cityzens" fica intacto)
+    STOPWORDS = frozenset({'fc', 'cf', 'sc', 'afc', 'bfc', 'united', 'city'})
+    
+    # Letras que o NFKD não decompõe em letra base + acento
+    _FOLD_TABLE = str.maketrans({'ø': 'o', 'æ': 'ae', 'œ': 'oe', 'ß': 'ss', 'ł': 'l', 'đ': 'd', 'ð': 'd',
+                                 'þ': 'th', 'ı': 'i'})
+    _DROP_PATTERN = re.compile(r"[.'’`´]")  # Some sem separar: "nott'm" -> "nottm", "st." -> "st"
+    _SPLIT_PATTERN = re.compile(r"[\W_]+")  # Hífen, barra, espaços etc. separam palavras
+    
+    NORMALIZE_CACHE_SIZE = 8192  # Nomes distintos memorizados por processo
+    _normalized_mappings: Optional[Dict[str, str]] = None
+    
+    @staticmethod
+    def fold_accents(text: str) -> str:
+        """Minúsculas sem acentos (NFKD + remoção das marcas combinantes)"""
+        text = text.casefold()
+        if text.isascii():
+            return text
+        decomposed = unicodedata.normalize('NFKD', text.translate(TeamMatcher._FOLD_TABLE))
+        return ''.join(char for char in decomposed if not unicodedata.combining(char))
+    
+    @staticmethod
+    def _tokens(name: str) -> List[str]:
+        """Palavras do nome: minúsculas, sem acentos e sem pontuação"""
+        text = TeamMatcher._DROP_PATTERN.sub('', TeamMatcher.fold_accents(name))
+        return [token for token in TeamMatcher._SPLIT_PATTERN.split(text) if token]
+    
     @staticmethod
+    def fold_name(name: str) -> str:
+        """
+        Nome sem acentos e pontuação, com todas as palavras (sem STOPWORDS nem KNOWN_MAPPINGS)
+        Mantém "manchester united" e "manchester city" distintos (chave dos aliases aprendidos)
+        """
+        return ' '.join(TeamMatcher._tokens(name or ''))
+    
+    @staticmethod
+    @lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
     def normalize_name(name: str) -> str:
-        """Normaliza nome do time para matching"""
-        name = name.lower().strip()
-        
-        # Remove palavras comuns
-        remove_words = ['fc', 'cf', 'sc', 'afc', 'bfc', 'united', 'city']
-        for word in remove_words:
-            name = name.replace(f' {word}', '').replace(f'{word} ', '')
-        
-        # Remove caracteres especiais
-        name = name.replace('.', '').replace('-', ' ')
+        """
+        Normaliza nome do time para matching (memorizado, NORMALIZE_CACHE_SIZE nomes)
         
-        # Remove espaços extras
-        name = ' '.join(name.split())
+        1. minúsculas e acentos removidos (NFKD)
+        2. pontuação removida e separadores viram espaço
+        3. palavras comuns (STOPWORDS) removidas por token
+        """
+        tokens = TeamMatcher._tokens(name)
         
-        return name
+        # Nome só de palavras comuns ("City", "FC United") fica como está
+        kept = [token for token in tokens if token not in TeamMatcher.STOPWORDS]
+        return ' '.join(kept or tokens)
+    
+    @staticmethod
+    @lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+    def canonical_name(name: str) -> str:
+        """Nome normalizado com o mapeamento manual aplicado (chave de comparação)"""
+        norm = TeamMatcher.normalize_name(name or '')
+        return TeamMatcher._mappings().get(norm, norm)
+    
+    @staticmethod
+    def _mappings() -> Dict[str, str]:
+        """KNOWN_MAPPINGS com chaves e valores passados pelo normalize_name (montado uma vez)"""
+        if TeamMatcher._normalized_mappings is None:
+            TeamMatcher._normalized_mappings = {
+                TeamMatcher.normalize_name(alias): TeamMatcher.normalize_name(name)
+                for alias, name in TeamMatcher.KNOWN_MAPPINGS.items()
+            }
+        return TeamMatcher._normalized_mappings
     
     @staticmethod
     def similarity_score(name1: str, name2: str) -> float:
         """Calcula score de similaridade entre dois nomes (0-1)"""
-        # Normaliza ambos
-        norm1 = TeamMatcher.normalize_name(name1)
-        norm2 = TeamMatcher.normalize_name(name2)
-        
-        # Checa mapeamento manual primeiro
-        if norm1 in TeamMatcher.KNOWN_MAPPINGS:
-            norm1 = TeamMatcher.KNOWN_MAPPINGS[norm1]
-        if norm2 in TeamMatcher.KNOWN_MAPPINGS:
-            norm2 = TeamMatcher.KNOWN_MAPPINGS[norm2]
+        # Normaliza ambos e checa mapeamento manual
+        norm1 = TeamMatcher.canonical_name(name1)
+        norm2 = TeamMatcher.canonical_name(name2)
         
         # Se forem iguais após normalização, match perfeito
         if norm1 == norm2:
@@ -98,6 +146,27 @@ class TeamMatcher:
         
         return None
     
+    @staticmethod
+    def parse_epoch(dt_str: str) -> Optional[int]:
+        """
+        Horário ISO 8601 das APIs em epoch (segundos, UTC)
+        Aceita 'Z', offset (+00:00, usado pela API-Football) e microsegundos;
+        horário sem fuso é tratado como UTC
+        """
+        if not dt_str:
+            return None
+        
+        try:
+            dt = datetime.fromisoformat(dt_str[:-1] + '+00:00' if dt_str.endswith('Z') else dt_str)
+        except ValueError:
+            dt = TeamMatcher.parse_datetime(dt_str)
+            if dt is None:
+                return None
+        
+        if dt.tzinfo is not None:
+            return int(dt.timestamp())
+        return calendar.timegm(dt.timetuple())
+    
     @staticmethod
     def time_match(time1: str, time2: str, tolerance_hours: int = 3) -> bool:
         """
@@ -111,17 +180,14 @@ class TeamMatcher:
         Returns:
             True se os horários estão dentro da tolerância
         """
-        dt1 = TeamMatcher.parse_datetime(time1)
-        dt2 = TeamMatcher.parse_datetime(time2)
+        epoch1 = TeamMatcher.parse_epoch(time1)
+        epoch2 = TeamMatcher.parse_epoch(time2)
         
         # Se não conseguiu parsear algum, aceita (fallback ao comportamento antigo)
-        if not dt1 or not dt2:
+        if epoch1 is None or epoch2 is None:
             return True
         
-        # Calcula diferença absoluta
-        diff = abs((dt1 - dt2).total_seconds() / 3600)  # Em horas
-        
-        return diff <= tolerance_hours
+        return abs(epoch1 - epoch2) <= tolerance_hours * 3600
     
     @staticmethod
     def find_best_match(team_name: str, candidates: List[Dict], threshold: float = 0.7) -> Optional[Dict]:
@@ -172,31 +238,318 @@ class TeamMatcher:
         
         Returns:
             Dict com dados do jogo da API-Football, ou None se não houver match
+        
+        Para vários jogos contra a mesma lista, monte um FixtureIndex uma vez e use index.match
         """
-        for match in api_football_matches:
-            home_name = match.get('home_team', '')
-            away_name = match.get('away_team', '')
-            match_datetime = match.get('date', '')
+        index = FixtureIndex(api_football_matches, time_tolerance_hours)
+        return index.match(odds_home, odds_away, odds_datetime, threshold)
+
+
+class FixtureIndex:
+    """
+    Índice sobre uma lista de fixtures da API-Football para matching rápido
+    
+    Montado uma vez por lista:
+    - nomes normalizados (TeamMatcher.canonical_name) uma única vez
+    - horário de início em epoch (int) uma única vez
+    - fixtures em baldes de BUCKET_SECONDS pelo horário de início
+    - hash (mandante, visitante) -> fixtures
+    - hash ID do time (API-Football) -> fixtures, para IDs já resolvidos (TeamAliasRegistry)
+    
+    match(): lookup pelos IDs conhecidos e exato/alias no hash; se não achar, fuzzy (SequenceMatcher)
+    só contra os fixtures dentro da janela de horário, ficando com o de maior score.
+    Mesma regra de aceite de antes: os dois times acima do threshold e horário
+    dentro da tolerância.
+    
+    match_many(): todos os eventos de uma vez, com pareamento um-para-um (ver abaixo).
+    """
+    
+    BUCKET_SECONDS = 3600
+    NGRAM = 3
+    CANDIDATE_SIMILARITY = 0.3  # Cosseno TF-IDF mínimo para um par ir ao SequenceMatcher
+    
+    def __init__(self, fixtures: List[Dict], time_tolerance_hours: float = 3):
+        self.fixtures = fixtures
+        self.tolerance = int(time_tolerance_hours * 3600)
+        
+        self._home: List[str] = []
+        self._away: List[str] = []
+        self._epochs: List[Optional[int]] = []
+        self._ids: List[Tuple[Optional[int], Optional[int]]] = []
+        self._by_home_id: Dict[int, List[int]] = {}
+        self._by_away_id: Dict[int, List[int]] = {}
+        self._by_pair: Dict[Tuple[str, str], List[int]] = {}
+        self._buckets: Dict[int, List[int]] = {}
+        self._untimed: List[int] = []  # Sem horário legível: sempre candidatos (como time_match)
+        
+        for i, fixture in enumerate(fixtures):
+            home = TeamMatcher.canonical_name(fixture.get('home_team', ''))
+            away = TeamMatcher.canonical_name(fixture.get('away_team', ''))
+            epoch = TeamMatcher.parse_epoch(fixture.get('date', ''))
             
-            # Calcula score para ambos os times
-            home_score = TeamMatcher.similarity_score(odds_home, home_name)
-            away_score = TeamMatcher.similarity_score(odds_away, away_name)
+            self._home.append(home)
+            self._away.append(away)
+            self._epochs.append(epoch)
+            self._ids.append((fixture.get('home_team_id'), fixture.get('away_team_id')))
+            if fixture.get('home_team_id') is not None:
+                self._by_home_id.setdefault(fixture['home_team_id'], []).append(i)
+            if fixture.get('away_team_id') is not None:
+                self._by_away_id.setdefault(fixture['away_team_id'], []).append(i)
+            self._by_pair.setdefault((home, away), []).append(i)
             
-            # Verifica se os nomes batem
-            if home_score >= threshold and away_score >= threshold:
-                # NOVO: Verifica também o horário
-                if odds_datetime and not TeamMatcher.time_match(odds_datetime, match_datetime, time_tolerance_hours):
-                    print(f"   ⏰ Horários diferentes: {odds_datetime} vs {match_datetime} - descartando")
-                    continue
-                
-                # Score combinado (média)
-                combined_score = (home_score + away_score) / 2
-                
-                return {
-                    **match,
-                    'match_score': combined_score,
-                    'home_match_score': home_score,
-                    'away_match_score': away_score
-                }
+            if epoch is None:
+                self._untimed.append(i)
+            else:
+                self._buckets.setdefault(epoch // self.BUCKET_SECONDS, []).append(i)
+        
+        self._bucket_keys = sorted(self._buckets)
+    
+    def __len__(self) -> int:
+        return len(self.fixtures)
+    
+    def _in_window(self, i: int, epoch: Optional[int]) -> bool:
+        fixture_epoch = self._epochs[i]
+        return epoch is None or fixture_epoch is None or abs(fixture_epoch - epoch) <= self.tolerance
+    
+    def _window(self, epoch: Optional[int]) -> List[int]:
+        """Índices dos fixtures no horário do evento (todos se o evento não tem horário)"""
+        if epoch is None:
+            return list(range(len(self.fixtures)))
+        
+        first = bisect_left(self._bucket_keys, (epoch - self.tolerance) // self.BUCKET_SECONDS)
+        last = bisect_right(self._bucket_keys, (epoch + self.tolerance) // self.BUCKET_SECONDS)
+        candidates = [
+            i for key in self._bucket_keys[first:last] for i in self._buckets[key]
+            if self._in_window(i, epoch)
+        ]
+        candidates.extend(self._untimed)
+        candidates.sort()
+        return candidates
+    
+    @staticmethod
+    def _score(matcher: SequenceMatcher, name: str, target: str, threshold: float) -> float:
+        """Similaridade com cortes baratos (limites superiores) antes do ratio completo"""
+        if name == target:
+            return 1.0
+        matcher.set_seq1(name)
+        if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+            return 0.0
+        return matcher.ratio()
+    
+    def _result(self, i: int, home_score: float, away_score: float, source: str, epoch: Optional[int]) -> Dict:
+        """
+        Fixture com os scores do match
+        match_source: 'alias' (IDs conhecidos), 'exact' ou 'fuzzy'
+        kickoff_match: os dois horários foram lidos e estão dentro da tolerância
+        """
+        return {
+            **self.fixtures[i],
+            'match_score': (home_score + away_score) / 2,
+            'home_match_score': home_score,
+            'away_match_score': away_score,
+            'match_source': source,
+            'kickoff_match': epoch is not None and self._epochs[i] is not None
+        }
+    
+    def _match_ids(self, home: str, away: str, home_id: Optional[int], away_id: Optional[int],
+                   epoch: Optional[int], threshold: float) -> Optional[Dict]:
+        """Fixture pelos IDs já resolvidos; com um lado só conhecido, fuzzy apenas no outro nome"""
+        indices = self._by_home_id.get(home_id, ()) if home_id is not None else self._by_away_id.get(away_id, ())
+        
+        for i in indices:
+            if not self._in_window(i, epoch):
+                continue
+            
+            fixture_home_id, fixture_away_id = self._ids[i]
+            if home_id is not None and away_id is not None:
+                if fixture_away_id == away_id:
+                    return self._result(i, 1.0, 1.0, 'alias', epoch)
+            elif home_id is not None:
+                away_score = self._score(SequenceMatcher(None, '', away, autojunk=False), self._away[i], away, threshold)
+                if away_score >= threshold:
+                    return self._result(i, 1.0, away_score, 'alias', epoch)
+            else:
+                home_score = self._score(SequenceMatcher(None, '', home, autojunk=False), self._home[i], home, threshold)
+                if home_score >= threshold:
+                    return self._result(i, home_score, 1.0, 'alias', epoch)
         
         return None
+    
+    def match(self, odds_home: str, odds_away: str, odds_datetime: Optional[str] = None,
+              threshold: float = 0.7, home_id: Optional[int] = None,
+              away_id: Optional[int] = None) -> Optional[Dict]:
+        """
+        Fixture do evento (mesmas regras de TeamMatcher.match_teams) ou None
+        
+        home_id/away_id: IDs da API-Football já conhecidos para os nomes do provedor
+        (TeamAliasRegistry). Achando o fixture por eles, não há fuzzy; se não acharem
+        nada na janela (alias errado ou de outra liga), segue o matching por nome.
+        """
+        home = TeamMatcher.canonical_name(odds_home)
+        away = TeamMatcher.canonical_name(odds_away)
+        epoch = TeamMatcher.parse_epoch(odds_datetime) if odds_datetime else None
+        
+        # 0. IDs conhecidos: lookup direto no hash por ID
+        if home_id is not None or away_id is not None:
+            found = self._match_ids(home, away, home_id, away_id, epoch, threshold)
+            if found is not None:
+                return found
+        
+        # 1. Hash exato/alias: nomes iguais após normalização + mapeamento
+        for i in self._by_pair.get((home, away), ()):
+            if self._in_window(i, epoch):
+                return self._result(i, 1.0, 1.0, 'exact', epoch)
+            print(f"   ⏰ Horários diferentes: {odds_datetime} vs {self.fixtures[i].get('date', '')} - descartando")
+        
+        # 2. Fuzzy só dentro da janela de horário
+        window = self._window(epoch)
+        if not window:
+            return None
+        
+        home_matcher = SequenceMatcher(None, '', home, autojunk=False)
+        away_matcher = SequenceMatcher(None, '', away, autojunk=False)
+        
+        # Melhor fixture da janela (não o primeiro acima do threshold). O melhor par até
+        # aqui sobe o corte dos limites baratos: só passa quem ainda pode superá-lo
+        best, best_scores = None, (0.0, 0.0)
+        for i in window:
+            home_cut = max(threshold, sum(best_scores) - 1.0)
+            home_score = self._score(home_matcher, self._home[i], home, home_cut)
+            if home_score < home_cut:
+                continue
+            away_cut = max(threshold, sum(best_scores) - home_score)
+            away_score = self._score(away_matcher, self._away[i], away, away_cut)
+            if away_score >= threshold and home_score + away_score > sum(best_scores):
+                best, best_scores = i, (home_score, away_score)
+        
+        if best is None:
+            return None
+        return self._result(best, *best_scores, 'fuzzy', epoch)
+    
+    # =========================
+    # 🔹 PAREAMENTO EM LOTE
+    # =========================
+    @classmethod
+    def _tfidf(cls, names: List[str]) -> sparse.csr_matrix:
+        """Vetores TF-IDF de n-gramas de caracteres (normalizados L2), uma linha por nome"""
+        vocabulary: Dict[str, int] = {}
+        rows, cols = [], []
+        for row, name in enumerate(names):
+            padded = f" {name} "
+            for k in range(max(1, len(padded) - cls.NGRAM + 1)):
+                rows.append(row)
+                cols.append(vocabulary.setdefault(padded[k:k + cls.NGRAM], len(vocabulary)))
+        
+        tf = sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(names), len(vocabulary)))
+        tf.sum_duplicates()
+        df = np.bincount(tf.indices, minlength=len(vocabulary))
+        idf = np.log((1 + len(names)) / (1 + df)) + 1
+        
+        tfidf = tf @ sparse.diags(idf)
+        norms = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        return (sparse.diags(1 / norms) @ tfidf).tocsr()
+    
+    def match_many(self, events: List[Tuple[str, str, Optional[str]]], threshold: float = 0.7,
+                   ids: Optional[List[Tuple[Optional[int], Optional[int]]]] = None) -> List[Optional[Dict]]:
+        """
+        Pareia todos os eventos [(mandante, visitante, horário)] com os fixtures de uma vez
+        
+        1. Vetores TF-IDF de trigramas de todos os nomes; similaridade de todos os
+           pares (evento x fixture) num produto de matrizes esparsas, por lado
+        2. Candidatos: horário na janela e cosseno >= CANDIDATE_SIMILARITY nos dois lados
+           (ids: IDs já conhecidos, como em match(), contam como nome idêntico)
+        3. Score final dos candidatos pelo SequenceMatcher: mesma regra de aceite de match()
+        4. Pareamento um-para-um que maximiza a soma das margens acima do threshold
+           (linear_sum_assignment): nenhum fixture para dois eventos, sem pares cruzados
+        
+        Retorna um fixture (ou None) por evento, na mesma ordem.
+        """
+        n, m = len(events), len(self.fixtures)
+        results: List[Optional[Dict]] = [None] * n
+        if not n or not m:
+            return results
+        
+        ids = ids or [(None, None)] * n
+        event_home = [TeamMatcher.canonical_name(home) for home, _, _ in events]
+        event_away = [TeamMatcher.canonical_name(away) for _, away, _ in events]
+        event_epochs = [TeamMatcher.parse_epoch(dt) if dt else None for _, _, dt in events]
+        
+        # 1. Similaridade TF-IDF de todos os pares
+        names = list(dict.fromkeys(self._home + self._away + event_home + event_away))
+        position = {name: row for row, name in enumerate(names)}
+        vectors = self._tfidf(names)
+        
+        def similarity(left: List[str], right: List[str]) -> np.ndarray:
+            return (vectors[[position[name] for name in left]] @ vectors[[position[name] for name in right]].T).toarray()
+        
+        home_sim = similarity(event_home, self._home)
+        away_sim = similarity(event_away, self._away)
+        
+        # 2. Máscaras: janela de horário (sem horário em um lado: aceita, como time_match) e IDs
+        def as_array(values: List[Optional[int]], missing: float) -> np.ndarray:
+            return np.array([missing if value is None else value for value in values], dtype=float)
+        
+        delta = np.abs(as_array(event_epochs, np.nan)[:, None] - as_array(self._epochs, np.nan)[None, :])
+        in_window = np.isnan(delta) | (delta <= self.tolerance)
+        closeness = np.where(np.isnan(delta), 0.0, delta / max(self.tolerance, 1))
+        
+        home_known = as_array([h for h, _ in ids], -1)[:, None] == as_array([h for h, _ in self._ids], -2)[None, :]
+        away_known = as_array([a for _, a in ids], -1)[:, None] == as_array([a for _, a in self._ids], -2)[None, :]
+        home_sim[home_known] = 1.0
+        away_sim[away_known] = 1.0
+        
+        candidates = in_window & (home_sim >= self.CANDIDATE_SIMILARITY) & (away_sim >= self.CANDIDATE_SIMILARITY)
+        
+        # 3. Score exato só dos candidatos
+        matchers: Dict[str, SequenceMatcher] = {}
+        
+        def matcher(target: str) -> SequenceMatcher:
+            if target not in matchers:
+                matchers[target] = SequenceMatcher(None, '', target, autojunk=False)
+            return matchers[target]
+        
+        weights = np.zeros((n, m))
+        feasible = np.zeros((n, m), dtype=bool)
+        scored: Dict[Tuple[int, int], Tuple[float, float, str]] = {}
+        
+        for i, j in zip(*np.nonzero(candidates)):
+            if home_known[i, j]:
+                home_score = 1.0
+            else:
+                home_score = self._score(matcher(event_home[i]), self._home[j], event_home[i], threshold)
+                if home_score < threshold:
+                    continue
+            
+            if away_known[i, j]:
+                away_score = 1.0
+            else:
+                away_score = self._score(matcher(event_away[i]), self._away[j], event_away[i], threshold)
+                if away_score < threshold:
+                    continue
+            
+            if home_known[i, j] or away_known[i, j]:
+                source = 'alias'
+            else:
+                source = 'exact' if home_score == away_score == 1.0 else 'fuzzy'
+            
+            # Peso = margem acima do threshold: dois pares no limite não valem mais que um
+            # par certo. Desempate pelo horário mais próximo (não muda o score reportado)
+            feasible[i, j] = True
+            weights[i, j] = (home_score + away_score) / 2 - threshold + 1e-3 * (1.0 - closeness[i, j]) + 1e-6
+            scored[(i, j)] = (home_score, away_score, source)
+        
+        # 4. Pareamento ótimo só nas linhas/colunas com algum par possível
+        rows = np.flatnonzero(feasible.any(axis=1))
+        cols = np.flatnonzero(feasible.any(axis=0))
+        if not rows.size:
+            return results
+        
+        assigned_rows, assigned_cols = linear_sum_assignment(weights[np.ix_(rows, cols)], maximize=True)
+        for a, b in zip(assigned_rows, assigned_cols):
+            i, j = rows[a], cols[b]
+            if feasible[i, j]:
+                home_score, away_score, source = scored[(i, j)]
+                results[i] = self._result(j, home_score, away_score, source, event_epochs[i])
+        
+        return results
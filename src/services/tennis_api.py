@@ -1,8 +1,10 @@
+import math
 import os
-import time
-import requests
 from datetime import datetime
 from typing import Any, Dict, List, Optional
+from src.cache.negative_cache import NegativeCache
+from src.utils.http_client import HttpClient
+from src.utils.quota_scheduler import Priority
 
 # Se você já tem esses módulos, beleza.
 # Se não tiver Redis rodando, o código continua funcionando sem cache.
@@ -68,22 +70,47 @@ class TennisAPI:
         except Exception:
             pass
 
-    def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None, cache_key: Optional[str] = None, cache_ttl: int = 120) -> Dict[str, Any]:
+    def _cache_set_negative(self, key: str, error: Optional[BaseException] = None) -> None:
+        if not self.cache:
+            return
+        try:
+            self.cache.set_negative(key, error=error)
+        except Exception:
+            pass
+
+    def _cache_get_many(self, keys: List[str]) -> Dict[str, Any]:
+        if not self.cache:
+            return {}
+        try:
+            return self.cache.get_many(keys)
+        except Exception:
+            return {}
+
+    def _cache_set_many(self, mapping: Dict[str, Any], ttl_seconds: int) -> None:
+        if not self.cache:
+            return
+        try:
+            self.cache.set_many(mapping, ttl_seconds)
+        except Exception:
+            pass
+
+    def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None, cache_key: Optional[str] = None,
+                  cache_ttl: int = 120, priority: int = Priority.NORMAL) -> Dict[str, Any]:
         if cache_key:
             cached = self._cache_get(cache_key)
             if cached is not None:
-                return cached
+                # Entrada negativa (sem dados ou erro recente): não gasta a cota de novo
+                return NegativeCache.unwrap(cached, {})
 
         url = f"{self.base_url}{path}"
 
-        # retry simples pra 429
-        for attempt in range(3):
-            resp = requests.get(url, headers=self.headers, params=params or {}, timeout=self.default_timeout)
-
-            if resp.status_code == 429:
-                wait = int(resp.headers.get("Retry-After", "0") or 0) or (2 ** attempt)
-                time.sleep(wait)
-                continue
+        try:
+            # Cota mensal controlada pelo QuotaScheduler: sem retry/sleep aqui.
+            # 429 ou cota reservada -> QuotaExceededError
+            resp = HttpClient.get(
+                url, headers=self.headers, params=params or {}, timeout=self.default_timeout,
+                provider="rapidapi_tennis", priority=priority
+            )
 
             # Se 404, devolve texto pra você ajustar o path
             if resp.status_code == 404:
@@ -96,18 +123,22 @@ class TennisAPI:
             resp.raise_for_status()
 
             data = resp.json() if resp.text else {}
-
-            # Alguns endpoints retornam 200 com "internal_error"
-            if isinstance(data, dict) and "internal_error" in data:
-                # não é erro de rede/auth, só sem jogos/sem dados naquele momento
-                return data
-
+        except Exception as e:
             if cache_key:
-                self._cache_set(cache_key, data, cache_ttl)
+                self._cache_set_negative(cache_key, error=e)
+            raise
 
+        # Alguns endpoints retornam 200 com "internal_error"
+        if isinstance(data, dict) and "internal_error" in data:
+            # não é erro de rede/auth, só sem jogos/sem dados naquele momento
+            if cache_key:
+                self._cache_set_negative(cache_key)
             return data
 
-        raise RuntimeError("Falhou após retries (provável 429 contínuo)")
+        if cache_key:
+            self._cache_set(cache_key, data, cache_ttl)
+
+        return data
 
     # -------------------------
     # Métodos públicos
@@ -118,7 +149,7 @@ class TennisAPI:
         Retorno costuma vir como {"matches": [...]}
         """
         cache_key = f"tennis:live_scores:{datetime.now().strftime('%Y-%m-%d-%H-%M')}"
-        data = self._get_json(self.EP_LIVE_SCORES, cache_key=cache_key, cache_ttl=60)
+        data = self._get_json(self.EP_LIVE_SCORES, cache_key=cache_key, cache_ttl=60, priority=Priority.LOW)
 
         if isinstance(data, dict) and "internal_error" in data:
             return []
@@ -143,6 +174,8 @@ class TennisAPI:
         data = self._get_json(path, cache_key=cache_key, cache_ttl=300)
         return data.get("matches", []) if isinstance(data, dict) else []
 
+    RANKINGS_TTL = 6 * 3600
+
     def get_atp_rankings(self, limit: int = 50) -> List[Dict[str, Any]]:
         """
         ATP rankings (singles/current).
@@ -152,10 +185,22 @@ class TennisAPI:
         - Name, Points, Rank, id, Next best
         """
         cache_key = "tennis:atp:rankings"
-        data = self._get_json(self.EP_ATP_RANKINGS, cache_key=cache_key, cache_ttl=6 * 3600)
+        data = self._get_json(self.EP_ATP_RANKINGS, cache_key=cache_key, cache_ttl=self.RANKINGS_TTL)
+        return self._normalize_atp_rankings(data)[:limit]
 
+    def get_wta_rankings(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        WTA rankings (singles/current).
+        Path real (confirmado): /rankings/wta/singles/50/current
+        """
+        cache_key = "tennis:wta:rankings"
+        data = self._get_json(self.EP_WTA_RANKINGS, cache_key=cache_key, cache_ttl=self.RANKINGS_TTL)
+        return self._normalize_wta_rankings(data)[:limit]
+
+    @staticmethod
+    def _normalize_atp_rankings(data: Any) -> List[Dict[str, Any]]:
         items = data.get("data", []) if isinstance(data, dict) else []
-        normalized = [{
+        return [{
             "player_id": it.get("id"),                 # ex: "s0ag"
             "player_name": it.get("Name"),             # ex: "J. Sinner"
             "rank": it.get("Rank"),                    # pode vir "-" nesse endpoint
@@ -167,18 +212,10 @@ class TennisAPI:
             "next_best": it.get("Next best"),
         } for it in items]
 
-        return normalized[:limit]
-
-    def get_wta_rankings(self, limit: int = 50) -> List[Dict[str, Any]]:
-        """
-        WTA rankings (singles/current).
-        Path real (confirmado): /rankings/wta/singles/50/current
-        """
-        cache_key = "tennis:wta:rankings"
-        data = self._get_json(self.EP_WTA_RANKINGS, cache_key=cache_key, cache_ttl=6 * 3600)
-
+    @staticmethod
+    def _normalize_wta_rankings(data: Any) -> List[Dict[str, Any]]:
         items = data.get("data", []) if isinstance(data, dict) else []
-        normalized = [{
+        return [{
             "player_id": it.get("ID"),
             "player_name": it.get("name"),
             "rank": it.get("ranking"),
@@ -189,4 +226,82 @@ class TennisAPI:
             "tournaments_played": it.get("tournamentsPlayed"),
         } for it in items]
 
-        return normalized[:limit]
+    # -------------------------
+    # Ranking por jogador (lookup em lote)
+    # -------------------------
+    @staticmethod
+    def _player_key(tour: str, player_name: str) -> str:
+        """
+        Chave de cache do jogador no ranking: inicial + sobrenome
+        ("J. Sinner" e "Jannik Sinner" -> tennis:atp:player:j_sinner)
+        """
+        tokens = player_name.lower().replace(".", " ").replace("-", " ").split()
+        if not tokens:
+            name = "unknown"
+        elif len(tokens) == 1:
+            name = tokens[0]
+        else:
+            name = f"{tokens[0][0]}_{tokens[-1]}"
+        return f"tennis:{tour.lower()}:player:{name}"
+
+    def _index_rankings(self, tour: str) -> Dict[str, Dict[str, Any]]:
+        """Baixa o ranking do circuito e grava uma entrada por jogador (um pipeline)"""
+        tour = tour.upper()
+        if tour == "WTA":
+            rankings = self.get_wta_rankings(limit=10_000)
+        else:
+            rankings = self.get_atp_rankings(limit=10_000)
+
+        index = {
+            self._player_key(tour, row["player_name"]): row
+            for row in rankings if row.get("player_name")
+        }
+        self._cache_set_many(index, self.RANKINGS_TTL)
+        return index
+
+    def get_players_from_ranking(self, player_names: List[str], tour: str = "ATP") -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Linha do ranking de vários jogadores de uma vez
+        1 ida ao cache para todos; ranking só é baixado se faltar alguém
+        Returns:
+            {player_name: linha do ranking ou None}
+        """
+        keys = {name: self._player_key(tour, name) for name in dict.fromkeys(player_names)}
+        found = self._cache_get_many(list(keys.values()))
+
+        if any(key not in found for key in keys.values()):
+            try:
+                found.update(self._index_rankings(tour))
+            except Exception as e:
+                print(f"⚠️ Erro ao buscar ranking {tour}: {e}")
+
+        return {name: found.get(key) for name, key in keys.items()}
+
+    @staticmethod
+    def _stats_from_ranking(row: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Stats aproximadas a partir da posição no ranking
+        Taxa de vitória estimada: 80% no nº 1, caindo com log10 da posição (mín. 40%)
+        """
+        try:
+            rank = int(row["rank"]) if row else None
+        except (TypeError, ValueError):
+            rank = None
+
+        if not rank or rank < 1:
+            return {"rank": None, "points": row.get("points") if row else None, "estimated_win_rate": 50.0}
+
+        return {
+            "rank": rank,
+            "points": row.get("points"),
+            "estimated_win_rate": round(max(40.0, 80.0 - 12.0 * math.log10(rank)), 1),
+        }
+
+    def get_players_stats_from_ranking(self, player_names: List[str], tour: str = "ATP") -> Dict[str, Dict[str, Any]]:
+        """Stats (rank + taxa de vitória estimada) de vários jogadores"""
+        rows = self.get_players_from_ranking(player_names, tour)
+        return {name: self._stats_from_ranking(row) for name, row in rows.items()}
+
+    def get_player_stats_from_ranking(self, player_name: str, tour: str = "ATP") -> Dict[str, Any]:
+        """Stats de um jogador (prefira get_players_stats_from_ranking para vários)"""
+        return self.get_players_stats_from_ranking([player_name], tour)[player_name]
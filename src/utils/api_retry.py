@@ -1,9 +1,19 @@
 import time
 from typing import Callable, Any
 from functools import wraps
+from src.utils.quota_scheduler import QuotaExceededError
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Erro de rate limit (429) que o retry_on_rate_limit tenta de novo com backoff"""
+    error_str = str(error)
+    return '429' in error_str or 'rate limit' in error_str.lower()
 
 def retry_on_rate_limit(max_retries: int = 3, base_delay: int = 2):
-    """Decorator para retry automático em caso de rate limit"""
+    """
+    Decorator para retry automático em caso de rate limit
+    Provedores com cota controlada pelo QuotaScheduler levantam
+    QuotaExceededError, que é propagado sem backoff.
+    """
     
     def decorator(func: Callable) -> Callable:
         @wraps(func)
@@ -14,11 +24,13 @@ def retry_on_rate_limit(max_retries: int = 3, base_delay: int = 2):
                 try:
                     return func(*args, **kwargs)
                 
+                except QuotaExceededError:
+                    # Scheduler já decidiu: não dorme em backoff, propaga
+                    raise
+                
                 except Exception as e:
-                    error_str = str(e)
-                    
                     # Detecta rate limit (429)
-                    if '429' in error_str or 'rate limit' in error_str.lower():
+                    if is_rate_limit_error(e):
                         retries += 1
                         
                         if retries >= max_retries:
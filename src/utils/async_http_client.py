@@ -0,0 +1,83 @@
+import asyncio
+import time
+import httpx
+from typing import Any, Dict, Optional
+from config.config import Config
+from src.utils.http_client import HttpClient
+from src.utils.quota_scheduler import QuotaScheduler, Priority
+
+
+class AsyncHttpClient:
+    """
+    Versão asyncio do HttpClient (httpx.AsyncClient)
+
+    - Um AsyncClient (keep-alive) por event loop, compartilhado por todos os hosts
+    - Mesmos timeouts padrão e mesma passagem pelo QuotaScheduler
+    - Contabiliza nos mesmos contadores por host do HttpClient (/metrics)
+    """
+
+    _clients: Dict[int, httpx.AsyncClient] = {}
+
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        """Retorna (criando se necessário) o client do event loop atual"""
+        loop_id = id(asyncio.get_running_loop())
+        client = cls._clients.get(loop_id)
+        if client and not client.is_closed:
+            return client
+
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(Config.HTTP_READ_TIMEOUT, connect=Config.HTTP_CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=Config.HTTP_ASYNC_MAX_CONNECTIONS,
+                max_keepalive_connections=Config.HTTP_POOL_MAXSIZE,
+            ),
+        )
+        cls._clients[loop_id] = client
+        return client
+
+    @classmethod
+    async def get(cls, url: str, params: Optional[Dict[str, Any]] = None,
+                  headers: Optional[Dict[str, str]] = None, timeout: Any = None,
+                  provider: Optional[str] = None, cost: float = 1,
+                  priority: int = Priority.NORMAL, **kwargs) -> httpx.Response:
+        """
+        GET assíncrono (mesma assinatura de HttpClient.get)
+        timeout: segundos ou (connect, read). Padrão vem do Config.
+        provider: se informado, a chamada passa pelo QuotaScheduler
+        """
+        if provider:
+            await QuotaScheduler.acquire_async(provider, cost=cost, priority=priority)
+
+        host = HttpClient._host_of(url)
+        client = cls._get_client()
+
+        if isinstance(timeout, tuple):
+            kwargs['timeout'] = httpx.Timeout(timeout[1], connect=timeout[0])
+        elif timeout is not None:
+            kwargs['timeout'] = httpx.Timeout(timeout, connect=min(Config.HTTP_CONNECT_TIMEOUT, timeout))
+
+        started = time.perf_counter()
+        try:
+            response = await client.get(url, params=params, headers=headers, **kwargs)
+        except httpx.HTTPError:
+            HttpClient._record(host, started, None, 0)
+            raise
+
+        HttpClient._record(host, started, response.status_code, len(response.content or b""))
+
+        if provider:
+            HttpClient._update_quota(provider, response.status_code, response.headers)
+
+        return response
+
+    @classmethod
+    async def close_all(cls):
+        """Fecha os clients (ex.: no shutdown do servidor)"""
+        clients = list(cls._clients.values())
+        cls._clients.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception:
+                pass
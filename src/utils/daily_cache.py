@@ -1,91 +1,390 @@
+import asyncio
+import mmap
 import os
-import json
+import struct
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, date
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+from config.config import Config
+from src.cache.codec import CacheCodec
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Windows: sem lock entre processos
 
 
 class DailyCache:
-    """Cache que persiste por dia inteiro - busca APIs apenas 1x por dia"""
-    
+    """
+    Snapshots da análise do dia - vários por dia, com horário
+
+    Cada snapshot guarda só o que não depende da banca (jogo, mercado, odd,
+    probabilidade e EV). Stake, validação e limites de risco são aplicados
+    na leitura, então qualquer banca/fase reaproveita o mesmo snapshot.
+    Um refresh durante o dia adiciona um snapshot novo sem apagar os anteriores.
+
+    Arquivo único e autodescritivo (escrito em arquivo temporário + os.replace):
+        cabeçalho  magic b"VBDC", versão, data (YYYY-MM-DD), nº de snapshots
+        índice     por snapshot: timestamp (epoch), offset, tamanho
+        payloads   um envelope do CacheCodec por snapshot
+    Leitura via mmap decodifica só o snapshot pedido; o resultado fica em memória
+    até o arquivo mudar (inode/mtime/tamanho).
+    """
+
     CACHE_DIR = "cache/daily"
-    DATE_FILE = "cache/daily/last_fetch_date.txt"
-    DATA_FILE = "cache/daily/opportunities_data.json"
-    
+    DATA_FILE = "cache/daily/snapshots.bin"
+    LOCK_FILE = "cache/daily/.rebuild.lock"        # Uma análise por vez entre processos
+    WRITE_LOCK_FILE = "cache/daily/.write.lock"    # Uma gravação por vez (curto)
+    LOCK_POLL_INTERVAL = 0.2                       # Segundos entre tentativas de flock
+    REBUILD_WAITING_MESSAGE = "⏳ Outro processo está gerando o snapshot do dia - aguardando..."
+    # Formatos anteriores (removidos no clear_cache)
+    LEGACY_FILES = (
+        "cache/daily/last_fetch_date.txt",
+        "cache/daily/opportunities_data.json",
+        "cache/daily/opportunities_data.bin",
+    )
+
+    MAGIC = b"VBDC"
+    FORMAT_VERSION = 1
+    HEADER = struct.Struct(">4sB10sH")
+    INDEX_ENTRY = struct.Struct(">dQI")
+
+    # Última leitura: {'stat': (ino, mtime_ns, size), 'date', 'index', 'snapshots': {posição: dict}}
+    _memo: Optional[Dict[str, Any]] = None
+    _memo_lock = threading.Lock()
+
     @staticmethod
     def _ensure_cache_dir():
         """Garante que diretório de cache existe"""
         os.makedirs(DailyCache.CACHE_DIR, exist_ok=True)
-    
+
     @staticmethod
     def _get_today() -> str:
         """Retorna data de hoje como string (YYYY-MM-DD)"""
         return date.today().isoformat()
-    
+
+    # =========================
+    # 🔹 FORMATO EM DISCO
+    # =========================
+    @classmethod
+    def _pack(cls, day: str, entries: List[Tuple[float, bytes]]) -> bytes:
+        """entries: [(timestamp epoch, payload codificado)] do mais antigo ao mais recente"""
+        offset = cls.HEADER.size + cls.INDEX_ENTRY.size * len(entries)
+        parts = [cls.HEADER.pack(cls.MAGIC, cls.FORMAT_VERSION, day.encode(), len(entries))]
+
+        for timestamp, payload in entries:
+            parts.append(cls.INDEX_ENTRY.pack(timestamp, offset, len(payload)))
+            offset += len(payload)
+
+        parts.extend(payload for _, payload in entries)
+        return b"".join(parts)
+
+    @classmethod
+    def _parse_index(cls, buf) -> Tuple[str, List[Tuple[float, int, int]]]:
+        """Lê cabeçalho e índice (sem decodificar payloads)"""
+        if len(buf) < cls.HEADER.size:
+            raise ValueError("arquivo truncado")
+
+        magic, version, day, count = cls.HEADER.unpack_from(buf, 0)
+        if magic != cls.MAGIC or version != cls.FORMAT_VERSION:
+            raise ValueError(f"formato desconhecido ({magic!r} v{version})")
+
+        index = [
+            cls.INDEX_ENTRY.unpack_from(buf, cls.HEADER.size + i * cls.INDEX_ENTRY.size)
+            for i in range(count)
+        ]
+        if index and index[-1][1] + index[-1][2] > len(buf):
+            raise ValueError("arquivo truncado")
+
+        return day.decode(), index
+
+    @classmethod
+    def _read(cls, positions: Optional[List[int]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Data, índice e os snapshots pedidos (posições no índice; None = nenhum)
+        Reaproveita a leitura anterior se o arquivo não mudou
+        """
+        try:
+            st = os.stat(cls.DATA_FILE)
+        except FileNotFoundError:
+            return None
+        stat_key = (st.st_ino, st.st_mtime_ns, st.st_size)
+
+        with cls._memo_lock:
+            memo = cls._memo
+            if memo is None or memo['stat'] != stat_key:
+                memo = {'stat': stat_key, 'date': None, 'index': [], 'snapshots': {}}
+                cls._memo = memo
+            missing = [p for p in (positions or []) if p not in memo['snapshots']]
+            if memo['date'] is not None and not missing:
+                return memo
+
+        try:
+            with open(cls.DATA_FILE, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return None
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                    day, index = cls._parse_index(buf)
+                    decoded = {}
+                    for position in positions or []:
+                        _, offset, length = index[position]
+                        decoded[position] = CacheCodec.decode(buf[offset:offset + length])
+        except (OSError, ValueError, IndexError) as e:
+            print(f"⚠️ Cache diário ilegível ({e}) - será refeito")
+            return None
+
+        with cls._memo_lock:
+            if cls._memo is memo:
+                memo['date'] = day
+                memo['index'] = index
+                memo['snapshots'].update(decoded)
+
+        return {'stat': stat_key, 'date': day, 'index': index, 'snapshots': {**memo['snapshots'], **decoded}}
+
+    @classmethod
+    def _write_atomic(cls, data: bytes):
+        """Grava em arquivo temporário no mesmo diretório e troca com os.replace"""
+        fd, tmp_path = tempfile.mkstemp(dir=cls.CACHE_DIR, prefix=".snapshots-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_path, 0o644)  # mkstemp cria 0600; outros workers precisam ler
+            os.replace(tmp_path, cls.DATA_FILE)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    # =========================
+    # 🔹 LOCK DE RECONSTRUÇÃO (entre processos)
+    # =========================
+    @classmethod
+    def _open_lock(cls, path: str):
+        """Arquivo do lock aberto (None sem fcntl, ex.: Windows)"""
+        if fcntl is None:
+            return None
+        cls._ensure_cache_dir()
+        return open(path, 'a')
+
     @staticmethod
-    def was_fetched_today() -> bool:
-        """Verifica se já buscou dados hoje"""
-        DailyCache._ensure_cache_dir()
-        
-        if not os.path.exists(DailyCache.DATE_FILE):
-            return False
-        
+    def _try_lock(handle) -> Optional[bool]:
+        """Uma tentativa de flock sem bloquear: True pegou, False ocupado, None erro (handle fechado)"""
         try:
-            with open(DailyCache.DATE_FILE, 'r') as f:
-                last_date = f.read().strip()
-            
-            return last_date == DailyCache._get_today()
-        except:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
             return False
-    
+        except OSError as e:
+            print(f"⚠️ Lock do cache diário indisponível: {e}")
+            handle.close()
+            return None
+
     @staticmethod
-    def save_today_data(opportunities: list, matches_count: int, leagues_count: int):
-        """Salva dados buscados hoje"""
+    def _give_up(handle, path: str):
+        print(f"⚠️ Lock {os.path.basename(path)} ocupado demais - seguindo sem lock")
+        handle.close()
+
+    @classmethod
+    def _lock_file(cls, path: str, timeout: float, waiting_message: Optional[str] = None):
+        """flock exclusivo em path, esperando até timeout segundos (None se não conseguir)"""
+        handle = cls._open_lock(path)
+        if handle is None:
+            return None
+
+        deadline = time.monotonic() + timeout
+        waiting = False
+
+        while True:
+            acquired = cls._try_lock(handle)
+            if acquired:
+                return handle
+            if acquired is None:
+                return None
+            if time.monotonic() >= deadline:
+                cls._give_up(handle, path)
+                return None
+            if waiting_message and not waiting:
+                print(waiting_message)
+                waiting = True
+            time.sleep(cls.LOCK_POLL_INTERVAL)
+
+    @classmethod
+    def acquire_rebuild_lock(cls, timeout: Optional[float] = None):
+        """
+        Lock para só um processo refazer a análise por vez
+        Quem espera deve reler o snapshot depois (o outro processo pode ter acabado de gerar)
+        Sem lock em DAILY_CACHE_LOCK_TIMEOUT segundos: segue sem lock (retorna None)
+        """
+        return cls._lock_file(
+            cls.LOCK_FILE, Config.DAILY_CACHE_LOCK_TIMEOUT if timeout is None else timeout,
+            cls.REBUILD_WAITING_MESSAGE
+        )
+
+    @classmethod
+    async def acquire_rebuild_lock_async(cls, timeout: Optional[float] = None):
+        """
+        acquire_rebuild_lock para asyncio: tentativas com LOCK_NB entre asyncio.sleep
+        A espera não ocupa thread do executor padrão (que o processo que gera o snapshot usa)
+        """
+        handle = cls._open_lock(cls.LOCK_FILE)
+        if handle is None:
+            return None
+
+        deadline = time.monotonic() + (Config.DAILY_CACHE_LOCK_TIMEOUT if timeout is None else timeout)
+        waiting = False
+
+        while True:
+            acquired = cls._try_lock(handle)
+            if acquired:
+                return handle
+            if acquired is None:
+                return None
+            if time.monotonic() >= deadline:
+                cls._give_up(handle, cls.LOCK_FILE)
+                return None
+            if not waiting:
+                print(cls.REBUILD_WAITING_MESSAGE)
+                waiting = True
+            await asyncio.sleep(cls.LOCK_POLL_INTERVAL)
+
+    @staticmethod
+    def release_lock(handle):
+        if handle is None:
+            return
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        finally:
+            handle.close()
+
+    @classmethod
+    @contextmanager
+    def rebuild_lock(cls, timeout: Optional[float] = None):
+        handle = cls.acquire_rebuild_lock(timeout)
+        try:
+            yield handle
+        finally:
+            cls.release_lock(handle)
+
+    # =========================
+    # 🔹 API
+    # =========================
+    @staticmethod
+    def was_fetched_today() -> bool:
+        """Verifica se já buscou dados hoje (só lê o cabeçalho)"""
+        data = DailyCache._read()
+        return bool(data and data['date'] == DailyCache._get_today() and data['index'])
+
+    @staticmethod
+    def save_snapshot(candidates: list, tennis: list, matches_count: int, leagues_count: int,
+                      matched_count: Optional[int] = None, odds_hashes: Optional[Dict[str, str]] = None):
+        """
+        Adiciona um snapshot ao dia (mantém os DAILY_SNAPSHOTS_KEEP mais recentes)
+        odds_hashes: {match_id: hash das odds analisadas}, para a próxima análise reaproveitar
+        os candidatos dos jogos cujas odds não mudaram
+        """
         DailyCache._ensure_cache_dir()
-        
-        data = {
-            'date': DailyCache._get_today(),
-            'timestamp': datetime.now().isoformat(),
-            'opportunities': opportunities,
+        today = DailyCache._get_today()
+        now = datetime.now()
+
+        snapshot = {
+            'timestamp': now.isoformat(),
+            'candidates': candidates,
+            'tennis': tennis,
             'matches_count': matches_count,
-            'leagues_count': leagues_count
+            'leagues_count': leagues_count,
+            'matched_count': matched_count,
+            'odds_hashes': odds_hashes or {}
         }
-        
-        # Salva dados
-        with open(DailyCache.DATA_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
-        
-        # Marca data de hoje
-        with open(DailyCache.DATE_FILE, 'w') as f:
-            f.write(DailyCache._get_today())
-        
-        print(f"✅ Dados salvos no cache diário ({DailyCache._get_today()})")
-    
+
+        payload = CacheCodec.encode(snapshot)
+
+        # Lock de gravação: duas gravações simultâneas não perdem snapshots uma da outra
+        handle = DailyCache._lock_file(DailyCache.WRITE_LOCK_FILE, 10)
+        try:
+            entries = DailyCache._raw_entries(today)
+            entries.append((now.timestamp(), payload))
+            entries = entries[-max(1, Config.DAILY_SNAPSHOTS_KEEP):]
+            DailyCache._write_atomic(DailyCache._pack(today, entries))
+        finally:
+            DailyCache.release_lock(handle)
+
+        print(f"✅ Snapshot salvo no cache diário ({snapshot['timestamp'][:16]}, {len(entries)} hoje)")
+
     @staticmethod
-    def load_today_data() -> Optional[Dict[str, Any]]:
-        """Carrega dados de hoje se existirem"""
-        DailyCache._ensure_cache_dir()
-        
-        if not DailyCache.was_fetched_today():
-            return None
-        
+    def _raw_entries(today: str) -> List[Tuple[float, bytes]]:
+        """Snapshots de hoje já gravados, sem decodificar (para regravar junto com o novo)"""
         try:
-            with open(DailyCache.DATA_FILE, 'r') as f:
-                data = json.load(f)
-            
-            print(f"📦 Usando cache diário ({data['date']} às {data['timestamp'][:16]})")
-            return data
-        except:
+            with open(DailyCache.DATA_FILE, 'rb') as f:
+                raw = f.read()
+            day, index = DailyCache._parse_index(raw)
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Cache diário ilegível ({e}) - recomeçando o dia")
+            return []
+
+        if day != today:
+            return []
+        return [(timestamp, raw[offset:offset + length]) for timestamp, offset, length in index]
+
+    @staticmethod
+    def list_snapshots() -> List[Dict[str, Any]]:
+        """Snapshots de hoje, do mais antigo para o mais recente"""
+        data = DailyCache._read()
+        if not data or data['date'] != DailyCache._get_today():
+            return []
+
+        positions = list(range(len(data['index'])))
+        data = DailyCache._read(positions)
+        return [data['snapshots'][p] for p in positions] if data else []
+
+    @staticmethod
+    def load_latest_snapshot(max_age: Optional[float] = None, quiet: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Snapshot mais recente de hoje, se tiver no máximo max_age segundos
+        (padrão DAILY_SNAPSHOT_MAX_AGE; 0 = vale o dia inteiro)
+        Só o snapshot mais recente é decodificado
+        """
+        data = DailyCache._read()
+        if not data or data['date'] != DailyCache._get_today() or not data['index']:
             return None
-    
+
+        latest = len(data['index']) - 1
+        timestamp = data['index'][latest][0]
+        max_age = Config.DAILY_SNAPSHOT_MAX_AGE if max_age is None else max_age
+        age = time.time() - timestamp
+
+        if max_age and age > max_age:
+            if not quiet:
+                print(f"⏰ Snapshot de {datetime.fromtimestamp(timestamp):%H:%M} tem {age / 3600:.1f}h - nova análise")
+            return None
+
+        data = DailyCache._read([latest])
+        if not data:
+            return None
+
+        snapshot = data['snapshots'][latest]
+        if not quiet:
+            print(f"📦 Usando snapshot diário ({snapshot['timestamp'][:16]})")
+        return snapshot
+
     @staticmethod
     def clear_cache():
         """Limpa cache (forçar nova busca)"""
         DailyCache._ensure_cache_dir()
-        
-        if os.path.exists(DailyCache.DATE_FILE):
-            os.remove(DailyCache.DATE_FILE)
-        
-        if os.path.exists(DailyCache.DATA_FILE):
-            os.remove(DailyCache.DATA_FILE)
-        
-        print("🗑️  Cache diário limpo!")
\ No newline at end of file
+
+        for path in (DailyCache.DATA_FILE, *DailyCache.LEGACY_FILES):
+            if os.path.exists(path):
+                os.remove(path)
+
+        with DailyCache._memo_lock:
+            DailyCache._memo = None
+
+        print("🗑️  Cache diário limpo!")
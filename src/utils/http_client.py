@@ -0,0 +1,161 @@
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+from config.config import Config
+from src.utils.quota_scheduler import QuotaScheduler, QuotaExceededError, Priority
+
+
+class HttpClient:
+    """
+    Transporte HTTP compartilhado por todos os serviços de API
+
+    - Uma requests.Session (keep-alive) por host, reaproveitada entre chamadas
+    - Pool de conexões configurável (HTTP_POOL_MAXSIZE)
+    - Timeouts padrão de conexão/leitura (HTTP_CONNECT_TIMEOUT / HTTP_READ_TIMEOUT)
+    - Contabiliza requisições, bytes e latência por host
+    """
+
+    _sessions: Dict[str, requests.Session] = {}
+    _stats: Dict[str, Dict[str, Any]] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _host_of(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    @classmethod
+    def _get_session(cls, host: str) -> requests.Session:
+        """Retorna (criando se necessário) a sessão do host"""
+        session = cls._sessions.get(host)
+        if session:
+            return session
+
+        with cls._lock:
+            session = cls._sessions.get(host)
+            if session:
+                return session
+
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=Config.HTTP_POOL_MAXSIZE,
+                pool_block=False,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+
+            cls._sessions[host] = session
+            cls._ensure_stats(host)
+            return session
+
+    @classmethod
+    def _ensure_stats(cls, host: str):
+        """Cria os contadores do host (chamar com _lock)"""
+        cls._stats.setdefault(host, {
+            "requests": 0,
+            "errors": 0,
+            "bytes": 0,
+            "total_latency_ms": 0.0,
+            "max_latency_ms": 0.0,
+            "status": {},
+        })
+
+    @classmethod
+    def get(cls, url: str, params: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, str]] = None, timeout: Any = None,
+            provider: Optional[str] = None, cost: float = 1,
+            priority: int = Priority.NORMAL, **kwargs) -> requests.Response:
+        """
+        GET usando a sessão do host (mesma assinatura básica de requests.get)
+        timeout: segundos ou (connect, read). Padrão vem do Config.
+        provider: se informado, a chamada passa pelo QuotaScheduler
+                  (pode levantar QuotaExceededError antes de chamar a API)
+        """
+        if provider:
+            QuotaScheduler.acquire(provider, cost=cost, priority=priority)
+
+        host = cls._host_of(url)
+        session = cls._get_session(host)
+
+        if timeout is None:
+            timeout = (Config.HTTP_CONNECT_TIMEOUT, Config.HTTP_READ_TIMEOUT)
+        elif not isinstance(timeout, tuple):
+            timeout = (min(Config.HTTP_CONNECT_TIMEOUT, timeout), timeout)
+
+        started = time.perf_counter()
+        try:
+            response = session.get(url, params=params, headers=headers, timeout=timeout, **kwargs)
+        except requests.RequestException:
+            cls._record(host, started, None, 0)
+            raise
+
+        cls._record(host, started, response.status_code, len(response.content or b""))
+
+        if provider:
+            cls._update_quota(provider, response.status_code, response.headers)
+
+        return response
+
+    @staticmethod
+    def _update_quota(provider: str, status_code: int, headers):
+        """Repassa os headers de cota ao scheduler; 429 vira QuotaExceededError"""
+        QuotaScheduler.update_from_headers(provider, headers)
+
+        if status_code == 429:
+            retry_after = _retry_after_seconds(headers.get("Retry-After"))
+            QuotaScheduler.on_rate_limited(provider, retry_after)
+            raise QuotaExceededError(provider, "429 Too Many Requests", retry_after=retry_after)
+
+    @classmethod
+    def _record(cls, host: str, started: float, status: Optional[int], size: int):
+        """Atualiza contadores do host"""
+        latency_ms = (time.perf_counter() - started) * 1000
+
+        with cls._lock:
+            cls._ensure_stats(host)
+            stats = cls._stats[host]
+            stats["requests"] += 1
+            stats["bytes"] += size
+            stats["total_latency_ms"] += latency_ms
+            stats["max_latency_ms"] = max(stats["max_latency_ms"], latency_ms)
+
+            if status is None or status >= 400:
+                stats["errors"] += 1
+
+            status_key = str(status) if status is not None else "network_error"
+            stats["status"][status_key] = stats["status"].get(status_key, 0) + 1
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Dict[str, Any]]:
+        """Retorna contadores por host (com latência média)"""
+        with cls._lock:
+            result = {}
+            for host, stats in cls._stats.items():
+                requests_count = stats["requests"]
+                result[host] = {
+                    **stats,
+                    "status": dict(stats["status"]),
+                    "total_latency_ms": round(stats["total_latency_ms"], 1),
+                    "max_latency_ms": round(stats["max_latency_ms"], 1),
+                    "avg_latency_ms": round(stats["total_latency_ms"] / requests_count, 1) if requests_count else 0.0,
+                }
+            return result
+
+    @classmethod
+    def close_all(cls):
+        """Fecha todas as sessões (ex.: no shutdown do servidor)"""
+        with cls._lock:
+            for session in cls._sessions.values():
+                session.close()
+            cls._sessions.clear()
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
@@ -0,0 +1,260 @@
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+from config.config import Config
+
+
+class QuotaExceededError(Exception):
+    """Chamada recusada pelo scheduler para não estourar a cota do provedor"""
+
+    def __init__(self, provider: str, message: str, retry_after: Optional[float] = None):
+        super().__init__(f"[{provider}] {message}")
+        self.provider = provider
+        self.retry_after = retry_after
+
+
+class Priority:
+    """Prioridade da chamada (define quanto da cota ela pode consumir)"""
+    HIGH = 0      # Essencial para a análise (odds, fixtures do dia)
+    NORMAL = 1    # Enriquecimento (stats, forma)
+    LOW = 2       # Opcional (H2H, tênis ao vivo)
+
+
+class TokenBucket:
+    """Token bucket simples: `capacity` tokens, recarga contínua de `refill_rate` tokens/s"""
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate)
+        self.updated_at = now
+
+    def wait_time(self, cost: float) -> float:
+        """Segundos até haver `cost` tokens (0 se já houver)"""
+        self._refill()
+        if self.tokens >= cost:
+            return 0.0
+        if self.refill_rate <= 0:
+            return float('inf')
+        return (cost - self.tokens) / self.refill_rate
+
+    def consume(self, cost: float):
+        self._refill()
+        self.tokens -= cost
+
+
+class QuotaScheduler:
+    """
+    Scheduler central de cota por provedor (Odds API, API-Football, RapidAPI)
+
+    - Token bucket por provedor: distribui a cota ao longo do período
+      (ex.: 60 chamadas/mês não acabam na primeira tarde)
+    - Lê os headers de cota restante de cada resposta (fonte da verdade)
+    - Reserva cota para chamadas prioritárias: LOW/NORMAL são recusadas
+      antes da cota acabar
+    - Espera curta (QUOTA_MAX_WAIT) em vez de backoff longo; se a espera
+      for maior, recusa com QuotaExceededError
+    """
+
+    # Fração mínima da cota que precisa sobrar para cada prioridade
+    RESERVE = {
+        Priority.HIGH: 0.0,
+        Priority.NORMAL: 0.10,
+        Priority.LOW: 0.50,
+    }
+
+    # Headers de cota restante/limite por provedor
+    HEADERS = {
+        'odds_api': {'remaining': 'x-requests-remaining', 'used': 'x-requests-used'},
+        'api_football': {
+            'remaining': 'x-ratelimit-requests-remaining',
+            'limit': 'x-ratelimit-requests-limit',
+            'minute_remaining': 'X-RateLimit-Remaining',
+        },
+        'rapidapi_tennis': {
+            'remaining': 'x-ratelimit-requests-remaining',
+            'limit': 'x-ratelimit-requests-limit',
+        },
+    }
+
+    _providers: Dict[str, Dict[str, Any]] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def _get_provider(cls, provider: str) -> Dict[str, Any]:
+        state = cls._providers.get(provider)
+        if state:
+            return state
+
+        config = Config.PROVIDER_QUOTAS.get(provider, {})
+        quota = float(config.get('quota', 0))
+        period = float(config.get('period_seconds', 86400))
+        burst = float(config.get('burst_fraction', 1.0))
+
+        state = {
+            'quota': quota,
+            'period_seconds': period,
+            'bucket': TokenBucket(max(1.0, quota * burst), quota / period) if quota else None,
+            'remaining': None,          # Último valor informado pelo provedor
+            'limit': quota or None,
+            'blocked_until': 0.0,       # 429 / limite por minuto
+            'calls': 0,
+            'cost_spent': 0.0,
+            'shed': 0,
+        }
+        cls._providers[provider] = state
+        return state
+
+    @classmethod
+    def acquire(cls, provider: str, cost: float = 1, priority: int = Priority.NORMAL):
+        """
+        Reserva `cost` unidades da cota antes da chamada
+        Espera no máximo QUOTA_MAX_WAIT segundos; senão levanta QuotaExceededError
+        """
+        deadline = time.monotonic() + Config.QUOTA_MAX_WAIT
+
+        while True:
+            wait = cls._try_acquire(provider, cost, priority, deadline)
+            if wait == 0:
+                return
+            time.sleep(wait)
+
+    @classmethod
+    async def acquire_async(cls, provider: str, cost: float = 1, priority: int = Priority.NORMAL):
+        """Mesmo que acquire, mas espera com asyncio.sleep (não bloqueia o event loop)"""
+        deadline = time.monotonic() + Config.QUOTA_MAX_WAIT
+
+        while True:
+            wait = cls._try_acquire(provider, cost, priority, deadline)
+            if wait == 0:
+                return
+            await asyncio.sleep(wait)
+
+    @classmethod
+    def _try_acquire(cls, provider: str, cost: float, priority: int, deadline: float) -> float:
+        """
+        Consome a cota se puder chamar agora (retorna 0)
+        Senão retorna quanto dormir antes de tentar de novo, ou levanta
+        QuotaExceededError se a espera passar do deadline
+        """
+        with cls._lock:
+            state = cls._get_provider(provider)
+            wait = cls._check(provider, state, cost, priority)
+
+            if wait == 0:
+                if state['bucket'] and cost:
+                    state['bucket'].consume(cost)
+                if state['remaining'] is not None:
+                    state['remaining'] -= cost
+                state['calls'] += 1
+                state['cost_spent'] += cost
+                return 0.0
+
+            if time.monotonic() + wait > deadline:
+                state['shed'] += 1
+                if wait == float('inf'):
+                    reason = "cota restante reservada para chamadas de maior prioridade"
+                    retry_after = None
+                else:
+                    reason = f"próxima janela em {wait:.0f}s"
+                    retry_after = wait
+                raise QuotaExceededError(
+                    provider,
+                    f"chamada recusada (prioridade {priority}, custo {cost}): {reason}",
+                    retry_after=retry_after
+                )
+
+        return max(0.001, min(wait, deadline - time.monotonic()))
+
+    @classmethod
+    def _check(cls, provider: str, state: Dict[str, Any], cost: float, priority: int) -> float:
+        """Retorna 0 se pode chamar agora, ou segundos de espera (inf = recusar)"""
+        now = time.monotonic()
+        if state['blocked_until'] > now:
+            return state['blocked_until'] - now
+
+        # Cota informada pelo provedor (reserva proporcional à prioridade)
+        remaining = state['remaining']
+        limit = state['limit']
+        if remaining is not None:
+            reserve = cls.RESERVE.get(priority, 0.0) * (limit or 0)
+            if remaining - cost < reserve:
+                return float('inf')
+
+        # Ritmo: distribui a cota ao longo do período (HIGH não espera o ritmo)
+        bucket = state['bucket']
+        if bucket and cost and priority != Priority.HIGH:
+            return bucket.wait_time(cost)
+
+        return 0.0
+
+    @classmethod
+    def update_from_headers(cls, provider: str, headers: Mapping[str, str]):
+        """Atualiza estado com os headers de cota da resposta"""
+        names = cls.HEADERS.get(provider, {})
+
+        with cls._lock:
+            state = cls._get_provider(provider)
+
+            remaining = _to_float(headers.get(names.get('remaining', ''), None))
+            if remaining is not None:
+                state['remaining'] = remaining
+
+            limit = _to_float(headers.get(names.get('limit', ''), None))
+            used = _to_float(headers.get(names.get('used', ''), None))
+            if limit is not None:
+                state['limit'] = limit
+            elif used is not None and remaining is not None:
+                state['limit'] = used + remaining
+
+            minute_remaining = _to_float(headers.get(names.get('minute_remaining', ''), None))
+            if minute_remaining is not None and minute_remaining <= 0:
+                state['blocked_until'] = max(state['blocked_until'], time.monotonic() + 60)
+
+    @classmethod
+    def on_rate_limited(cls, provider: str, retry_after: Optional[float] = None):
+        """Registra 429: bloqueia o provedor até Retry-After (sem dormir aqui)"""
+        with cls._lock:
+            state = cls._get_provider(provider)
+            state['blocked_until'] = max(state['blocked_until'], time.monotonic() + (retry_after or 60))
+
+    @classmethod
+    def get_state(cls) -> Dict[str, Dict[str, Any]]:
+        """Estado atual do orçamento de cada provedor"""
+        with cls._lock:
+            for provider in Config.PROVIDER_QUOTAS:
+                cls._get_provider(provider)
+
+            now = time.monotonic()
+            result = {}
+            for provider, state in cls._providers.items():
+                bucket = state['bucket']
+                if bucket:
+                    bucket._refill()
+                result[provider] = {
+                    'quota': state['quota'],
+                    'period_seconds': state['period_seconds'],
+                    'remaining_reported': state['remaining'],
+                    'limit_reported': state['limit'],
+                    'paced_tokens': round(bucket.tokens, 2) if bucket else None,
+                    'blocked_for_seconds': round(max(0.0, state['blocked_until'] - now), 1),
+                    'calls': state['calls'],
+                    'cost_spent': state['cost_spent'],
+                    'shed': state['shed'],
+                }
+            return result
+
+
+def _to_float(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None